@@ -1,10 +1,24 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional, Union
 
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app.api.etag import etag_matches, make_etag, not_modified
+from src.app.cache.response_cache import (
+    CATS_LIST_TAG,
+    ResponseCache,
+    breed_cats_tag,
+    cat_tag,
+)
+from src.app.core.serialization import dumps
 from src.app.core.settings import settings
-from src.app.models.db_helper import get_db
+from src.app.models.db_helper import get_db, get_session_factory
 from src.app.schemas import schemas
-from src.app.service.cat import CatService, get_cat_service
+from src.app.service.cat import CatService, get_cat_service, get_response_cache
+from src.app.service.cat_changes import ChangeNotifier, get_change_notifier
+from src.app.service.cat_query import cat_row_to_dict, parse_fields, parse_ids
 
 router = APIRouter(
     prefix=settings.url.prefix,
@@ -13,43 +27,331 @@ router = APIRouter(
 
 @router.get("/cats")
 async def get_all_cats(
+    limit: int = Query(
+        default=settings.pagination.default_limit,
+        ge=1,
+        le=settings.pagination.max_limit,
+    ),
+    cursor: Optional[str] = None,
+    color: Optional[str] = None,
+    min_age: Optional[int] = Query(default=None, ge=0),
+    max_age: Optional[int] = Query(default=None, ge=0),
+    breed_id: Optional[list[int]] = Query(default=None),
+    sort: schemas.CatSortField = schemas.CatSortField.id,
+    order: schemas.SortOrder = schemas.SortOrder.asc,
+    fields: Optional[str] = Query(
+        default=None, description='Поля ответа через запятую (id всегда)',
+    ),
+    ids: Optional[str] = Query(
+        default=None,
+        description='id через запятую: выборка кошек по списку без пагинации',
+    ),
+    updated_since: Optional[datetime] = Query(
+        default=None,
+        description='Только кошки, измененные или удаленные с этого момента',
+    ),
     session: AsyncSession = Depends(get_db),
     cat_service: CatService = Depends(get_cat_service),
-) -> schemas.CatListResponseModel:
-    """Получение списка всех котят."""
-    cats = await cat_service.get_all_cats(session=session)
-    return schemas.CatListResponseModel(cats=cats)
+    response_cache: ResponseCache = Depends(get_response_cache),
+) -> Union[
+    schemas.CatListResponseModel,
+    schemas.CatBatchResponseModel,
+    schemas.CatSyncResponseModel,
+]:
+    """Получение страницы списка котят с фильтрами, сортировкой и проекцией.
+
+    С параметром ids возвращает кошек с этими id в порядке запроса
+    (schemas.CatBatchResponseModel); фильтры и пагинация не применяются.
+    С updated_since - изменения для синхронизации с tombstones удаленных
+    (schemas.CatSyncResponseModel); фильтры и сортировка не применяются.
+    """
+    if ids is not None:
+        return await cats_by_ids(
+            parse_ids(ids, max_ids=settings.pagination.max_limit),
+            parse_fields(fields),
+            session=session,
+            cat_service=cat_service,
+            response_cache=response_cache,
+        )
+    if updated_since is not None:
+        return await cats_updated_since(
+            updated_since,
+            limit=limit,
+            cursor=cursor,
+            fields=parse_fields(fields),
+            session=session,
+            cat_service=cat_service,
+        )
+    query = schemas.CatListQuery(
+        color=color,
+        min_age=min_age,
+        max_age=max_age,
+        breed_ids=breed_id,
+        sort=sort,
+        order=order,
+        fields=parse_fields(fields),
+    )
+    cache_key = response_cache.make_key(
+        'cats',
+        limit=limit,
+        cursor=cursor,
+        color=color,
+        min_age=min_age,
+        max_age=max_age,
+        breed_id=','.join(map(str, sorted(breed_id))) if breed_id else None,
+        sort=sort.value,
+        order=order.value,
+        fields=','.join(field.value for field in query.fields),
+    )
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    cats, next_cursor = await cat_service.get_all_cats(
+        session=session, limit=limit, cursor=cursor, query=query,
+    )
+    return await response_cache.store(
+        cache_key,
+        {
+            'cats': [cat_row_to_dict(cat, query.fields) for cat in cats],
+            'next_cursor': next_cursor,
+        },
+        tags=[CATS_LIST_TAG, *(cat_tag(cat.id) for cat in cats)],
+    )
+
+
+async def cats_by_ids(
+    cat_ids: list[int],
+    fields: tuple[schemas.CatField, ...],
+    session: AsyncSession,
+    cat_service: CatService,
+    response_cache: ResponseCache,
+) -> Response:
+    """Ответ выборки кошек по списку id (через кэш ответов)."""
+    cache_key = response_cache.make_key(
+        'cats_by_ids',
+        ids=','.join(map(str, cat_ids)),
+        fields=','.join(field.value for field in fields),
+    )
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    cats, missing = await cat_service.get_cats_by_ids(
+        session=session, cat_ids=cat_ids, fields=fields,
+    )
+    # cats:list сбрасывается при создании: отсутствующий id может появиться.
+    return await response_cache.store(
+        cache_key,
+        {'cats': [cat_row_to_dict(cat, fields) for cat in cats], 'missing': missing},
+        tags=[CATS_LIST_TAG, *(cat_tag(cat.id) for cat in cats)],
+    )
+
+
+async def cats_updated_since(
+    updated_since: datetime,
+    limit: int,
+    cursor: Optional[str],
+    fields: tuple[schemas.CatField, ...],
+    session: AsyncSession,
+    cat_service: CatService,
+) -> Response:
+    """Ответ синхронизации: измененные кошки и tombstones (без кэша)."""
+    cats, next_cursor, updated_until = await cat_service.get_cats_updated_since(
+        session=session,
+        updated_since=updated_since,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+    )
+    return Response(
+        content=dumps({
+            'cats': [
+                cat_row_to_dict(cat, fields)
+                for cat in cats
+                if cat.deleted_at is None
+            ],
+            'deleted': [
+                {'id': cat.id, 'deleted_at': cat.deleted_at.isoformat()}
+                for cat in cats
+                if cat.deleted_at is not None
+            ],
+            'next_cursor': next_cursor,
+            'updated_until': updated_until.isoformat(),
+        }),
+        media_type='application/json',
+    )
 
 
 @router.get("/cats/breeds")
 async def all_breeds(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
     session: AsyncSession = Depends(get_db),
     cat_service: CatService = Depends(get_cat_service),
 ) -> schemas.BreedListResponseModel:
     """Получение списка пород."""
+    etag = make_etag(
+        'breeds', await cat_service.breed_cache.get_fingerprint(session),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     breeds = await cat_service.get_all_breeds(session=session)
+    response.headers['ETag'] = etag
     return schemas.BreedListResponseModel(breeds=breeds)
 
 
 @router.get("/cats/breeds/{breed}")
 async def cats_with_breed(
     breed: str,
+    limit: int = Query(
+        default=settings.pagination.default_limit,
+        ge=1,
+        le=settings.pagination.max_limit,
+    ),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_db),
+    cat_service: CatService = Depends(get_cat_service),
+    response_cache: ResponseCache = Depends(get_response_cache),
+) -> schemas.CatListResponseModel:
+    """Получение страницы списка кошачих опред. породы."""
+    cache_key = response_cache.make_key(
+        'cats_with_breed', breed=breed, limit=limit, cursor=cursor,
+    )
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    cats, next_cursor = await cat_service.get_cats_with_breed(
+        session=session, breed=breed, limit=limit, cursor=cursor,
+    )
+    return await response_cache.store(
+        cache_key,
+        {'cats': [cat_row_to_dict(cat) for cat in cats], 'next_cursor': next_cursor},
+        tags=[
+            breed_cats_tag(cats[0].breed_id),
+            *(cat_tag(cat.id) for cat in cats),
+        ],
+    )
+
+
+@router.get("/cats/search")
+async def search_cats(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(
+        default=settings.pagination.default_limit,
+        ge=1,
+        le=settings.pagination.max_limit,
+    ),
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_db),
     cat_service: CatService = Depends(get_cat_service),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> schemas.CatListResponseModel:
-    """Получение списка кошачих опред. породы."""
-    cats = await cat_service.get_cats_with_breed(session=session, breed=breed)
-    return schemas.CatListResponseModel(cats=cats)
+    """Полнотекстовый поиск котят по описанию, по убыванию релевантности."""
+    cache_key = response_cache.make_key(
+        'cats_search', q=q, limit=limit, cursor=cursor,
+    )
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    cats, next_cursor = await cat_service.search_cats(
+        session=session, search_query=q, limit=limit, cursor=cursor,
+    )
+    return await response_cache.store(
+        cache_key,
+        {'cats': [cat_row_to_dict(cat) for cat in cats], 'next_cursor': next_cursor},
+        tags=[CATS_LIST_TAG, *(cat_tag(cat.id) for cat in cats)],
+    )
+
+
+@router.get("/cats/stats")
+async def cat_stats(
+    session: AsyncSession = Depends(get_db),
+    cat_service: CatService = Depends(get_cat_service),
+) -> schemas.CatStatsResponseModel:
+    """Сводка по породам: количество, средний возраст и окрасы."""
+    breeds = await cat_service.get_cat_stats(session=session)
+    return Response(content=dumps({'breeds': breeds}), media_type='application/json')
+
+
+@router.get("/cats/export")
+async def export_cats(
+    export_format: schemas.ExportFormat = Query(
+        default=schemas.ExportFormat.ndjson, alias='format',
+    ),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    cat_service: CatService = Depends(get_cat_service),
+) -> StreamingResponse:
+    """Потоковая выгрузка всего каталога котят."""
+    media_type = {
+        schemas.ExportFormat.ndjson: 'application/x-ndjson',
+        schemas.ExportFormat.json: 'application/json',
+    }[export_format]
+    return StreamingResponse(
+        cat_service.export_cats(
+            session_factory=session_factory,
+            export_format=export_format,
+            batch_size=settings.export.batch_size,
+        ),
+        media_type=media_type,
+    )
+
+
+@router.get("/cats/changes")
+async def cat_changes(
+    after: Optional[int] = Query(default=None, ge=0),
+    last_event_id: Optional[int] = Header(default=None),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    cat_service: CatService = Depends(get_cat_service),
+    notifier: ChangeNotifier = Depends(get_change_notifier),
+) -> StreamingResponse:
+    """Лента изменений кошек (SSE) с продолжением после after/Last-Event-ID.
+
+    Без after отдаются только новые события, after=0 - весь журнал.
+    """
+    position = await cat_service.change_position(
+        session_factory, last_event_id if last_event_id is not None else after,
+    )
+    return StreamingResponse(
+        cat_service.stream_changes(
+            session_factory=session_factory,
+            notifier=notifier,
+            position=position,
+            batch_size=settings.changes.batch_size,
+            heartbeat=settings.changes.heartbeat_seconds,
+        ),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
 
 
 @router.get("/cats/{cat_id}")
 async def cat_info(
     cat_id: int,
+    if_none_match: Optional[str] = Header(default=None),
     session: AsyncSession = Depends(get_db),
     cat_service: CatService = Depends(get_cat_service),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> schemas.CatBase:
     """Получение подробной информации о котенке."""
-    return await cat_service.get_cats_with_id(session=session, cat_id=cat_id)
+    etag = make_etag(
+        cat_id, *await cat_service.get_cat_version(session=session, cat_id=cat_id),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    cache_key = response_cache.make_key('cat_info', cat_id=cat_id, etag=etag)
+    response = await response_cache.get(cache_key)
+    if response is None:
+        cat = await cat_service.get_cats_with_id(session=session, cat_id=cat_id)
+        response = await response_cache.store(
+            cache_key, cat_row_to_dict(cat), tags=[cat_tag(cat.id)],
+        )
+    response.headers['ETag'] = etag
+    return response
 
 
 @router.post("/cats", status_code=status.HTTP_201_CREATED)
@@ -62,6 +364,55 @@ async def add_cat(
     return await cat_service.create_cat(session=session, cat_data=cat_data)
 
 
+@router.post("/cats/import", status_code=status.HTTP_201_CREATED)
+async def import_cats(
+    request: Request,
+    import_format: schemas.ImportFormat = Query(
+        default=schemas.ImportFormat.ndjson, alias='format',
+    ),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    cat_service: CatService = Depends(get_cat_service),
+) -> schemas.CatImportResponse:
+    """Потоковый импорт котят из CSV или NDJSON в теле запроса через COPY."""
+    return await cat_service.import_cats(
+        session_factory=session_factory,
+        chunks=request.stream(),
+        import_format=import_format,
+        batch_size=settings.bulk.import_batch_size,
+        max_errors=settings.bulk.import_max_errors,
+    )
+
+
+@router.post("/cats/bulk", status_code=status.HTTP_201_CREATED)
+async def bulk_add_cats(
+    cats_data: schemas.BulkCreateCatData,
+    session: AsyncSession = Depends(get_db),
+    cat_service: CatService = Depends(get_cat_service),
+) -> schemas.BulkCatResponse:
+    """Пакетное добавление котят."""
+    return await cat_service.bulk_create_cats(session=session, cats=cats_data.cats)
+
+
+@router.patch("/cats/bulk")
+async def bulk_patch_cats(
+    cats_data: schemas.BulkUpdateCatData,
+    session: AsyncSession = Depends(get_db),
+    cat_service: CatService = Depends(get_cat_service),
+) -> schemas.BulkCatResponse:
+    """Пакетное изменение информации о котятах."""
+    return await cat_service.bulk_update_cats(session=session, cats=cats_data.cats)
+
+
+@router.delete("/cats/bulk")
+async def bulk_delete_cats(
+    cats_data: schemas.BulkDeleteCatData,
+    session: AsyncSession = Depends(get_db),
+    cat_service: CatService = Depends(get_cat_service),
+) -> schemas.BulkCatResponse:
+    """Пакетное удаление информации о котятах."""
+    return await cat_service.bulk_delete_cats(session=session, cat_ids=cats_data.ids)
+
+
 @router.patch("/cats/{cat_id}")
 async def patch_cat(
     cat_id: int,
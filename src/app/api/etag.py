@@ -0,0 +1,35 @@
+from typing import Optional
+
+from fastapi import Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Сильный ETag из версий строк, от которых зависит тело ответа."""
+    return '"{0}"'.format('-'.join(str(part) for part in parts))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Совпадает ли ETag с заголовком If-None-Match (слабое сравнение).
+
+    Args:
+        if_none_match (Optional[str]): значение заголовка If-None-Match
+        etag (str): текущий ETag ресурса
+
+    Returns:
+        bool: True, если клиент уже держит актуальное тело
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        candidate.strip().removeprefix('W/') == etag
+        for candidate in if_none_match.split(',')
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Ответ 304 Not Modified без тела."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag},
+    )
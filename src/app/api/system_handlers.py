@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Response, status
+from fastapi.responses import PlainTextResponse
+
+from src.app.core.lifecycle import lifecycle
+from src.app.core.metrics import registry
+from src.app.core.settings import settings
+from src.app.models.db_helper import engine, pool_stats, read_engine
+from src.app.schemas import schemas
+
+router = APIRouter(
+    prefix=settings.url.prefix,
+)
+metrics_router = APIRouter()
+probes_router = APIRouter()
+
+
+@router.get("/pool/stats")
+async def get_pool_stats() -> schemas.PoolStatsResponseModel:
+    """Состояние пула соединений с БД."""
+    return schemas.PoolStatsResponseModel(
+        primary=schemas.PoolStats(**pool_stats(engine)),
+        replica=(
+            schemas.PoolStats(**pool_stats(read_engine))
+            if read_engine is not None else None
+        ),
+    )
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> str:
+    """Метрики в текстовом формате Prometheus."""
+    return registry.render()
+
+
+@probes_router.get("/ready")
+async def get_readiness(response: Response) -> schemas.ReadinessModel:
+    """Готовность принимать трафик: 503 до прогрева и во время остановки."""
+    if not lifecycle.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return schemas.ReadinessModel(ready=lifecycle.ready)
@@ -0,0 +1,160 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol, Set, Union
+
+
+class CacheBackend(Protocol):
+    """Хранилище кэша ответов.
+
+    Интерфейс повторяет подмножество команд redis.asyncio.Redis, поэтому
+    клиент Redis (или совместимый с ним фейк) подходит без адаптера.
+    """
+
+    async def get(self, name: str) -> Optional[bytes]:  # noqa: D102
+        ...  # noqa: WPS428
+
+    async def set(  # noqa: D102, WPS125
+        self, name: str, value: bytes, ex: Optional[int] = None,
+    ) -> object:
+        ...  # noqa: WPS428
+
+    async def delete(self, *names: str) -> int:  # noqa: D102
+        ...  # noqa: WPS428
+
+    async def sadd(self, name: str, *values: str) -> int:  # noqa: D102
+        ...  # noqa: WPS428
+
+    async def smembers(self, name: str) -> Set[Union[str, bytes]]:  # noqa: D102
+        ...  # noqa: WPS428
+
+    async def expire(self, name: str, seconds: int) -> bool:  # noqa: D102
+        ...  # noqa: WPS428
+
+
+class InMemoryLRUBackend:
+    """In-process хранилище с вытеснением давно неиспользуемых записей.
+
+    Множества (теги) не вытесняются по LRU: при удалении записи она
+    убирается из всех множеств, где состоит, поэтому их размер ограничен
+    количеством живых записей.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._values: OrderedDict[str, tuple[bytes, Optional[float]]] = OrderedDict()  # noqa: E501
+        self._sets: dict[str, set[str]] = {}
+        self._member_of: dict[str, set[str]] = {}
+
+    async def get(self, name: str) -> Optional[bytes]:
+        """Значение по ключу (None, если нет или истекло)."""
+        entry = self._values.get(name)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._drop_value(name)
+            return None
+        self._values.move_to_end(name)
+        return value
+
+    async def set(  # noqa: WPS125
+        self, name: str, value: bytes, ex: Optional[int] = None,
+    ) -> bool:
+        """Запись значения с необязательным TTL в секундах."""
+        expires_at = None if ex is None else time.monotonic() + ex
+        self._values[name] = (value, expires_at)
+        self._values.move_to_end(name)
+        while len(self._values) > self.max_entries:
+            oldest = next(iter(self._values))
+            self._drop_value(oldest)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        """Удаление значений и множеств, возвращает число удаленных."""
+        deleted = 0
+        for name in names:
+            if name in self._values:
+                self._drop_value(name)
+                deleted += 1
+            members = self._sets.pop(name, None)
+            if members is not None:
+                for member in members:
+                    self._member_of.get(member, set()).discard(name)
+                deleted += 1
+        return deleted
+
+    async def sadd(self, name: str, *values: str) -> int:
+        """Добавление элементов в множество."""
+        members = self._sets.setdefault(name, set())
+        added = 0
+        for member in values:
+            if member not in members:
+                members.add(member)
+                self._member_of.setdefault(member, set()).add(name)
+                added += 1
+        return added
+
+    async def smembers(self, name: str) -> Set[Union[str, bytes]]:
+        """Элементы множества."""
+        return set(self._sets.get(name, ()))
+
+    async def expire(self, name: str, seconds: int) -> bool:
+        """TTL для значения; множества живут, пока в них есть записи."""
+        if name in self._sets:
+            return True
+        entry = self._values.get(name)
+        if entry is None:
+            return False
+        self._values[name] = (entry[0], time.monotonic() + seconds)
+        return True
+
+    async def flushdb(self) -> bool:
+        """Очистка хранилища."""
+        self._values.clear()
+        self._sets.clear()
+        self._member_of.clear()
+        return True
+
+    def _drop_value(self, name: str) -> None:
+        self._values.pop(name, None)
+        for set_name in self._member_of.pop(name, ()):
+            members = self._sets.get(set_name)
+            if members is None:
+                continue
+            members.discard(name)
+            if not members:
+                del self._sets[set_name]  # noqa: WPS420
+
+
+class NullBackend:
+    """Хранилище, которое ничего не хранит: кэш ответов выключен.
+
+    В отличие от InMemoryLRUBackend(max_entries=0) не копит и множества
+    тегов, поэтому память не растет с числом запросов.
+    """
+
+    async def get(self, name: str) -> Optional[bytes]:
+        """Всегда промах."""
+        return None
+
+    async def set(  # noqa: WPS125
+        self, name: str, value: bytes, ex: Optional[int] = None,
+    ) -> bool:
+        """Значение отбрасывается."""
+        return True
+
+    async def delete(self, *names: str) -> int:
+        """Удалять нечего."""
+        return 0
+
+    async def sadd(self, name: str, *values: str) -> int:
+        """Элементы отбрасываются."""
+        return 0
+
+    async def smembers(self, name: str) -> Set[Union[str, bytes]]:
+        """Множества всегда пусты."""
+        return set()
+
+    async def expire(self, name: str, seconds: int) -> bool:
+        """Ключей нет, TTL ставить некому."""
+        return False
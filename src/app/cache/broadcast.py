@@ -0,0 +1,126 @@
+import asyncio
+import time
+from contextlib import suppress
+from typing import Awaitable, Callable, Iterable, Iterator, Optional
+
+import asyncpg
+
+from src.app.core.settings import PostgresConfig
+
+RESPONSE_CACHE_CHANNEL = 'response_cache'
+# Payload NOTIFY ограничен 8000 байт; теги отправляются пачками меньше.
+MAX_PAYLOAD_BYTES = 7000
+TAG_SEPARATOR = '\n'
+
+TagsCallback = Callable[[list[str]], Awaitable[None]]
+LostCallback = Callable[[], Awaitable[None]]
+
+
+def tag_payloads(tags: Iterable[str]) -> Iterator[str]:
+    """Теги, разбитые на payload-ы NOTIFY не длиннее MAX_PAYLOAD_BYTES."""
+    batch: list[str] = []
+    size = 0
+    for tag in tags:
+        tag_size = len(tag.encode()) + 1
+        if batch and size + tag_size > MAX_PAYLOAD_BYTES:
+            yield TAG_SEPARATOR.join(batch)
+            batch, size = [], 0
+        batch.append(tag)
+        size += tag_size
+    if batch:
+        yield TAG_SEPARATOR.join(batch)
+
+
+class PgInvalidationBroadcast:
+    """Рассылка инвалидаций кэша ответов всем воркерам через NOTIFY.
+
+    У каждого воркера свой in-memory кэш, и invalidate() в воркере,
+    принявшем запись, остальные воркеры не видят. Теги рассылаются по
+    каналу channel, каждый воркер слушает его отдельным соединением и
+    удаляет у себя записи с этими тегами (свои уведомления пропускаются).
+
+    Пока соединения нет, уведомления теряются: при его потере вызывается
+    on_lost (кэш очищается), а listening=False, пока оно не восстановлено.
+    Переподключение - при publish и reconnect, не чаще retry_seconds.
+    """
+
+    def __init__(
+        self,
+        psql: PostgresConfig,
+        channel: str = RESPONSE_CACHE_CHANNEL,
+        retry_seconds: float = 1,
+    ):
+        self.psql = psql
+        self.channel = channel
+        self.retry_seconds = retry_seconds
+        self.closed = False
+        self._connection: Optional[asyncpg.Connection] = None
+        self._retry_at = 0.0  # noqa: WPS358
+        self._lock = asyncio.Lock()
+        self._on_tags: Optional[TagsCallback] = None
+        self._on_lost: Optional[LostCallback] = None
+
+    @property
+    def listening(self) -> bool:
+        """Получает ли воркер сейчас инвалидации других воркеров."""
+        return self._connection is not None
+
+    def bind(self, on_tags: TagsCallback, on_lost: LostCallback) -> None:
+        """Обработчики полученных тегов и потери соединения."""
+        self._on_tags = on_tags
+        self._on_lost = on_lost
+
+    async def reconnect(self) -> None:
+        """Подключение и LISTEN, если соединения нет; ошибки подавляются."""
+        if self.listening or self.closed or time.monotonic() < self._retry_at:
+            return
+        with suppress(OSError, asyncpg.PostgresError):
+            await self._listen()
+        if not self.listening:
+            self._retry_at = time.monotonic() + self.retry_seconds
+
+    async def publish(self, tags: Iterable[str]) -> None:
+        """Рассылка тегов; без соединения инвалидация остается локальной."""
+        await self.reconnect()
+        async with self._lock:
+            connection = self._connection
+            if connection is None:
+                return
+            with suppress(OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                for payload in tag_payloads(tags):
+                    await connection.execute(
+                        'SELECT pg_notify($1, $2)', self.channel, payload,
+                    )
+
+    async def close(self) -> None:
+        """Остановка рассылки и закрытие соединения."""
+        self.closed = True
+        async with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.close()
+
+    async def _listen(self) -> None:
+        async with self._lock:
+            if self.closed or self._connection is not None:
+                return
+            connection = await asyncpg.connect(
+                user=self.psql.user,
+                password=self.psql.password,
+                host=self.psql.host,
+                port=int(self.psql.port),
+                database=self.psql.db,
+            )
+            await connection.add_listener(self.channel, self._on_notification)
+            connection.add_termination_listener(self._on_termination)
+            self._connection = connection
+
+    async def _on_notification(self, connection, pid, channel, payload) -> None:
+        if pid == connection.get_server_pid() or self._on_tags is None:
+            return
+        await self._on_tags(payload.split(TAG_SEPARATOR))
+
+    async def _on_termination(self, connection) -> None:
+        self._connection = None
+        if self._on_lost is not None:
+            await self._on_lost()
@@ -0,0 +1,166 @@
+from typing import Any, Iterable, Optional
+from urllib.parse import urlencode
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from src.app.cache.backends import CacheBackend, InMemoryLRUBackend
+from src.app.cache.broadcast import PgInvalidationBroadcast
+from src.app.core.serialization import dumps
+from src.app.core.settings import CacheConfig, PostgresConfig
+
+CATS_LIST_TAG = 'cats:list'
+
+
+def cat_tag(cat_id: int) -> str:
+    """Тег записей, в ответе которых есть кошка cat_id."""
+    return f'cat:{cat_id}'
+
+
+def breed_cats_tag(breed_id: int) -> str:
+    """Тег списков кошек породы breed_id."""
+    return f'breed:{breed_id}:cats'
+
+
+class ResponseCache:
+    """Кэш сериализованных ответов read-обработчиков.
+
+    Ключ строится из имени маршрута и параметров запроса. Каждая запись
+    помечается тегами (кошки и списки, которые в нее вошли); запись в БД
+    инвалидирует только записи с затронутыми тегами. Запись, вычисленная
+    параллельно с инвалидацией, может прожить до истечения ttl.
+
+    In-memory хранилище у каждого воркера свое: с broadcast инвалидации
+    рассылаются остальным воркерам, а без соединения рассылки записи не
+    сохраняются.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: int,
+        namespace: str = 'resp',
+        broadcast: Optional[PgInvalidationBroadcast] = None,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace = namespace
+        self.broadcast = broadcast
+        if broadcast is not None:
+            broadcast.bind(self._delete_tagged, self._clear)
+
+    def make_key(self, route: str, **params: object) -> str:
+        """Ключ записи для маршрута и параметров запроса.
+
+        Args:
+            route (str): имя маршрута
+            params (object): параметры запроса, None не учитываются
+
+        Returns:
+            str: ключ записи в хранилище
+        """
+        query = urlencode(sorted(
+            (name, value_) for name, value_ in params.items() if value_ is not None
+        ))
+        return f'{self.namespace}:{route}?{query}'
+
+    async def get(self, key: str) -> Optional[Response]:
+        """Закэшированный ответ по ключу (None при промахе)."""
+        body = await self.backend.get(key)
+        if body is None:
+            return None
+        return self._response(body, hit=True)
+
+    async def store(
+        self, key: str, content: Any, tags: Iterable[str],
+    ) -> Response:
+        """Сериализация ответа, запись в кэш и привязка к тегам.
+
+        Args:
+            key (str): ключ записи
+            content (Any): схема ответа или готовая структура из примитивов
+            tags (Iterable[str]): теги, при инвалидации которых запись удаляется
+
+        Returns:
+            Response: готовый JSON-ответ
+        """
+        if isinstance(content, BaseModel):
+            body = content.model_dump_json().encode()
+        else:
+            body = dumps(content)
+        if self.broadcast is not None:
+            await self.broadcast.reconnect()
+            if not self.broadcast.listening:
+                return self._response(body, hit=False)
+        await self.backend.set(key, body, ex=self.ttl)
+        for tag in set(tags):
+            tag_key = self._tag_key(tag)
+            await self.backend.sadd(tag_key, key)
+            await self.backend.expire(tag_key, self.ttl)
+        return self._response(body, hit=False)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Удаление всех записей, помеченных хотя бы одним из тегов."""
+        await self._delete_tagged(tags)
+        if self.broadcast is not None:
+            await self.broadcast.publish(tags)
+
+    async def start(self) -> None:
+        """Подключение рассылки инвалидаций, если она есть."""
+        if self.broadcast is not None:
+            await self.broadcast.reconnect()
+
+    async def close(self) -> None:
+        """Закрытие рассылки инвалидаций, если она есть."""
+        if self.broadcast is not None:
+            await self.broadcast.close()
+
+    async def _delete_tagged(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            keys = [
+                member.decode() if isinstance(member, bytes) else member
+                for member in await self.backend.smembers(tag_key)
+            ]
+            await self.backend.delete(*keys, tag_key)
+
+    async def _clear(self) -> None:
+        # Рассылка только при in-memory хранилище (build_response_cache).
+        await self.backend.flushdb()
+
+    def _tag_key(self, tag: str) -> str:
+        return f'{self.namespace}:tag:{tag}'
+
+    def _response(self, body: bytes, hit: bool) -> Response:
+        return Response(
+            content=body,
+            media_type='application/json',
+            headers={'X-Cache': 'HIT' if hit else 'MISS'},
+        )
+
+
+def build_response_cache(
+    config: CacheConfig, psql: PostgresConfig,
+) -> ResponseCache:
+    """Кэш ответов с хранилищем, выбранным в настройках.
+
+    Args:
+        config (CacheConfig): настройки кэшей
+        psql (PostgresConfig): настройки БД для рассылки инвалидаций
+
+    Returns:
+        ResponseCache: кэш ответов
+    """
+    if config.response_backend == 'redis':
+        from redis import asyncio as aioredis  # noqa: WPS433
+
+        return ResponseCache(
+            backend=aioredis.from_url(config.redis_url), ttl=config.response_ttl,
+        )
+    return ResponseCache(
+        backend=InMemoryLRUBackend(max_entries=config.response_max_entries),
+        ttl=config.response_ttl,
+        broadcast=(
+            PgInvalidationBroadcast(psql) if config.response_broadcast else None
+        ),
+    )
@@ -0,0 +1,123 @@
+import asyncio
+
+from fastapi import status
+
+from src.app.core.metrics import http_requests_shed_total
+from src.app.core.rate_limit import send_rejection
+from src.app.core.settings import AdmissionConfig, PoolConfig
+
+
+class AdmissionController:
+    """Ограничение числа одновременно обрабатываемых запросов.
+
+    Сверх max_concurrent запросы ждут в очереди не дольше queue_timeout,
+    а при полной очереди отклоняются сразу. Без этого при перегрузке
+    запросы копятся в очереди пула соединений и ждут до pool.timeout,
+    и задержка растет у всех; с ним лишние быстро получают 503, а
+    принятые обслуживаются с задержкой не больше queue_timeout сверху.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def acquire(self) -> bool:
+        """Занятие слота обработки.
+
+        Returns:
+            bool: True, если слот получен (его нужно вернуть release),
+                False, если очередь полна или ожидание превысило таймаут
+        """
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self.active += 1
+            return True
+        if self.waiting >= self.max_queue:
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        """Возврат слота обработки."""
+        self.active -= 1
+        self._semaphore.release()
+
+
+def build_admission_controller(
+    config: AdmissionConfig, pool: PoolConfig,
+) -> AdmissionController:
+    """Admission controller по настройкам, по умолчанию по емкости пула.
+
+    Args:
+        config (AdmissionConfig): настройки admission control
+        pool (PoolConfig): настройки пула соединений воркера
+
+    Returns:
+        AdmissionController: контроллер
+    """
+    return AdmissionController(
+        max_concurrent=config.max_concurrent or pool.size + pool.max_overflow,
+        max_queue=config.max_queue,
+        queue_timeout=config.queue_timeout,
+    )
+
+
+class AdmissionMiddleware:
+    """ASGI middleware: admission control запросов к API.
+
+    Действует на пути с path_prefix, кроме exempt_paths: бесконечные
+    потоки (лента изменений) заняли бы слоты навсегда.
+    """
+
+    def __init__(
+        self,
+        app,
+        controller: AdmissionController,
+        config: AdmissionConfig,
+        path_prefix: str = '',
+    ):
+        self.app = app
+        self.controller = controller
+        self.retry_after = config.retry_after
+        self.path_prefix = path_prefix
+        self.exempt_paths = frozenset(
+            f'{path_prefix}{path}' for path in config.exempt_paths
+        )
+
+    async def __call__(self, scope, receive, send):
+        """Обработка запроса в слоте контроллера, без слота - 503."""
+        path = scope.get('path', '')
+        if (
+            scope['type'] != 'http'
+            or not path.startswith(self.path_prefix)
+            or path in self.exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.controller.acquire():
+            http_requests_shed_total.inc('admission')
+            await send_rejection(
+                scope,
+                receive,
+                send,
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                'Сервис перегружен, повторите запрос позже.',
+                self.retry_after,
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
@@ -0,0 +1,56 @@
+from typing import Collection
+
+from fastapi import Request
+
+API_KEY_HEADER = 'X-API-Key'
+
+
+def get_client_ip(request: Request) -> str:
+    """Идентификатор клиента по IP-адресу.
+
+    Args:
+        request (Request): входящий запрос
+
+    Returns:
+        str: ключ клиента вида ip:<адрес>
+    """
+    host = request.client.host if request.client else 'unknown'
+    return f'ip:{host}'
+
+
+def get_client_key(request: Request) -> str:
+    """Идентификатор клиента: API-ключ, а без него IP-адрес.
+
+    Ключ не проверяется, поэтому годится только там, где подмена ключа
+    вредит лишь самому клиенту (read-your-writes); для ограничений
+    используется get_trusted_client_key.
+
+    Args:
+        request (Request): входящий запрос
+
+    Returns:
+        str: ключ клиента вида key:<api-key> или ip:<адрес>
+    """
+    api_key = request.headers.get(API_KEY_HEADER)
+    if api_key:
+        return f'key:{api_key}'
+    return get_client_ip(request)
+
+
+def get_trusted_client_key(request: Request, api_keys: Collection[str]) -> str:
+    """Идентификатор клиента: API-ключ из списка api_keys, иначе IP-адрес.
+
+    Произвольные ключи не дают клиенту новых ведер лимита и не вытесняют
+    ведра других клиентов.
+
+    Args:
+        request (Request): входящий запрос
+        api_keys (Collection[str]): известные API-ключи
+
+    Returns:
+        str: ключ клиента вида key:<api-key> или ip:<адрес>
+    """
+    api_key = request.headers.get(API_KEY_HEADER)
+    if api_key and api_key in api_keys:
+        return f'key:{api_key}'
+    return get_client_ip(request)
@@ -0,0 +1,308 @@
+import gzip
+import zlib
+from typing import Optional, Protocol
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from src.app.core.settings import CompressionConfig
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Потоки, которые нельзя буферизовать в компрессоре.
+UNCOMPRESSED_CONTENT_TYPES = frozenset(('text/event-stream',))
+
+
+class StreamCompressor(Protocol):
+    """Потоковый компрессор тела ответа.
+
+    flush выталкивает все сжатое до текущего места, не завершая поток,
+    чтобы клиент мог разжать уже отправленные части; finish завершает.
+    """
+
+    def compress(self, chunk: bytes) -> bytes:  # noqa: D102
+        ...  # noqa: WPS428
+
+    def flush(self) -> bytes:  # noqa: D102
+        ...  # noqa: WPS428
+
+    def finish(self) -> bytes:  # noqa: D102
+        ...  # noqa: WPS428
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(
+            level, zlib.DEFLATED, zlib.MAX_WBITS | 16,
+        )
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class GzipCodec:
+    """gzip (zlib, всегда доступен)."""
+
+    name = 'gzip'
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def compress(self, body: bytes) -> bytes:
+        """Сжатие тела целиком."""
+        return gzip.compress(body, compresslevel=self.level, mtime=0)
+
+    def stream(self) -> StreamCompressor:
+        """Компрессор для тела, отдаваемого частями."""
+        return _GzipStream(self.level)
+
+
+class _BrotliStream:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class BrotliCodec:
+    """brotli (пакет brotli, если установлен)."""
+
+    name = 'br'
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def compress(self, body: bytes) -> bytes:
+        """Сжатие тела целиком."""
+        return brotli.compress(body, quality=self.level)
+
+    def stream(self) -> StreamCompressor:
+        """Компрессор для тела, отдаваемого частями."""
+        return _BrotliStream(self.level)
+
+
+class ZstdCodec:
+    """zstd (пакет zstandard, если установлен).
+
+    ZstdCompressor нельзя использовать из нескольких потоков или потоков
+    ответа одновременно, поэтому он создается на каждый вызов.
+    """
+
+    name = 'zstd'
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def compress(self, body: bytes) -> bytes:
+        """Сжатие тела целиком."""
+        return zstandard.ZstdCompressor(level=self.level).compress(body)
+
+    def stream(self) -> StreamCompressor:
+        """Компрессор для тела, отдаваемого частями."""
+        return _ZstdStream(self.level)
+
+
+def available_codecs(config: CompressionConfig) -> dict:
+    """Кодеки из config.encodings, чьи библиотеки установлены.
+
+    Args:
+        config (CompressionConfig): настройки сжатия
+
+    Returns:
+        dict: кодеки по имени Content-Encoding в порядке предпочтения
+    """
+    factories = {'gzip': lambda: GzipCodec(config.gzip_level)}
+    if brotli is not None:
+        factories['br'] = lambda: BrotliCodec(config.brotli_level)
+    if zstandard is not None:
+        factories['zstd'] = lambda: ZstdCodec(config.zstd_level)
+    return {
+        encoding: factories[encoding]()
+        for encoding in config.encodings
+        if encoding in factories
+    }
+
+
+def negotiate(accept_encoding: str, encodings: tuple[str, ...]) -> Optional[str]:
+    """Выбор кодировки по заголовку Accept-Encoding.
+
+    Побеждает наибольший q, при равных q - порядок encodings. q=0
+    исключает кодировку, "*" задает q для не перечисленных явно.
+
+    Args:
+        accept_encoding (str): значение заголовка запроса
+        encodings (tuple[str, ...]): доступные кодировки по предпочтению
+
+    Returns:
+        Optional[str]: выбранная кодировка или None (без сжатия)
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    default_weight = weights.get('*', 0.0)
+    candidates = [
+        (weights.get(encoding, default_weight), -position, encoding)
+        for position, encoding in enumerate(encodings)
+    ]
+    weight, _, encoding = max(candidates, default=(0.0, 0, None))
+    return encoding if weight > 0 else None
+
+
+class CompressionMiddleware:
+    """ASGI middleware: сжатие ответов gzip/br/zstd по Accept-Encoding.
+
+    Тела меньше minimum_size отдаются как есть. Тело целиком сжимается
+    одним вызовом, начиная с offload_size - в пуле потоков, чтобы не
+    занимать цикл событий (zlib, brotli и zstd отпускают GIL). Потоковые
+    ответы сжимаются по частям с flush после каждой, кроме
+    text/event-stream.
+    """
+
+    def __init__(self, app, config: CompressionConfig):
+        self.app = app
+        self.config = config
+        self.codecs = available_codecs(config)
+
+    async def __call__(self, scope, receive, send):
+        """Обработка запроса со сжатием ответа."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(
+            Headers(scope=scope).get('accept-encoding', ''), tuple(self.codecs),
+        )
+        responder = _CompressingSend(
+            send,
+            self.codecs.get(encoding) if encoding else None,
+            self.config,
+        )
+        await self.app(scope, receive, responder)
+
+
+class _CompressingSend:
+    def __init__(self, send, codec, config: CompressionConfig):
+        self.send = send
+        self.codec = codec
+        self.config = config
+        self.start_message: Optional[dict] = None
+        self.stream: Optional[StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, message):
+        if message['type'] == 'http.response.start':
+            self.start_message = message
+            # Заголовки ленты SSE уходят сразу, не дожидаясь первого события.
+            if not self._is_negotiable(MutableHeaders(scope=message)):
+                self.passthrough = True
+                await self.send(message)
+            return
+        if message['type'] != 'http.response.body' or self.passthrough:
+            await self.send(message)
+            return
+        if self.stream is not None:
+            await self._send_stream_chunk(message)
+            return
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        headers = MutableHeaders(scope=self.start_message)
+        # Vary нужен и на 304: кэш должен различать варианты по кодировке.
+        headers.add_vary_header('Accept-Encoding')
+        if (
+            self.codec is None
+            or self.start_message['status'] in {204, 304}
+            or (not more_body and len(body) < self.config.minimum_size)
+        ):
+            await self._pass_through(message)
+            return
+
+        headers['Content-Encoding'] = self.codec.name
+        self._weaken_etag(headers)
+        if more_body:
+            del headers['Content-Length']  # noqa: WPS420
+            self.stream = self.codec.stream()
+            await self.send(self.start_message)
+            await self._send_stream_chunk(message)
+            return
+
+        compressed = await self._run(self.codec.compress, body)
+        headers['Content-Length'] = str(len(compressed))
+        await self.send(self.start_message)
+        await self.send({'type': 'http.response.body', 'body': compressed})
+
+    def _is_negotiable(self, headers: MutableHeaders) -> bool:
+        if 'content-encoding' in headers:
+            return False
+        content_type = headers.get('content-type', '').split(';')[0].strip()
+        return content_type not in UNCOMPRESSED_CONTENT_TYPES
+
+    def _weaken_etag(self, headers: MutableHeaders) -> None:
+        # Сжатое тело побайтно отличается от исходного, сильный ETag
+        # исходного ему не подходит; слабый совпадает при If-None-Match.
+        etag = headers.get('etag')
+        if etag and not etag.startswith('W/'):
+            headers['ETag'] = f'W/{etag}'
+
+    async def _pass_through(self, message) -> None:
+        self.passthrough = True
+        await self.send(self.start_message)
+        await self.send(message)
+
+    async def _send_stream_chunk(self, message) -> None:
+        # Каждая часть выталкивается из буфера компрессора: иначе потоковый
+        # ответ (выгрузка каталога) копится в нем и уходит только в конце.
+        more_body = message.get('more_body', False)
+        chunk = await self._run(self.stream.compress, message.get('body', b''))
+        chunk += self.stream.flush() if more_body else self.stream.finish()
+        await self.send({
+            'type': 'http.response.body', 'body': chunk, 'more_body': more_body,
+        })
+
+    async def _run(self, compress, data: bytes) -> bytes:
+        if len(data) >= self.config.offload_size:
+            return await run_in_threadpool(compress, data)
+        return compress(data)
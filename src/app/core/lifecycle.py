@@ -0,0 +1,102 @@
+import asyncio
+import signal
+import time
+from functools import partial
+from typing import Awaitable, Callable, Optional
+
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+ShutdownCallback = Callable[[], Awaitable[None]]
+
+
+class AppLifecycle:
+    """Состояние жизненного цикла приложения: готовность и in-flight запросы.
+
+    ready выставляется lifespan-обработчиком после прогрева и снимается в
+    начале остановки, чтобы балансировщик перестал слать новые запросы.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.in_flight = 0
+        self._previous_handlers: dict[int, Callable] = {}
+        self._shutdown_task: Optional[asyncio.Task] = None
+
+    def on_shutdown_signal(self, callback: ShutdownCallback) -> None:
+        """Запуск callback по сигналу остановки, раньше обработчика сервера.
+
+        uvicorn отправляет lifespan shutdown, только дождавшись открытых
+        соединений (timeout_graceful_shutdown): до этого готовность не
+        снимается, а бесконечные ленты изменений держат остановку. Поэтому
+        остановка начинается по самому сигналу, после чего вызывается
+        обработчик сервера. Сигналы, которые никто не перехватил, и вызов
+        не из главного потока оставляются как есть.
+
+        Args:
+            callback (ShutdownCallback): начало остановки приложения
+        """
+        loop = asyncio.get_running_loop()
+        for signum in SHUTDOWN_SIGNALS:
+            previous = signal.getsignal(signum)
+            if not callable(previous):
+                continue
+            try:
+                signal.signal(
+                    signum, partial(self._handle_signal, loop, callback, previous),
+                )
+            except ValueError:
+                return
+            self._previous_handlers[signum] = previous
+
+    def restore_signals(self) -> None:
+        """Возврат обработчиков, замененных on_shutdown_signal."""
+        while self._previous_handlers:
+            signum, previous = self._previous_handlers.popitem()
+            signal.signal(signum, previous)
+        self._shutdown_task = None
+
+    async def drain(self, timeout: float, interval: float = 0.05) -> bool:
+        """Ожидание завершения in-flight запросов.
+
+        Args:
+            timeout (float): наибольшее время ожидания в секундах
+            interval (float): период проверки счетчика
+
+        Returns:
+            bool: True, если все запросы завершились до таймаута
+        """
+        deadline = time.monotonic() + timeout
+        while self.in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+        return not self.in_flight
+
+    def _handle_signal(self, loop, callback, previous, signum, frame) -> None:
+        loop.call_soon_threadsafe(self._start_shutdown, callback)
+        previous(signum, frame)
+
+    def _start_shutdown(self, callback: ShutdownCallback) -> None:
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.create_task(callback())
+
+
+class InFlightMiddleware:
+    """ASGI middleware: учет HTTP-запросов, которые ждет drain."""
+
+    def __init__(self, app, lifecycle: AppLifecycle):
+        self.app = app
+        self.lifecycle = lifecycle
+
+    async def __call__(self, scope, receive, send):
+        """Обработка запроса с учетом в счетчике in-flight."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        self.lifecycle.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.lifecycle.in_flight -= 1
+
+
+lifecycle = AppLifecycle()
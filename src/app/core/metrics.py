@@ -0,0 +1,311 @@
+import bisect
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.models.db_helper import pool_stats
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+UNMATCHED_ROUTE = '<unmatched>'
+
+LabelValues = tuple[str, ...]
+
+
+def _format_labels(names: tuple[str, ...], label_values: LabelValues) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(
+        '{0}="{1}"'.format(
+            name,
+            label.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'),
+        )
+        for name, label in zip(names, label_values)
+    )
+    return f'{{{pairs}}}'
+
+
+class Metric(ABC):
+    """Базовая метрика с набором меток."""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+
+    def render(self) -> list[str]:
+        """Строки метрики в текстовом формате Prometheus."""
+        return [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.kind}',
+            *self._samples(),
+        ]
+
+    @abstractmethod
+    def _samples(self) -> Iterable[str]:
+        """Строки значений метрики."""
+
+
+class Counter(Metric):
+    """Монотонно растущий счетчик."""
+
+    kind = 'counter'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """Увеличение счетчика."""
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def _samples(self) -> Iterable[str]:
+        for label_values, count in self._values.items():
+            yield f'{self.name}{_format_labels(self.labels, label_values)} {count}'
+
+
+class Gauge(Metric):
+    """Значение, которое может как расти, так и убывать."""
+
+    kind = 'gauge'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, *label_values: str, value: float) -> None:  # noqa: WPS125
+        """Установка значения."""
+        self._values[label_values] = value
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """Увеличение значения."""
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        """Уменьшение значения."""
+        self._values[label_values] = self._values.get(label_values, 0) - amount
+
+    def _samples(self) -> Iterable[str]:
+        for label_values, value in self._values.items():
+            yield f'{self.name}{_format_labels(self.labels, label_values)} {value}'
+
+
+class Histogram(Metric):
+    """Гистограмма с фиксированными границами корзин."""
+
+    kind = 'histogram'
+
+    def __init__(self, *args, buckets: tuple[float, ...] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = buckets
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, *label_values: str, value: float) -> None:
+        """Учет одного наблюдения."""
+        counts = self._counts.get(label_values)
+        if counts is None:
+            counts = [0] * (len(self.buckets) + 1)
+            self._counts[label_values] = counts
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[label_values] = self._sums.get(label_values, 0) + value
+
+    def _samples(self) -> Iterable[str]:
+        label_names = (*self.labels, 'le')
+        for label_values, counts in self._counts.items():
+            cumulative = 0
+            bounds = [str(bound) for bound in self.buckets] + ['+Inf']
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _format_labels(label_names, (*label_values, bound))
+                yield f'{self.name}_bucket{labels} {cumulative}'
+            labels = _format_labels(self.labels, label_values)
+            yield f'{self.name}_sum{labels} {self._sums[label_values]}'
+            yield f'{self.name}_count{labels} {cumulative}'
+
+
+class MetricsRegistry:
+    """Реестр метрик и коллекторов, вычисляемых в момент сбора."""
+
+    def __init__(self):
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Регистрация метрики."""
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """Регистрация функции, строящей метрики при каждом сборе."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Все метрики в текстовом формате Prometheus."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for collected in collector():
+                lines.extend(collected.render())
+        return '\n'.join(lines) + '\n'
+
+
+class RequestDbStats:
+    """Число и суммарное время SQL-запросов в рамках HTTP-запроса."""
+
+    __slots__ = ('queries', 'seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0  # noqa: WPS358
+
+
+request_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar(
+    'request_db_stats', default=None,
+)
+
+registry = MetricsRegistry()
+http_requests_total = registry.register(Counter(
+    'http_requests_total',
+    'Количество обработанных HTTP-запросов.',
+    labels=('method', 'route', 'status'),
+))
+http_request_duration_seconds = registry.register(Histogram(
+    'http_request_duration_seconds',
+    'Время обработки HTTP-запроса.',
+    labels=('method', 'route'),
+))
+http_requests_in_flight = registry.register(Gauge(
+    'http_requests_in_flight',
+    'Количество HTTP-запросов в обработке.',
+))
+http_request_db_queries = registry.register(Histogram(
+    'http_request_db_queries',
+    'Количество SQL-запросов на HTTP-запрос.',
+    labels=('method', 'route'),
+    buckets=QUERY_BUCKETS,
+))
+http_request_db_seconds = registry.register(Histogram(
+    'http_request_db_seconds',
+    'Суммарное время SQL-запросов на HTTP-запрос.',
+    labels=('method', 'route'),
+))
+http_requests_shed_total = registry.register(Counter(
+    'http_requests_shed_total',
+    'Количество запросов, отклоненных до обработки (429/503).',
+    labels=('reason',),
+))
+db_query_duration_seconds = registry.register(Histogram(
+    'db_query_duration_seconds',
+    'Время выполнения SQL-запроса.',
+))
+
+
+class MetricsMiddleware:
+    """ASGI middleware: задержка, in-flight и SQL-нагрузка по маршрутам."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Обработка запроса с замером."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        db_stats = RequestDbStats()
+        token = request_db_stats.set(db_stats)
+        status_code = 500
+
+        async def send_wrapper(message):  # noqa: WPS430
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            request_db_stats.reset(token)
+            route = scope.get('route')
+            route_path = getattr(route, 'path', UNMATCHED_ROUTE)
+            method = scope['method']
+            http_requests_total.inc(method, route_path, str(status_code))
+            http_request_duration_seconds.observe(method, route_path, value=elapsed)
+            http_request_db_queries.observe(
+                method, route_path, value=db_stats.queries,
+            )
+            http_request_db_seconds.observe(
+                method, route_path, value=db_stats.seconds,
+            )
+
+
+def instrument_engine(async_engine: AsyncEngine) -> None:
+    """Подписка на события движка для учета времени SQL-запросов.
+
+    Args:
+        async_engine (AsyncEngine): движок, запросы которого учитываются
+    """
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def _before(conn, cursor, statement, parameters, context, executemany):  # noqa: WPS430
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def _after(conn, cursor, statement, parameters, context, executemany):  # noqa: WPS430
+        elapsed = time.perf_counter() - conn.info['query_started'].pop()
+        db_query_duration_seconds.observe(value=elapsed)
+        db_stats = request_db_stats.get()
+        if db_stats is not None:
+            db_stats.queries += 1
+            db_stats.seconds += elapsed
+
+
+def pool_metrics(engines: dict[str, AsyncEngine]) -> Callable[[], Iterable[Metric]]:
+    """Коллектор метрик пулов соединений, вычисляемых при сборе.
+
+    Args:
+        engines (dict[str, AsyncEngine]): движки по названию пула
+
+    Returns:
+        Callable: коллектор для MetricsRegistry.register_collector
+    """
+    def collect() -> Iterable[Metric]:  # noqa: WPS430
+        checked_out = Gauge(
+            'db_pool_checked_out', 'Выданные соединения пула.', labels=('pool',),
+        )
+        overflow = Gauge(
+            'db_pool_overflow', 'Соединения сверх размера пула.', labels=('pool',),
+        )
+        checkouts = Counter(
+            'db_pool_checkouts_total', 'Количество выдач соединений.',
+            labels=('pool',),
+        )
+        wait = Counter(
+            'db_pool_checkout_wait_seconds_total',
+            'Суммарное ожидание выдачи соединения.',
+            labels=('pool',),
+        )
+        for pool_name, async_engine in engines.items():
+            stats = pool_stats(async_engine)
+            checked_out.set(pool_name, value=stats['checked_out'])
+            overflow.set(pool_name, value=stats['overflow'])
+            checkouts.inc(pool_name, amount=stats['checkouts'])
+            wait.inc(pool_name, amount=stats['wait_total_seconds'])
+        return (checked_out, overflow, checkouts, wait)
+
+    return collect
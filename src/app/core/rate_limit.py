@@ -0,0 +1,180 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Protocol
+
+from fastapi import Request, Response, status
+
+from src.app.core.client import get_trusted_client_key
+from src.app.core.metrics import http_requests_shed_total
+from src.app.core.serialization import dumps
+from src.app.core.settings import CacheConfig, RateLimitConfig
+
+# Ведро в Redis: пополнение и списание атомарно, время - часы Redis,
+# чтобы воркеры с расходящимися часами делили одно ведро. Ответ строкой:
+# числа Lua в ответе Redis обрезаются до целых.
+REDIS_TAKE_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or burst
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RateLimitBackend(Protocol):
+    """Хранилище ведер токенов по ключу клиента."""
+
+    async def take(  # noqa: D102
+        self, key: str, rate: float, burst: int, cost: float = 1,
+    ) -> float:
+        ...  # noqa: WPS428
+
+
+class InMemoryTokenBuckets:
+    """Ведра токенов в памяти процесса.
+
+    Ведро хранит остаток и время последнего обращения и пополняется лениво
+    при take. Сверх max_keys вытесняется ведро давно не обращавшегося
+    клиента: при следующем запросе он получит полное ведро.
+    """
+
+    def __init__(
+        self, max_keys: int = 100000, clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(
+        self, key: str, rate: float, burst: int, cost: float = 1,
+    ) -> float:
+        """Списание cost токенов из ведра клиента.
+
+        Args:
+            key (str): ключ клиента
+            rate (float): пополнение, токенов в секунду
+            burst (int): емкость ведра
+            cost (float): стоимость запроса в токенах
+
+        Returns:
+            float: 0, если токены списаны, иначе секунды до их появления
+        """
+        now = self.clock()
+        tokens, updated_at = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+        wait = 0.0  # noqa: WPS358
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+class RedisTokenBuckets:
+    """Ведра токенов в Redis, общие для всех воркеров и инстансов."""
+
+    def __init__(self, client, prefix: str = 'rate_limit:'):
+        self.client = client
+        self.prefix = prefix
+
+    async def take(
+        self, key: str, rate: float, burst: int, cost: float = 1,
+    ) -> float:
+        """Атомарное списание cost токенов скриптом REDIS_TAKE_SCRIPT."""
+        wait = await self.client.eval(
+            REDIS_TAKE_SCRIPT, 1, f'{self.prefix}{key}', rate, burst, cost,
+        )
+        return float(wait)
+
+
+def build_rate_limit_backend(
+    config: RateLimitConfig, cache: CacheConfig,
+) -> RateLimitBackend:
+    """Хранилище ведер, выбранное в настройках.
+
+    Args:
+        config (RateLimitConfig): настройки ограничения частоты
+        cache (CacheConfig): настройки кэшей с адресом Redis
+
+    Returns:
+        RateLimitBackend: хранилище ведер
+    """
+    if config.backend == 'redis':
+        from redis import asyncio as aioredis  # noqa: WPS433
+
+        return RedisTokenBuckets(aioredis.from_url(cache.redis_url))
+    return InMemoryTokenBuckets(max_keys=config.max_clients)
+
+
+async def send_rejection(
+    scope, receive, send, status_code: int, detail: str, retry_after: float,
+) -> None:
+    """Отказ в обработке запроса с Retry-After в целых секундах."""
+    response = Response(
+        content=dumps({'detail': detail}),
+        status_code=status_code,
+        media_type='application/json',
+        headers={'Retry-After': str(max(math.ceil(retry_after), 1))},
+    )
+    await response(scope, receive, send)
+
+
+class RateLimitMiddleware:
+    """ASGI middleware: token bucket на клиента (get_trusted_client_key).
+
+    Ограничиваются только запросы к API (path_prefix): пробы и метрики
+    не должны получать 429. Отказ стоит одного обращения к хранилищу и
+    не доходит ни до пула соединений, ни до очереди admission control.
+    """
+
+    def __init__(
+        self,
+        app,
+        config: RateLimitConfig,
+        backend: RateLimitBackend,
+        path_prefix: str = '',
+    ):
+        self.app = app
+        self.config = config
+        self.backend = backend
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        """Обработка запроса, если у клиента есть токен, иначе 429."""
+        if scope['type'] != 'http' or not scope['path'].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        client_key = get_trusted_client_key(Request(scope), self.config.api_keys)
+        wait = await self.backend.take(
+            client_key, self.config.rate, self.config.burst,
+        )
+        if wait:
+            http_requests_shed_total.inc('rate_limit')
+            await send_rejection(
+                scope,
+                receive,
+                send,
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                'Слишком много запросов.',
+                wait,
+            )
+            return
+        await self.app(scope, receive, send)
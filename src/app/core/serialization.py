@@ -0,0 +1,15 @@
+from typing import Any
+
+import orjson
+
+
+def dumps(payload: Any) -> bytes:
+    """Компактная сериализация в JSON через orjson.
+
+    Args:
+        payload (Any): dict/list из примитивов
+
+    Returns:
+        bytes: JSON в UTF-8, совпадающий с выводом model_dump_json
+    """
+    return orjson.dumps(payload)
@@ -1,7 +1,25 @@
+from typing import Literal, Optional
+
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class PoolConfig(BaseModel):
+    """Конфигурация пула соединений и движка Postgres.
+
+    При запуске нескольких воркеров uvicorn у каждого свой пул, поэтому
+    workers * (size + max_overflow) не должно превышать max_connections.
+    """
+
+    size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30
+    recycle: int = 1800
+    pre_ping: bool = True
+    statement_timeout_ms: Optional[int] = None
+    prepared_statement_cache_size: int = 100
+
+
 class PostgresConfig(BaseModel):
     """Конфигурация для Postgres."""
 
@@ -10,6 +28,9 @@ class PostgresConfig(BaseModel):
     host: str
     port: str
     db: str
+    pool: PoolConfig = PoolConfig()
+    replica_url: Optional[str] = None
+    read_your_writes_seconds: float = 5
 
     @property
     def url(self):  # noqa: W293, D102
@@ -22,6 +43,151 @@ class UrlPath(BaseModel):
     prefix: str
 
 
+class PaginationConfig(BaseModel):
+    """Конфигурация постраничной выдачи списков."""
+
+    default_limit: int = 100
+    max_limit: int = 1000
+
+
+class ExportConfig(BaseModel):
+    """Конфигурация потоковой выгрузки каталога."""
+
+    batch_size: int = 1000
+
+
+class CacheConfig(BaseModel):
+    """Конфигурация in-process кэшей.
+
+    response_broadcast - рассылать инвалидации in-memory кэша ответов
+    другим воркерам через NOTIFY; launcher включает его при workers > 1.
+    """
+
+    breed_ttl: float = 300
+    response_backend: Literal['memory', 'redis'] = 'memory'
+    response_broadcast: bool = False
+    response_ttl: int = 30
+    response_max_entries: int = 10000
+    redis_url: str = 'redis://localhost:6379/0'
+    single_flight: bool = True
+
+
+class ChangesConfig(BaseModel):
+    """Конфигурация ленты изменений GET /cats/changes."""
+
+    batch_size: int = 500
+    heartbeat_seconds: float = 15
+
+
+class SyncConfig(BaseModel):
+    """Конфигурация синхронизации GET /cats?updated_since=.
+
+    Страница отдает изменения старше settle_seconds: updated_at берется из
+    начала транзакции, и запись, зафиксированная позже, не должна оказаться
+    позади updated_until, уже полученного клиентом.
+    """
+
+    settle_seconds: float = 2
+
+
+class BulkConfig(BaseModel):
+    """Конфигурация пакетных операций и импорта."""
+
+    max_batch_size: int = 1000
+    import_batch_size: int = 5000
+    import_max_errors: int = 1000
+
+
+class ServerConfig(BaseModel):
+    """Конфигурация production-запуска (src.app.launcher).
+
+    workers=None - по числу CPU. Пул каждого воркера урезается так, чтобы
+    workers * (pool.size + pool.max_overflow + 1) укладывалось в
+    db_max_connections - db_reserved_connections (+1 - соединение LISTEN
+    ленты изменений, и еще +1 при рассылке инвалидаций кэша ответов).
+    """
+
+    host: str = '0.0.0.0'  # noqa: S104
+    port: int = 8000
+    workers: Optional[int] = None
+    backlog: int = 2048
+    keep_alive: int = 5
+    limit_concurrency: Optional[int] = None
+    graceful_shutdown_timeout: int = 30
+    access_log: bool = False
+    proxy_headers: bool = True
+    db_max_connections: int = 100
+    db_reserved_connections: int = 10
+
+
+class LifespanConfig(BaseModel):
+    """Конфигурация прогрева при старте и остановки приложения.
+
+    warmup_connections=None - открыть весь pool.size каждого движка.
+    """
+
+    warmup_connections: Optional[int] = None
+    warmup_queries: bool = True
+    drain_timeout: float = 10
+
+
+class CompressionConfig(BaseModel):
+    """Конфигурация сжатия ответов.
+
+    encodings - кодировки в порядке предпочтения; br и zstd включаются,
+    только если установлены пакеты brotli и zstandard.
+    """
+
+    enabled: bool = True
+    encodings: tuple[str, ...] = ('zstd', 'br', 'gzip')
+    minimum_size: int = 1024
+    offload_size: int = 65536
+    gzip_level: int = 6
+    brotli_level: int = 4
+    zstd_level: int = 3
+
+
+class RateLimitConfig(BaseModel):
+    """Конфигурация ограничения частоты запросов клиента (token bucket).
+
+    rate - запросов в секунду на клиента, burst - емкость ведра. Клиент -
+    API-ключ из api_keys, остальные запросы (в том числе с неизвестными
+    ключами) считаются по IP. Ведра backend=memory свои у каждого
+    воркера, backend=redis общие для всех воркеров и инстансов
+    (cache.redis_url).
+    """
+
+    enabled: bool = False
+    rate: float = 50
+    burst: int = 100
+    backend: Literal['memory', 'redis'] = 'memory'
+    max_clients: int = 100000
+    api_keys: frozenset[str] = frozenset()
+
+
+class AdmissionConfig(BaseModel):
+    """Конфигурация admission control запросов к API.
+
+    Одновременно обрабатывается не больше max_concurrent запросов (по
+    умолчанию pool.size + pool.max_overflow), еще max_queue ждут не дольше
+    queue_timeout; остальные сразу получают 503. exempt_paths (от префикса
+    API) - долгие потоки, которые не держат соединение с БД.
+    """
+
+    enabled: bool = True
+    max_concurrent: Optional[int] = None
+    max_queue: int = 100
+    queue_timeout: float = 1
+    retry_after: int = 1
+    exempt_paths: tuple[str, ...] = ('/cats/changes',)
+
+
+class MetricsConfig(BaseModel):
+    """Конфигурация метрик Prometheus."""
+
+    enabled: bool = True
+
+
 class Settings(BaseSettings):
     """Настройки проекта."""
 
@@ -32,6 +198,18 @@ class Settings(BaseSettings):
     )
     psql: PostgresConfig
     url: UrlPath
+    pagination: PaginationConfig = PaginationConfig()
+    export: ExportConfig = ExportConfig()
+    cache: CacheConfig = CacheConfig()
+    bulk: BulkConfig = BulkConfig()
+    changes: ChangesConfig = ChangesConfig()
+    sync: SyncConfig = SyncConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    server: ServerConfig = ServerConfig()
+    lifespan: LifespanConfig = LifespanConfig()
+    compression: CompressionConfig = CompressionConfig()
+    rate_limit: RateLimitConfig = RateLimitConfig()
+    admission: AdmissionConfig = AdmissionConfig()
 
 
 settings = Settings()  # type: ignore [call-arg]
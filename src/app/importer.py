@@ -0,0 +1,118 @@
+"""Импорт кошек из CSV/NDJSON-файла через COPY.
+
+Пример:
+
+    python -m src.app.importer cats.csv --batch-size 10000
+
+Формат определяется по расширению (.csv, .ndjson/.jsonl), --format его
+переопределяет. Файл читается частями, каждый пакет загружается отдельной
+транзакцией. Код возврата 1, если часть строк отклонена.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.app.core.serialization import dumps
+from src.app.core.settings import settings
+from src.app.models.db_helper import engine, session_factory
+from src.app.schemas import schemas
+from src.app.service.cat import cat_service
+
+CHUNK_SIZE = 1024 * 1024
+EXTENSION_FORMATS = {  # noqa: WPS407
+    '.csv': schemas.ImportFormat.csv,
+    '.ndjson': schemas.ImportFormat.ndjson,
+    '.jsonl': schemas.ImportFormat.ndjson,
+}
+
+
+def import_format(
+    path: Path, explicit: Optional[str] = None,
+) -> schemas.ImportFormat:
+    """Формат файла: из аргумента или по расширению.
+
+    Args:
+        path (Path): путь к файлу
+        explicit (Optional[str]): формат из --format
+
+    Raises:
+        ValueError: если формат не задан и расширение неизвестно
+
+    Returns:
+        schemas.ImportFormat: формат файла
+    """
+    if explicit is not None:
+        return schemas.ImportFormat(explicit)
+    try:
+        return EXTENSION_FORMATS[path.suffix.lower()]
+    except KeyError as exp:
+        raise ValueError(
+            f'Не удалось определить формат {path.name}, укажите --format.',
+        ) from exp
+
+
+async def read_chunks(
+    path: Path, chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Чтение файла частями в пуле потоков, не блокируя цикл событий."""
+    with path.open('rb') as source:
+        while True:
+            chunk = await asyncio.to_thread(source.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+async def run_import(
+    args: argparse.Namespace, session_factory: async_sessionmaker,
+) -> schemas.CatImportResponse:
+    """Импорт файла из аргументов командной строки.
+
+    Args:
+        args (argparse.Namespace): аргументы parse_args
+        session_factory (async_sessionmaker): фабрика сессий primary
+
+    Returns:
+        schemas.CatImportResponse: итог импорта
+    """
+    return await cat_service.import_cats(
+        session_factory=session_factory,
+        chunks=read_chunks(args.path),
+        import_format=import_format(args.path, args.format),
+        batch_size=args.batch_size,
+        max_errors=settings.bulk.import_max_errors,
+    )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', type=Path)
+    parser.add_argument(
+        '--format', choices=[item.value for item in schemas.ImportFormat],
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=settings.bulk.import_batch_size,
+    )
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Импорт файла и вывод итога в stdout в виде JSON."""
+    try:
+        report = await run_import(args, session_factory)
+    except (OSError, ValueError) as exp:
+        print(exp, file=sys.stderr)  # noqa: WPS421
+        return 2
+    finally:
+        await engine.dispose()
+    print(dumps(report.model_dump(mode='json')).decode())  # noqa: WPS421
+    return 1 if report.rejected_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,176 @@
+"""Production-запуск приложения несколькими воркерами uvicorn.
+
+Пример:
+
+    python -m src.app.launcher --workers 4 --port 8000
+
+Параметры берутся из settings.server (APP_CONFIG__server__*), аргументы
+командной строки их переопределяют. --dry-run печатает итоговую
+конфигурацию без запуска.
+"""
+import argparse
+import importlib.util
+import os
+import sys
+from typing import Optional
+
+import uvicorn
+
+from src.app.core.settings import CacheConfig, PoolConfig, ServerConfig, settings
+
+APP = 'src.app.main:app'
+POOL_ENV_PREFIX = 'APP_CONFIG__psql__pool__'
+CACHE_BROADCAST_ENV = 'APP_CONFIG__cache__response_broadcast'
+# Соединения воркера вне пула SQLAlchemy: LISTEN ленты изменений.
+WORKER_EXTRA_CONNECTIONS = 1
+# И LISTEN рассылки инвалидаций кэша ответов, если она включена.
+BROADCAST_CONNECTIONS = 1
+
+
+def available_cpus() -> int:
+    """Количество CPU, доступных процессу (с учетом affinity/cgroup cpuset)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(server: ServerConfig, cpus: Optional[int] = None) -> int:
+    """Количество воркеров: из настроек или по числу CPU.
+
+    Args:
+        server (ServerConfig): настройки запуска
+        cpus (Optional[int]): число CPU (по умолчанию available_cpus)
+
+    Returns:
+        int: количество процессов uvicorn
+    """
+    if server.workers:
+        return server.workers
+    return max(cpus or available_cpus(), 1)
+
+
+def needs_cache_broadcast(cache: CacheConfig, workers: int) -> bool:
+    """Нужна ли рассылка инвалидаций: in-memory кэш ответов у каждого свой."""
+    return workers > 1 and cache.response_backend == 'memory'
+
+
+def worker_pool(
+    pool: PoolConfig,
+    server: ServerConfig,
+    workers: int,
+    extra_connections: int = WORKER_EXTRA_CONNECTIONS,
+) -> PoolConfig:
+    """Пул одного воркера, при котором все воркеры укладываются в лимит БД.
+
+    Из доли воркера вычитаются extra_connections соединений, которые он
+    открывает помимо пула (ChangeNotifier, рассылка инвалидаций).
+
+    Args:
+        pool (PoolConfig): настроенный пул
+        server (ServerConfig): настройки запуска с лимитом соединений
+        workers (int): количество воркеров
+        extra_connections (int): соединения воркера вне пула
+
+    Raises:
+        ValueError: если на воркер не остается ни одного соединения
+
+    Returns:
+        PoolConfig: пул с урезанными size и max_overflow
+    """
+    budget = (
+        server.db_max_connections - server.db_reserved_connections
+    ) // workers - extra_connections
+    if budget < 1:
+        raise ValueError(
+            f'{workers} воркеров не укладываются в '
+            f'{server.db_max_connections} соединений Postgres.',
+        )
+    size = min(pool.size, budget)
+    return pool.model_copy(update={
+        'size': size,
+        'max_overflow': min(pool.max_overflow, budget - size),
+    })
+
+
+def event_loop() -> str:
+    """uvloop, если установлен, иначе стандартный asyncio."""
+    return 'uvloop' if importlib.util.find_spec('uvloop') else 'asyncio'
+
+
+def http_protocol() -> str:
+    """httptools, если установлен, иначе h11."""
+    return 'httptools' if importlib.util.find_spec('httptools') else 'h11'
+
+
+def uvicorn_options(server: ServerConfig, workers: int) -> dict:
+    """Именованные аргументы uvicorn.run для production-профиля."""
+    return {
+        'host': server.host,
+        'port': server.port,
+        'workers': workers,
+        'loop': event_loop(),
+        'http': http_protocol(),
+        'backlog': server.backlog,
+        'timeout_keep_alive': server.keep_alive,
+        'limit_concurrency': server.limit_concurrency,
+        'timeout_graceful_shutdown': server.graceful_shutdown_timeout,
+        'access_log': server.access_log,
+        'proxy_headers': server.proxy_headers,
+    }
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default=None)
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--dry-run', action='store_true')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Расчет конфигурации и запуск воркеров."""
+    args = parse_args(argv)
+    server = settings.server.model_copy(update={
+        name: argument_value
+        for name, argument_value in (
+            ('host', args.host), ('port', args.port), ('workers', args.workers),
+        )
+        if argument_value is not None
+    })
+    workers = worker_count(server)
+    broadcast = needs_cache_broadcast(settings.cache, workers)
+    try:
+        pool = worker_pool(
+            settings.psql.pool,
+            server,
+            workers,
+            WORKER_EXTRA_CONNECTIONS + BROADCAST_CONNECTIONS * broadcast,
+        )
+    except ValueError as exp:
+        print(exp, file=sys.stderr)  # noqa: WPS421
+        return 2
+
+    # Воркеры - отдельные процессы: пул передается им через окружение;
+    # при одном воркере приложение импортируется в этом же процессе.
+    os.environ[f'{POOL_ENV_PREFIX}size'] = str(pool.size)
+    os.environ[f'{POOL_ENV_PREFIX}max_overflow'] = str(pool.max_overflow)
+    settings.psql.pool = pool
+    if broadcast:
+        os.environ[CACHE_BROADCAST_ENV] = 'true'
+        settings.cache.response_broadcast = True
+
+    options = uvicorn_options(server, workers)
+    print(  # noqa: WPS421
+        f"workers={workers} loop={options['loop']} http={options['http']} "
+        f'pool={pool.size}+{pool.max_overflow} cache_broadcast={broadcast}',
+    )
+    if args.dry_run:
+        return 0
+    uvicorn.run(APP, **options)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,91 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from src.app.api import system_handlers
 from src.app.api.cat_handlers import router
+from src.app.core import metrics
+from src.app.core.admission import AdmissionMiddleware, build_admission_controller
+from src.app.core.compression import CompressionMiddleware
+from src.app.core.lifecycle import InFlightMiddleware, lifecycle
+from src.app.core.rate_limit import RateLimitMiddleware, build_rate_limit_backend
+from src.app.core.settings import settings
+from src.app.models.db_helper import (
+    engine,
+    read_engine,
+    read_session_factory,
+    session_factory,
+)
+from src.app.service.cat import cat_service
+from src.app.service.cat_changes import change_notifier
+from src.app.service.warmup import warm_up
+
+
+async def begin_shutdown() -> None:
+    """Начало остановки: снятие готовности и закрытие лент изменений."""
+    lifecycle.ready = False
+    await change_notifier.close()
+
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Прогрев пулов до готовности, drain и закрытие пулов при остановке."""
+    warmed = [(engine, session_factory)]
+    if read_engine is not None:
+        warmed.append((read_engine, read_session_factory))
+    for warmed_engine, warmed_session_factory in warmed:
+        await warm_up(
+            warmed_engine,
+            warmed_session_factory,
+            connections=settings.lifespan.warmup_connections,
+            queries=settings.lifespan.warmup_queries,
+        )
+    await cat_service.response_cache.start()
+    lifecycle.ready = True
+    lifecycle.on_shutdown_signal(begin_shutdown)
+    yield
+    lifecycle.restore_signals()
+    # Без сигнала (или под другим сервером) остановка начинается здесь.
+    # Ленты изменений бесконечны: закрываем их до ожидания in-flight.
+    await begin_shutdown()
+    await lifecycle.drain(settings.lifespan.drain_timeout)
+    await cat_service.response_cache.close()
+    for disposed_engine, _ in warmed:
+        await disposed_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(router)
+app.include_router(system_handlers.router)
+app.include_router(system_handlers.probes_router)
+if settings.compression.enabled:
+    app.add_middleware(CompressionMiddleware, config=settings.compression)
+# Порядок обратный добавлению: лимит клиента проверяется до очереди admission.
+if settings.admission.enabled:
+    admission_controller = build_admission_controller(
+        settings.admission, settings.psql.pool,
+    )
+    app.add_middleware(
+        AdmissionMiddleware,
+        controller=admission_controller,
+        config=settings.admission,
+        path_prefix=settings.url.prefix,
+    )
+if settings.rate_limit.enabled:
+    app.add_middleware(
+        RateLimitMiddleware,
+        config=settings.rate_limit,
+        backend=build_rate_limit_backend(settings.rate_limit, settings.cache),
+        path_prefix=settings.url.prefix,
+    )
+app.add_middleware(InFlightMiddleware, lifecycle=lifecycle)
+
+if settings.metrics.enabled:
+    engines = {'primary': engine}
+    if read_engine is not None:
+        engines['replica'] = read_engine
+    for instrumented_engine in engines.values():
+        metrics.instrument_engine(instrumented_engine)
+    metrics.registry.register_collector(metrics.pool_metrics(engines))
+    app.add_middleware(metrics.MetricsMiddleware)
+    app.include_router(system_handlers.metrics_router)
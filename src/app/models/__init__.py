@@ -1,5 +1,5 @@
 # mypy: ignore-errors
-__all__ = ('Cat', 'Breed', 'Base')
+__all__ = ('Cat', 'Breed', 'BreedStats', 'BreedColorStats', 'CatChange', 'Base')
 
 from .base import Base
-from .models import Breed, Cat
+from .models import Breed, BreedColorStats, BreedStats, Cat, CatChange
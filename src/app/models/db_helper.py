@@ -1,19 +1,208 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio.engine import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.app.core.client import get_client_key
+from src.app.core.settings import PostgresConfig, settings
+
+READ_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время ожидания выдачи соединения."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_total = 0.0  # noqa: WPS358
+        self.wait_max = 0.0  # noqa: WPS358
+
+    def connect(self):  # noqa: D102
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+def engine_options(psql: PostgresConfig) -> dict:
+    """Параметры create_async_engine из настроек пула.
+
+    Args:
+        psql (PostgresConfig): настройки подключения к Postgres
+
+    Returns:
+        dict: именованные аргументы для create_async_engine
+    """
+    pool = psql.pool
+    server_settings = {}
+    if pool.statement_timeout_ms is not None:
+        server_settings['statement_timeout'] = str(pool.statement_timeout_ms)
+    return {
+        'poolclass': InstrumentedPool,
+        'pool_size': pool.size,
+        'max_overflow': pool.max_overflow,
+        'pool_timeout': pool.timeout,
+        'pool_recycle': pool.recycle,
+        'pool_pre_ping': pool.pre_ping,
+        'connect_args': {
+            'prepared_statement_cache_size': pool.prepared_statement_cache_size,
+            'server_settings': server_settings,
+        },
+    }
+
+
+def pool_stats(async_engine: AsyncEngine) -> dict:
+    """Текущее состояние пула соединений движка.
+
+    Args:
+        async_engine (AsyncEngine): движок
+
+    Returns:
+        dict: размер пула, выданные соединения, overflow и время ожидания
+    """
+    pool = async_engine.pool
+    checkouts = getattr(pool, 'checkouts', 0)
+    wait_total = getattr(pool, 'wait_total', 0.0)
+    return {
+        'size': pool.size(),
+        'checked_in': pool.checkedin(),
+        'checked_out': pool.checkedout(),
+        'overflow': pool.overflow(),
+        'checkouts': checkouts,
+        'wait_total_seconds': wait_total,
+        'wait_max_seconds': getattr(pool, 'wait_max', 0.0),
+        'wait_avg_seconds': wait_total / checkouts if checkouts else 0.0,
+    }
+
+
+class SessionRouter:
+    """Маршрутизация сессий: чтения на реплику, записи на primary.
 
-from src.app.core.settings import settings
+    Клиент, недавно выполнивший запись, читает с primary в течение
+    read_your_writes_seconds, чтобы увидеть свои изменения несмотря на
+    задержку репликации.
 
-engine = create_async_engine(url=settings.psql.url)
+    Время записей хранится в памяти процесса: гарантия действует, пока
+    запросы клиента попадают в один воркер. При нескольких воркерах
+    чтение после записи может уйти на реплику другим воркером.
+    """
 
-session_factory = async_sessionmaker(
-    bind=engine,
-    autoflush=False,
-    autocommit=False,
-    expire_on_commit=False,
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: Optional[async_sessionmaker],
+        read_your_writes_seconds: float,
+        max_clients: int = 100000,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.max_clients = max_clients
+        self._last_writes: OrderedDict[str, float] = OrderedDict()
+
+    def route(self, request: Request) -> async_sessionmaker:
+        """Фабрика сессий для запроса.
+
+        Args:
+            request (Request): входящий запрос
+
+        Returns:
+            async_sessionmaker: фабрика primary или реплики
+        """
+        if request.method not in READ_METHODS:
+            self.remember_write(request)
+            return self.primary
+        if self.replica is None or self.reads_own_writes(request):
+            return self.primary
+        return self.replica
+
+    def reads_own_writes(self, request: Request) -> bool:
+        """Читает ли клиент запроса с primary в окне read-your-writes."""
+        return (
+            self.replica is not None
+            and request.method in READ_METHODS
+            and self._wrote_recently(get_client_key(request))
+        )
+
+    def remember_write(self, request: Request) -> None:
+        """Отметка записи клиента для окна read-your-writes."""
+        if request.method in READ_METHODS:
+            return
+        client = get_client_key(request)
+        self._last_writes[client] = time.monotonic()
+        self._last_writes.move_to_end(client)
+        while len(self._last_writes) > self.max_clients:
+            self._last_writes.popitem(last=False)
+
+    def _wrote_recently(self, client: str) -> bool:
+        last_write = self._last_writes.get(client)
+        if last_write is None:
+            return False
+        if time.monotonic() - last_write < self.read_your_writes_seconds:
+            return True
+        del self._last_writes[client]  # noqa: WPS420
+        return False
+
+
+def make_session_factory(bind: AsyncEngine) -> async_sessionmaker:
+    """Фабрика сессий с настройками проекта."""
+    return async_sessionmaker(
+        bind=bind,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+    )
+
+
+engine = create_async_engine(url=settings.psql.url, **engine_options(settings.psql))
+session_factory = make_session_factory(engine)
+
+read_engine: Optional[AsyncEngine] = None
+read_session_factory: Optional[async_sessionmaker] = None
+if settings.psql.replica_url:
+    read_engine = create_async_engine(
+        url=settings.psql.replica_url, **engine_options(settings.psql),
+    )
+    read_session_factory = make_session_factory(read_engine)
+
+session_router = SessionRouter(
+    primary=session_factory,
+    replica=read_session_factory,
+    read_your_writes_seconds=settings.psql.read_your_writes_seconds,
 )
 
 
-async def get_db():
-    """Создание генератора сессий."""
-    async with session_factory() as session:
-        yield session
+async def get_db(request: Request):
+    """Создание генератора сессий (чтения на реплику, записи на primary)."""
+    async with session_router.route(request)() as session:
+        try:
+            yield session
+        finally:
+            session_router.remember_write(request)
         await session.close()
+
+
+async def get_session_factory(request: Request):
+    """Фабрика сессий для обработчиков, живущих дольше запроса (стриминг).
+
+    Запись отмечается и по завершении: импорт может длиться дольше окна
+    read-your-writes, отмеченного при его начале.
+    """
+    try:
+        yield session_router.route(request)
+    finally:
+        session_router.remember_write(request)
+
+
+def reads_own_writes(request: Request) -> bool:
+    """Читает ли клиент запроса с primary в окне read-your-writes."""
+    return session_router.reads_own_writes(request)
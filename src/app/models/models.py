@@ -1,4 +1,18 @@
-from sqlalchemy import ForeignKey, String
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.models.base import Base
@@ -14,6 +28,32 @@ class Cat(Base):
     description: Mapped[str] = mapped_column(String(), nullable=True)
     breed_id: Mapped[int] = mapped_column(ForeignKey('breed.id'))
     breed: Mapped['Breed'] = relationship(back_populates='cats')
+    version: Mapped[int] = mapped_column(server_default=text('1'))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(),
+    )
+    # Мягкое удаление: строка остается как tombstone для синхронизации.
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    # Вычисляется БД; отложена, чтобы не читаться при обычной загрузке Cat.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('russian', coalesce(description, ''))", persisted=True,
+        ),
+        deferred=True,
+    )
+
+    __mapper_args__ = {'version_id_col': version}  # noqa: WPS115
+    __table_args__ = (
+        # Покрывает фильтр по породе и keyset-сортировку по id внутри нее.
+        Index('ix_cat_breed_id_id', 'breed_id', 'id'),
+        Index('ix_cat_search_vector', 'search_vector', postgresql_using='gin'),
+        # Keyset-выборка изменений GET /cats?updated_since=.
+        Index('ix_cat_updated_at_id', 'updated_at', 'id'),
+    )
 
 
 class Breed(Base):
@@ -21,7 +61,65 @@ class Breed(Base):
 
     __tablename__ = 'breed'
 
-    name: Mapped[str] = mapped_column(String(100))
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     cats: Mapped[list['Cat']] = relationship(
         back_populates='breed',
     )
+    version: Mapped[int] = mapped_column(server_default=text('1'))
+
+    __mapper_args__ = {'version_id_col': version}  # noqa: WPS115
+
+
+class BreedStats(Base):
+    """Сводка по породе: количество кошек и сумма возрастов.
+
+    Поддерживается инкрементально в транзакциях записи кошек
+    (см. service.cat_stats).
+    """
+
+    __tablename__ = 'breed_stats'
+
+    breed_id: Mapped[int] = mapped_column(
+        ForeignKey('breed.id', ondelete='CASCADE'), unique=True,
+    )
+    cat_count: Mapped[int] = mapped_column(server_default=text('0'))
+    age_total: Mapped[int] = mapped_column(BigInteger, server_default=text('0'))
+
+
+class BreedColorStats(Base):
+    """Сводка по породе и окрасу: количество кошек."""
+
+    __tablename__ = 'breed_color_stats'
+
+    breed_id: Mapped[int] = mapped_column(ForeignKey('breed.id', ondelete='CASCADE'))
+    color: Mapped[str] = mapped_column(String(100))
+    cat_count: Mapped[int] = mapped_column(server_default=text('0'))
+
+    __table_args__ = (
+        UniqueConstraint('breed_id', 'color'),
+    )
+
+
+class CatChange(Base):
+    """Журнал изменений кошек (outbox) для ленты GET /cats/changes.
+
+    Пишется тем же запросом, что и изменение cat (см. service.cat_changes).
+    txid - транзакция записи: лента читается по (txid, id), чтобы событие
+    поздно зафиксированной транзакции не оказалось позади курсора.
+    """
+
+    __tablename__ = 'cat_change'
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    cat_id: Mapped[int]
+    operation: Mapped[str] = mapped_column(String(10))
+    txid: Mapped[int] = mapped_column(
+        BigInteger, server_default=text('pg_current_xact_id()::text::bigint'),
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(),
+    )
+
+    __table_args__ = (
+        Index('ix_cat_change_txid_id', 'txid', 'id'),
+    )
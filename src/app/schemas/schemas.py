@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
@@ -11,6 +12,53 @@ class Status(Enum):
     error = 'Error'
 
 
+class ExportFormat(Enum):
+    """Форматы потоковой выгрузки каталога."""
+
+    ndjson = 'ndjson'
+    json = 'json'
+
+
+class ImportFormat(Enum):
+    """Форматы импорта кошек."""
+
+    csv = 'csv'
+    ndjson = 'ndjson'
+
+
+class ChangeOperation(Enum):
+    """Операции в ленте изменений кошек."""
+
+    created = 'created'
+    updated = 'updated'
+    deleted = 'deleted'
+
+
+class CatField(Enum):
+    """Поля кошки, доступные для проекции списка (fields=)."""
+
+    id = 'id'  # noqa: WPS125
+    color = 'color'
+    age_in_months = 'age_in_months'
+    description = 'description'
+    breed = 'breed'
+
+
+class CatSortField(Enum):
+    """Поля сортировки списка кошек."""
+
+    id = 'id'  # noqa: WPS125
+    color = 'color'
+    age_in_months = 'age_in_months'
+
+
+class SortOrder(Enum):
+    """Направление сортировки."""
+
+    asc = 'asc'
+    desc = 'desc'
+
+
 class BaseCatResponse(BaseModel):
     """Базовая схема ответа."""
 
@@ -81,9 +129,155 @@ class CatListResponseModel(BaseModel):
     """Схема ответа список кошачих."""
 
     cats: List[CatBase]
+    next_cursor: Optional[str] = None
+
+
+class CatBatchResponseModel(BaseModel):
+    """Схема ответа выборки кошек по списку id."""
+
+    cats: List[CatBase]
+    missing: List[int] = []
+
+
+class CatListQuery(BaseModel):
+    """Фильтры, сортировка и проекция списка кошек."""
+
+    color: Optional[str] = None
+    min_age: Optional[int] = None
+    max_age: Optional[int] = None
+    breed_ids: Optional[List[int]] = None
+    sort: CatSortField = CatSortField.id
+    order: SortOrder = SortOrder.asc
+    fields: tuple[CatField, ...] = tuple(CatField)
+
+
+class CatTombstone(BaseModel):
+    """Удаленная кошка в ответе синхронизации."""
+
+    id: int
+    deleted_at: datetime
+
+
+class CatSyncResponseModel(BaseModel):
+    """Схема ответа синхронизации GET /cats?updated_since=.
+
+    После последней страницы (next_cursor пуст) следующая синхронизация
+    начинается с updated_until.
+    """
+
+    cats: list[CatBase]
+    deleted: list[CatTombstone]
+    next_cursor: Optional[str] = None
+    updated_until: datetime
 
 
 class BreedListResponseModel(BaseModel):
     """Схема ответа список пород."""
 
     breeds: list[BreedBase]
+
+
+class ColorStats(BaseModel):
+    """Количество кошек одного окраса."""
+
+    color: str
+    cat_count: int
+
+
+class BreedStatsModel(BaseModel):
+    """Сводка по одной породе."""
+
+    breed: BreedBase
+    cat_count: int
+    average_age_in_months: float
+    colors: List[ColorStats]
+
+
+class CatStatsResponseModel(BaseModel):
+    """Схема ответа сводки по породам."""
+
+    breeds: List[BreedStatsModel]
+
+
+class BulkCreateCatData(BaseModel):
+    """Схема данных пакетного создания объектов Cat."""
+
+    cats: List[CreateCatDataModel]
+
+
+class BulkUpdateCatItem(UpdateCatData):
+    """Схема данных обновления одного объекта Cat в пакете."""
+
+    id: int
+
+
+class BulkUpdateCatData(BaseModel):
+    """Схема данных пакетного обновления объектов Cat."""
+
+    cats: List[BulkUpdateCatItem]
+
+
+class BulkDeleteCatData(BaseModel):
+    """Схема данных пакетного удаления объектов Cat."""
+
+    ids: List[int]
+
+
+class BulkItemError(BaseModel):
+    """Ошибка обработки одного элемента пакета."""
+
+    index: int
+    id: Optional[int] = None
+    detail: str
+
+
+class BulkCatResponse(BaseCatResponse):
+    """Схема ответа пакетной операции над объектами Cat."""
+
+    ids: List[int] = []
+    errors: List[BulkItemError] = []
+
+
+class ImportRejectedRow(BaseModel):
+    """Отклоненная строка импорта."""
+
+    line: int
+    detail: str
+
+
+class CatImportResponse(BaseCatResponse):
+    """Схема ответа импорта кошек.
+
+    rejected содержит не больше import_max_errors первых отказов,
+    rejected_count - их общее число.
+    """
+
+    imported: int = 0
+    rejected_count: int = 0
+    rejected: List[ImportRejectedRow] = []
+
+
+class PoolStats(BaseModel):
+    """Состояние пула соединений."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    wait_total_seconds: float
+    wait_max_seconds: float
+    wait_avg_seconds: float
+
+
+class PoolStatsResponseModel(BaseModel):
+    """Схема ответа состояния пулов соединений."""
+
+    primary: PoolStats
+    replica: Optional[PoolStats] = None
+
+
+class ReadinessModel(BaseModel):
+    """Схема ответа проверки готовности."""
+
+    ready: bool
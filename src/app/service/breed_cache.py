@@ -0,0 +1,148 @@
+import asyncio
+import hashlib
+import time
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.app.models import Breed
+from src.app.schemas import schemas
+
+_BREEDS_CHANGED = 'breeds_changed'
+
+
+class BreedCache:
+    """In-memory кэш справочника пород с TTL и явной инвалидацией.
+
+    Таблица breed маленькая и почти не меняется, поэтому справочник целиком
+    держится в памяти процесса: список пород и отображения id -> name и
+    name -> id. Данные перечитываются из БД по истечении ttl или после
+    вызова invalidate().
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._breeds: list[schemas.BreedBase] = []
+        self._name_by_id: dict[int, str] = {}
+        self._id_by_name: dict[str, int] = {}
+        self._fingerprint = ''
+        self._loaded_at: Optional[float] = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        """Загружен ли справочник и не истек ли его TTL."""
+        if self._loaded_at is None:
+            return False
+        return time.monotonic() - self._loaded_at < self.ttl
+
+    def invalidate(self) -> None:
+        """Сброс справочника, следующий запрос перечитает его из БД."""
+        self._generation += 1
+        self._loaded_at = None
+
+    async def get_breeds(self, session: AsyncSession) -> list[schemas.BreedBase]:
+        """Список всех пород.
+
+        Args:
+            session (AsyncSession): асинхронная сессия для перезагрузки
+
+        Returns:
+            list[schemas.BreedBase]: породы в порядке id
+        """
+        await self._ensure_loaded(session)
+        return list(self._breeds)
+
+    async def get_id(self, session: AsyncSession, name: str) -> Optional[int]:
+        """Id породы по названию.
+
+        Args:
+            session (AsyncSession): асинхронная сессия для перезагрузки
+            name (str): название породы
+
+        Returns:
+            Optional[int]: id породы или None, если такой породы нет
+        """
+        await self._ensure_loaded(session)
+        return self._id_by_name.get(name)
+
+    async def get_name(self, session: AsyncSession, breed_id: int) -> Optional[str]:
+        """Название породы по id.
+
+        Args:
+            session (AsyncSession): асинхронная сессия для перезагрузки
+            breed_id (int): id породы
+
+        Returns:
+            Optional[str]: название породы или None, если такой породы нет
+        """
+        await self._ensure_loaded(session)
+        return self._name_by_id.get(breed_id)
+
+    async def get_fingerprint(self, session: AsyncSession) -> str:
+        """Отпечаток справочника, меняется при любом изменении пород.
+
+        Args:
+            session (AsyncSession): асинхронная сессия для перезагрузки
+
+        Returns:
+            str: хэш id, версий и названий пород
+        """
+        await self._ensure_loaded(session)
+        return self._fingerprint
+
+    async def _ensure_loaded(self, session: AsyncSession) -> None:
+        if self.is_fresh:
+            return
+        async with self._lock:
+            if self.is_fresh:
+                return
+            generation = self._generation
+            result_db = await session.execute(
+                select(Breed.id, Breed.name, Breed.version).order_by(Breed.id),
+            )
+            rows = result_db.all()
+
+            self._breeds = [
+                schemas.BreedBase(id=row.id, name=row.name) for row in rows
+            ]
+            self._name_by_id = {row.id: row.name for row in rows}
+            self._id_by_name = {row.name: row.id for row in rows}
+            self._fingerprint = hashlib.sha1(
+                repr([tuple(row) for row in rows]).encode(),
+                usedforsecurity=False,
+            ).hexdigest()[:16]
+            # Инвалидация во время загрузки: данные могли устареть.
+            if generation == self._generation:
+                self._loaded_at = time.monotonic()
+
+
+def invalidate_on_breed_writes(breed_cache: BreedCache) -> None:
+    """Подписка кэша на ORM-запись в таблицу breed.
+
+    Справочник сбрасывается после коммита транзакции, изменившей породы,
+    чтобы параллельная перезагрузка не закэшировала незакоммиченное
+    состояние.
+
+    Args:
+        breed_cache (BreedCache): кэш, который сбрасывается при записи
+    """
+
+    def _mark_changes(session, flush_context):  # noqa: WPS430
+        changed = (*session.new, *session.dirty, *session.deleted)
+        if any(isinstance(instance, Breed) for instance in changed):
+            session.info[_BREEDS_CHANGED] = True
+
+    def _invalidate(session):  # noqa: WPS430
+        if session.info.pop(_BREEDS_CHANGED, False):
+            breed_cache.invalidate()
+
+    def _forget_changes(session):  # noqa: WPS430
+        session.info.pop(_BREEDS_CHANGED, None)
+
+    event.listen(Session, 'after_flush', _mark_changes)
+    event.listen(Session, 'after_commit', _invalidate)
+    event.listen(Session, 'after_rollback', _forget_changes)
@@ -1,34 +1,116 @@
-from fastapi import HTTPException, status
-from sqlalchemy import select
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+
+import asyncpg
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import (
+    Integer,
+    String,
+    column,
+    func,
+    insert,
+    select,
+    union_all,
+    update,
+    values,
+)
 from sqlalchemy.engine import Result
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app.cache.backends import NullBackend
+from src.app.cache.response_cache import (
+    CATS_LIST_TAG,
+    ResponseCache,
+    breed_cats_tag,
+    build_response_cache,
+    cat_tag,
+)
+from src.app.core.serialization import dumps
+from src.app.core.settings import settings
 from src.app.models import Breed, Cat
+from src.app.models.db_helper import reads_own_writes
 from src.app.schemas import schemas
+from src.app.service.breed_cache import BreedCache, invalidate_on_breed_writes
+from src.app.service.cat_changes import (
+    ChangeNotifier,
+    change_log_cte,
+    format_event,
+    read_changes,
+    record_changes,
+    start_position,
+)
+from src.app.service.cat_import import PARSERS, copy_cats, validate_row
+from src.app.service.cat_loader import CatLoader
+from src.app.service.cat_query import (
+    ALL_FIELDS,
+    build_cat_list_statement,
+    build_cat_search_statement,
+    build_cat_sync_statement,
+    cat_row_to_dict,
+    cursor_key,
+    select_cat_rows,
+)
+from src.app.service.cat_stats import (
+    get_breed_stats,
+    record_stats_deltas,
+    row_deltas,
+    stats_upsert_ctes,
+)
+from src.app.service.pagination import decode_id_cursor, paginate
+from src.app.service.single_flight import SingleFlight, coalesced
+
+
+# id и колонки строки cat, от которых зависит сводка по породам.
+STATS_RETURNING = (Cat.id, Cat.breed_id, Cat.color, Cat.age_in_months)
 
 
 class CatService:
     """Сервис CRUD для работы с данными кошачих."""
 
-    async def get_all_cats(self, session: AsyncSession):
-        """Запрос всех кошек.
+    def __init__(
+        self,
+        breed_cache: BreedCache,
+        response_cache: ResponseCache,
+        single_flight: SingleFlight,
+    ):
+        self.breed_cache = breed_cache
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+
+    @coalesced
+    async def get_all_cats(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[schemas.CatListQuery] = None,
+    ):
+        """Запрос страницы кошек с фильтрами, сортировкой и проекцией.
+
+        Строки читаются кортежами только запрошенных колонок (см.
+        build_cat_list_statement) и сериализуются cat_row_to_dict без ORM
+        и pydantic.
 
         Args:
             session (AsyncSession): асинхронная сессия
+            limit (int): размер страницы
+            cursor (Optional[str]): курсор предыдущей страницы
+            query (Optional[schemas.CatListQuery]): фильтры, сортировка, поля
 
         Raises:
             HTTPException: Ошибка 404 если список пустой
 
         Returns:
-            list[Cat]: Список кошачих (Cat) из таблицы
+            tuple[list[Row], Optional[str]]: Страница строк кошек и курсор следующей
         """
-        stmt = select(Cat).options(selectinload(Cat.breed))
+        query = query or schemas.CatListQuery()
+        stmt = build_cat_list_statement(query, limit=limit, cursor=cursor)
         result_db: Result = await session.execute(statement=stmt)
 
         try:
-            cats = list(result_db.scalars().all())
+            cats = list(result_db.all())
         except SQLAlchemyError as exp:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -40,10 +122,10 @@ class CatService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail='Котята не найдены.',
             )
-        return cats
+        return paginate(cats, limit, key=cursor_key(query))
 
     async def get_all_breeds(self, session: AsyncSession):
-        """Запрос всех кошек.
+        """Запрос всех пород (из кэша справочника).
 
         Args:
             session (AsyncSession): асинхронная сессия
@@ -52,13 +134,10 @@ class CatService:
             HTTPException: Ошибка 404 если список пустой
 
         Returns:
-            list[Breed]: Список пород из таблицы Breed
+            list[schemas.BreedBase]: Список пород из таблицы Breed
         """
-        stmt = select(Breed)
-        result_db: Result = await session.execute(statement=stmt)
-
         try:
-            breeds = list(result_db.scalars().all())
+            breeds = await self.breed_cache.get_breeds(session)
         except SQLAlchemyError as exp:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -72,24 +151,119 @@ class CatService:
             )
         return breeds
 
-    async def get_cats_with_breed(self, session: AsyncSession, breed: str):
-        """Запрос всех кошек заданной породы.
+    def cat_loader(
+        self,
+        session: AsyncSession,
+        fields: tuple[schemas.CatField, ...] = ALL_FIELDS,
+    ) -> CatLoader:
+        """Пакетирующий загрузчик кошек по id на время одного запроса."""
+        return CatLoader(session, fields=fields)
+
+    async def get_cats_by_ids(
+        self,
+        session: AsyncSession,
+        cat_ids: list[int],
+        fields: tuple[schemas.CatField, ...] = ALL_FIELDS,
+    ):
+        """Запрос кошек по списку id одним запросом.
+
+        Args:
+            session (AsyncSession): асинхронная сессия
+            cat_ids (list[int]): id кошек без повторов
+            fields (tuple[schemas.CatField, ...]): поля ответа
+
+        Raises:
+            HTTPException: Ошибка 500 ошибка сервера
+
+        Returns:
+            tuple[list[Row], list[int]]: Найденные кошки в порядке cat_ids и
+                id, которых нет в БД
+        """
+        try:
+            rows = await self.cat_loader(session, fields).load_many(cat_ids)
+        except SQLAlchemyError as exp:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail='Возникла ошибка при получении кошек по id.',
+            ) from exp
+        cats = [row for row in rows if row is not None]
+        missing = [cat_id for cat_id, row in zip(cat_ids, rows) if row is None]
+        return cats, missing
+
+    async def get_cats_updated_since(
+        self,
+        session: AsyncSession,
+        updated_since: datetime,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: tuple[schemas.CatField, ...] = ALL_FIELDS,
+    ):
+        """Страница кошек, измененных или удаленных начиная с updated_since.
+
+        Верхняя граница updated_until - время БД минус settle_seconds; после
+        последней страницы клиент продолжает синхронизацию с нее.
+
+        Args:
+            session (AsyncSession): асинхронная сессия
+            updated_since (datetime): момент предыдущей синхронизации
+            limit (int): размер страницы
+            cursor (Optional[str]): курсор предыдущей страницы
+            fields (tuple[schemas.CatField, ...]): поля ответа
+
+        Returns:
+            tuple[list[Row], Optional[str], datetime]: строки (живые и
+                удаленные, с deleted_at), курсор следующей и updated_until
+        """
+        updated_until = await session.scalar(
+            select(func.now() - timedelta(seconds=settings.sync.settle_seconds)),
+        )
+        stmt = build_cat_sync_statement(
+            updated_since, updated_until, limit=limit, cursor=cursor, fields=fields,
+        )
+        result_db: Result = await session.execute(statement=stmt)
+        cats, next_cursor = paginate(
+            list(result_db.all()),
+            limit,
+            key=lambda cat: (cat.updated_at.isoformat(), cat.id),
+        )
+        return cats, next_cursor, updated_until
+
+    @coalesced
+    async def get_cats_with_breed(
+        self,
+        session: AsyncSession,
+        breed: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ):
+        """Запрос страницы кошек заданной породы.
 
         Args:
             session (AsyncSession): асинхронная сессия
             breed (str): название породы
+            limit (int): размер страницы
+            cursor (Optional[str]): курсор предыдущей страницы
 
         Raises:
             HTTPException: Ошибка 404 если породы нет
 
         Returns:
-            list[Cat]: Список Cat (кошек) заданной породы (breed)
+            tuple[list[Row], Optional[str]]: Страница строк кошек породы и курсор
         """
-        stmt = select(Cat).options(selectinload(Cat.breed)).join(Breed).where(Breed.name == breed)  # noqa: E501, WPS221
+        breed_id = await self.breed_cache.get_id(session, breed)
+        if breed_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='Порода отсутствуют.',
+            )
+
+        stmt = select_cat_rows().where(Cat.breed_id == breed_id).order_by(Cat.id).limit(limit + 1)  # noqa: E501
+        if cursor is not None:
+            stmt = stmt.where(Cat.id > decode_id_cursor(cursor))
         result_db: Result = await session.execute(statement=stmt)
 
         try:
-            cats = list(result_db.scalars().all())
+            cats = list(result_db.all())
         except SQLAlchemyError as exp:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -101,10 +275,82 @@ class CatService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail='Порода отсутствуют.',
             )
-        return cats
+        return paginate(cats, limit, key=lambda cat: (cat.id,))
+
+    @coalesced
+    async def search_cats(
+        self,
+        session: AsyncSession,
+        search_query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ):
+        """Полнотекстовый поиск кошек по описанию.
+
+        Args:
+            session (AsyncSession): асинхронная сессия
+            search_query (str): поисковая строка
+            limit (int): размер страницы
+            cursor (Optional[str]): курсор предыдущей страницы
+
+        Raises:
+            HTTPException: Ошибка 404 если ничего не найдено
+
+        Returns:
+            tuple[list[Row], Optional[str]]: Страница по убыванию ранга и курсор
+        """
+        stmt = build_cat_search_statement(search_query, limit=limit, cursor=cursor)
+        result_db: Result = await session.execute(statement=stmt)
+
+        try:
+            cats = list(result_db.all())
+        except SQLAlchemyError as exp:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail='Возникла ошибка при поиске котят.',
+            ) from exp
+
+        if not cats:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='Котята не найдены.',
+            )
+        return paginate(cats, limit, key=lambda cat: (cat.rank, cat.id))
+
+    @coalesced
+    async def get_cat_stats(self, session: AsyncSession):
+        """Сводка по породам: количество, средний возраст и окрасы.
 
+        Читается из сводных таблиц, которые поддерживаются при каждой
+        записи кошек, поэтому стоимость не зависит от числа кошек.
+
+        Args:
+            session (AsyncSession): асинхронная сессия
+
+        Raises:
+            HTTPException: Ошибка 404 если кошек нет
+
+        Returns:
+            list[dict]: сводка по каждой породе с кошками
+        """
+        try:
+            breeds = await get_breed_stats(session)
+        except SQLAlchemyError as exp:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail='Возникла ошибка при получении статистики.',
+            ) from exp
+
+        if not breeds:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='Котята не найдены.',
+            )
+        return breeds
+
+    @coalesced
     async def get_cats_with_id(self, session: AsyncSession, cat_id: int):
-        """Запрос кошки по id.
+        """Запрос кошки по id (строка колонок, см. select_cat_rows).
 
         Args:
             session (AsyncSession): асинхронная сессия
@@ -114,13 +360,13 @@ class CatService:
             HTTPException: Ошибка 404 если нет такой записи в БД
 
         Returns:
-            Cat: объект Cat по id из БД
+            Row: строка кошки с породой из БД
         """
-        stmt = select(Cat).where(Cat.id == cat_id).options(selectinload(Cat.breed))  # noqa: WPS221, E501
+        stmt = select_cat_rows().where(Cat.id == cat_id)
         result_db: Result = await session.execute(statement=stmt)
 
         try:
-            cat = result_db.scalars().first()
+            cat = result_db.first()
         except SQLAlchemyError as exp:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -134,10 +380,35 @@ class CatService:
             )
         return cat
 
+    @coalesced
+    async def get_cat_version(self, session: AsyncSession, cat_id: int):
+        """Запрос версий строк кошки и ее породы без загрузки объекта.
+
+        Args:
+            session (AsyncSession): асинхронная сессия
+            cat_id (int): id кошки в БД
+
+        Raises:
+            HTTPException: Ошибка 404 если нет такой записи в БД
+
+        Returns:
+            tuple[int, int, int]: версия кошки, id и версия породы
+        """
+        stmt = select(Cat.version, Cat.breed_id, Breed.version).join(Breed).where(Cat.id == cat_id, Cat.deleted_at.is_(None))  # noqa: E501, WPS221
+        result_db: Result = await session.execute(statement=stmt)
+
+        versions = result_db.first()
+        if versions is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='Такой кошки у нас нет.',
+            )
+        return tuple(versions)
+
     async def create_cat(
         self, session: AsyncSession, cat_data: schemas.CreateCatDataModel,
     ):
-        """Создает новую запись кошки в базе данных.
+        """Создает новую запись кошки одним запросом со сводкой и лентой.
 
         Args:
             session (AsyncSession): асинхронная сессия
@@ -150,11 +421,21 @@ class CatService:
             schemas.CreateCatResponse: статус запроса
         """
         try:  # noqa: WPS229
-            new_cat = Cat(**cat_data.model_dump())
-
-            session.add(new_cat)
+            changed = (
+                insert(Cat)
+                .values(**cat_data.model_dump())
+                .returning(*STATS_RETURNING)
+                .cte('changed')
+            )
+            await session.execute(select(changed.c.id).add_cte(
+                *stats_upsert_ctes(row_deltas(changed, 1).subquery('deltas')),
+                change_log_cte(changed, schemas.ChangeOperation.created),
+            ))
 
             await session.commit()
+            await self.response_cache.invalidate(
+                CATS_LIST_TAG, breed_cats_tag(cat_data.breed_id),
+            )
 
             return schemas.CreateCatResponse(
                 status=schemas.Status.success,
@@ -169,7 +450,10 @@ class CatService:
             ) from exp
 
     async def delete_cat(self, session: AsyncSession, cat_id: int):
-        """Удаление объекта Cat по id.
+        """Мягкое удаление кошки по id одним запросом вместе со сводкой.
+
+        Строка остается tombstone-ом с deleted_at для синхронизации по
+        updated_since; все чтения, кроме нее, удаленные строки не видят.
 
         Args:
             session (AsyncSession): асинхронная сессия
@@ -182,18 +466,19 @@ class CatService:
             schemas.DeleteCatResponse: статус запроса
         """
         async with session.begin():
-            stmt = select(Cat).where(Cat.id == cat_id)
+            changed = _soft_delete(Cat.id == cat_id)
+            stmt = select(changed.c.id).add_cte(
+                *stats_upsert_ctes(row_deltas(changed, -1).subquery('deltas')),
+                change_log_cte(changed, schemas.ChangeOperation.deleted),
+            )
             result_db = await session.execute(stmt)
 
-            cat = result_db.scalar_one_or_none()
-            if not cat:
+            if result_db.scalar_one_or_none() is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail='Кошка не найдена.',
                 )
-
-            await session.delete(cat)
-            await session.commit()
+        await self.response_cache.invalidate(cat_tag(cat_id))
         return schemas.DeleteCatResponse(
             status=schemas.Status.success,
             message="Запись удалена",
@@ -202,7 +487,10 @@ class CatService:
     async def update_cat(
         self, session: AsyncSession, cat_id: int, cat_data: schemas.UpdateCatData,
     ):
-        """Обновление объекта Cat по id.
+        """Обновление объекта Cat по id одним запросом вместе со сводкой.
+
+        Прежние значения читаются с FOR UPDATE в том же UPDATE ... FROM,
+        чтобы изменение сводки считалось от последней версии строки.
 
         Args:
             session (AsyncSession): асинхронная сессия
@@ -216,29 +504,499 @@ class CatService:
             schemas.UpdateCatResponse: статус запроса
         """
         async with session.begin():
-            stmt = select(Cat).where(Cat.id == cat_id)
-            result_db = await session.execute(stmt)
+            old = _locked_stats_rows(Cat.id == cat_id)
+            changed = (
+                update(Cat)
+                .where(Cat.id == old.c.id)
+                .values(**cat_data.model_dump(), version=Cat.version + 1)
+                .returning(*STATS_RETURNING, *_old_stats_columns(old))
+                .cte('changed')
+            )
+            result_db = await session.execute(_with_replaced_stats(changed))
 
-            cat = result_db.scalar_one_or_none()
-            if not cat:
+            if result_db.scalar_one_or_none() is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail='Кошка не найдена.',
                 )
-
-            for key, value in cat_data.model_dump().items():  # noqa: WPS110
-                setattr(cat, key, value)
-
-            await session.commit()
+        # Новые значения могут ввести кошку в отфильтрованные списки.
+        await self.response_cache.invalidate(
+            CATS_LIST_TAG, cat_tag(cat_id), breed_cats_tag(cat_data.breed_id),
+        )
         return schemas.UpdateCatResponse(
             status=schemas.Status.success,
             message="Запись обновлена",
         )
 
+    async def bulk_create_cats(
+        self, session: AsyncSession, cats: list[schemas.CreateCatDataModel],
+    ):
+        """Пакетное создание кошек одним INSERT в одной транзакции.
 
-cat_service = CatService()
+        Args:
+            session (AsyncSession): асинхронная сессия
+            cats (list[schemas.CreateCatDataModel]): данные новых записей
+
+        Raises:
+            HTTPException: Ошибка 413 если пакет больше допустимого
+
+        Returns:
+            schemas.BulkCatResponse: id созданных записей и ошибки по элементам
+        """
+        self._check_batch_size(len(cats))
+        errors: list[schemas.BulkItemError] = []
+        created_ids: list[int] = []
+        async with session.begin():
+            known_breeds = await self._existing_breed_ids(
+                session, {cat_data.breed_id for cat_data in cats},
+            )
+            rows = []
+            for index, cat_data in enumerate(cats):
+                if cat_data.breed_id not in known_breeds:
+                    errors.append(schemas.BulkItemError(
+                        index=index, detail='Порода не найдена.',
+                    ))
+                    continue
+                rows.append(cat_data.model_dump())
+
+            if rows:
+                stmt = insert(Cat).returning(Cat.id, sort_by_parameter_order=True)
+                result_db = await session.execute(stmt, rows)
+                created_ids = list(result_db.scalars().all())
+                await record_stats_deltas(session, (
+                    (row['breed_id'], row['color'], row['age_in_months'], 1)
+                    for row in rows
+                ))
+                await record_changes(
+                    session, created_ids, schemas.ChangeOperation.created,
+                )
+
+        await self.response_cache.invalidate(
+            CATS_LIST_TAG, *(breed_cats_tag(row['breed_id']) for row in rows),
+        )
+        return self._bulk_response(created_ids, errors, message='Записи созданы')
+
+    async def bulk_update_cats(
+        self, session: AsyncSession, cats: list[schemas.BulkUpdateCatItem],
+    ):
+        """Пакетное обновление кошек одним UPDATE ... FROM (VALUES ...).
+
+        Сводка обновляется тем же запросом, как в update_cat.
+
+        Args:
+            session (AsyncSession): асинхронная сессия
+            cats (list[schemas.BulkUpdateCatItem]): id и новые данные записей
+
+        Raises:
+            HTTPException: Ошибка 413 если пакет больше допустимого
+
+        Returns:
+            schemas.BulkCatResponse: id обновленных записей и ошибки по элементам
+        """
+        self._check_batch_size(len(cats))
+        errors: list[schemas.BulkItemError] = []
+        updated_ids: list[int] = []
+        async with session.begin():
+            known_breeds = await self._existing_breed_ids(
+                session, {cat_data.breed_id for cat_data in cats},
+            )
+            items: dict[int, tuple[int, schemas.BulkUpdateCatItem]] = {}
+            for index, cat_data in enumerate(cats):
+                if cat_data.id in items:
+                    errors.append(schemas.BulkItemError(
+                        index=index, id=cat_data.id, detail='Повтор id в пакете.',
+                    ))
+                elif cat_data.breed_id not in known_breeds:
+                    errors.append(schemas.BulkItemError(
+                        index=index, id=cat_data.id, detail='Порода не найдена.',
+                    ))
+                else:
+                    items[cat_data.id] = (index, cat_data)
+
+            if items:
+                data = values(
+                    column('id', Integer),
+                    column('color', String),
+                    column('age_in_months', Integer),
+                    column('description', String),
+                    column('breed_id', Integer),
+                    name='data',
+                ).data([
+                    (
+                        cat_data.id,
+                        cat_data.color,
+                        cat_data.age_in_months,
+                        cat_data.description,
+                        cat_data.breed_id,
+                    )
+                    for _, cat_data in items.values()
+                ])
+                old = _locked_stats_rows(Cat.id.in_(items))
+                changed = (
+                    update(Cat)
+                    .where(Cat.id == data.c.id, Cat.id == old.c.id)
+                    .values(
+                        color=data.c.color,
+                        age_in_months=data.c.age_in_months,
+                        description=data.c.description,
+                        breed_id=data.c.breed_id,
+                        version=Cat.version + 1,
+                    )
+                    .returning(*STATS_RETURNING, *_old_stats_columns(old))
+                    .cte('changed')
+                )
+                result_db = await session.execute(_with_replaced_stats(changed))
+                updated_ids = sorted(result_db.scalars().all())
+
+        updated = set(updated_ids)
+        errors.extend(
+            schemas.BulkItemError(index=index, id=cat_id, detail='Кошка не найдена.')
+            for cat_id, (index, _) in items.items()
+            if cat_id not in updated
+        )
+        await self.response_cache.invalidate(
+            CATS_LIST_TAG,
+            *(cat_tag(cat_id) for cat_id in updated_ids),
+            *(breed_cats_tag(items[cat_id][1].breed_id) for cat_id in updated_ids),
+        )
+        return self._bulk_response(updated_ids, errors, message='Записи обновлены')
+
+    async def bulk_delete_cats(self, session: AsyncSession, cat_ids: list[int]):
+        """Пакетное мягкое удаление кошек одним UPDATE ... RETURNING id.
+
+        Args:
+            session (AsyncSession): асинхронная сессия
+            cat_ids (list[int]): id удаляемых записей
+
+        Raises:
+            HTTPException: Ошибка 413 если пакет больше допустимого
+
+        Returns:
+            schemas.BulkCatResponse: id удаленных записей и ошибки по элементам
+        """
+        self._check_batch_size(len(cat_ids))
+        deleted_ids: list[int] = []
+        async with session.begin():
+            if cat_ids:
+                changed = _soft_delete(Cat.id.in_(cat_ids))
+                stmt = select(changed.c.id).add_cte(
+                    *stats_upsert_ctes(row_deltas(changed, -1).subquery('deltas')),
+                    change_log_cte(changed, schemas.ChangeOperation.deleted),
+                )
+                result_db = await session.execute(stmt)
+                deleted_ids = sorted(result_db.scalars().all())
+
+        deleted = set(deleted_ids)
+        errors = [
+            schemas.BulkItemError(index=index, id=cat_id, detail='Кошка не найдена.')
+            for index, cat_id in enumerate(cat_ids)
+            if cat_id not in deleted
+        ]
+        await self.response_cache.invalidate(
+            *(cat_tag(cat_id) for cat_id in deleted_ids),
+        )
+        return self._bulk_response(deleted_ids, errors, message='Записи удалены')
+
+    async def import_cats(
+        self,
+        session_factory: async_sessionmaker,
+        chunks: AsyncIterator[bytes],
+        import_format: schemas.ImportFormat,
+        batch_size: int,
+        max_errors: int,
+    ) -> schemas.CatImportResponse:
+        """Потоковый импорт кошек из CSV/NDJSON через COPY.
+
+        Строки проверяются по CreateCatDataModel и копятся в пакеты по
+        batch_size; каждый пакет - отдельная транзакция с COPY, сводкой и
+        лентой изменений. Некорректные строки и строки с неизвестной
+        породой отклоняются, не прерывая импорт; пакет, упавший при
+        загрузке, отклоняется целиком.
+
+        Args:
+            session_factory (async_sessionmaker): фабрика сессий primary
+            chunks (AsyncIterator[bytes]): тело запроса или файла частями
+            import_format (schemas.ImportFormat): csv или ndjson
+            batch_size (int): количество строк в пакете
+            max_errors (int): сколько первых отказов вернуть в ответе
+
+        Returns:
+            schemas.CatImportResponse: количество загруженных строк и отказы
+        """
+        response = schemas.CatImportResponse(
+            status=schemas.Status.success, message='Импорт завершен',
+        )
+        breed_ids: set[int] = set()
+
+        def reject(line_number: int, detail: str) -> None:  # noqa: WPS430
+            response.rejected_count += 1
+            if len(response.rejected) < max_errors:
+                response.rejected.append(
+                    schemas.ImportRejectedRow(line=line_number, detail=detail),
+                )
+
+        async def load(batch) -> None:  # noqa: WPS430
+            try:
+                loaded = await self._import_batch(session_factory, batch, reject)
+            except (SQLAlchemyError, asyncpg.PostgresError) as exp:
+                for line_number, _ in batch:
+                    reject(line_number, f'Пакет не загружен: {exp}')
+                return
+            response.imported += len(loaded)
+            breed_ids.update(loaded)
+
+        batch: list[tuple[int, schemas.CreateCatDataModel]] = []
+        async for line_number, row in PARSERS[import_format](chunks):
+            cat_data = validate_row(row) if isinstance(row, dict) else row
+            if isinstance(cat_data, str):
+                reject(line_number, cat_data)
+                continue
+            batch.append((line_number, cat_data))
+            if len(batch) >= batch_size:
+                await load(batch)
+                batch = []
+        if batch:
+            await load(batch)
+
+        await self.response_cache.invalidate(
+            CATS_LIST_TAG, *(breed_cats_tag(breed_id) for breed_id in breed_ids),
+        )
+        if response.rejected_count:
+            response.status = schemas.Status.error
+        return response
+
+    async def _import_batch(
+        self,
+        session_factory: async_sessionmaker,
+        batch: list[tuple[int, schemas.CreateCatDataModel]],
+        reject,
+    ) -> list[int]:
+        async with session_factory() as session, session.begin():
+            known_breeds = await self._existing_breed_ids(
+                session, {cat_data.breed_id for _, cat_data in batch},
+            )
+            cats = []
+            for line_number, cat_data in batch:
+                if cat_data.breed_id in known_breeds:
+                    cats.append(cat_data)
+                else:
+                    reject(line_number, 'Порода не найдена.')
+            if not cats:
+                return []
+            cat_ids = await copy_cats(session, cats)
+            await record_stats_deltas(session, (
+                (cat_data.breed_id, cat_data.color, cat_data.age_in_months, 1)
+                for cat_data in cats
+            ))
+            await record_changes(session, cat_ids, schemas.ChangeOperation.created)
+        return [cat_data.breed_id for cat_data in cats]
+
+    def _check_batch_size(self, size: int) -> None:
+        if size > settings.bulk.max_batch_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f'В пакете больше {settings.bulk.max_batch_size} записей.',
+            )
+
+    async def _existing_breed_ids(
+        self, session: AsyncSession, breed_ids: set[int],
+    ) -> set[int]:
+        if not breed_ids:
+            return set()
+        result_db = await session.execute(
+            select(Breed.id).where(Breed.id.in_(breed_ids)),
+        )
+        return set(result_db.scalars().all())
+
+    def _bulk_response(
+        self,
+        ids: list[int],
+        errors: list[schemas.BulkItemError],
+        message: str,
+    ) -> schemas.BulkCatResponse:
+        return schemas.BulkCatResponse(
+            status=schemas.Status.error if errors else schemas.Status.success,
+            message=message,
+            ids=ids,
+            errors=sorted(errors, key=lambda error: error.index),
+        )
+
+    async def export_cats(
+        self,
+        session_factory: async_sessionmaker,
+        export_format: schemas.ExportFormat,
+        batch_size: int,
+    ) -> AsyncIterator[bytes]:
+        """Потоковая выгрузка всего каталога кошек.
+
+        Строки читаются серверным курсором партиями по batch_size, поэтому
+        расход памяти ограничен размером партии, а первый байт уходит сразу.
+
+        Args:
+            session_factory (async_sessionmaker): фабрика сессий
+            export_format (schemas.ExportFormat): ndjson или json-массив
+            batch_size (int): количество строк в партии
+
+        Yields:
+            bytes: сериализованная партия строк
+        """
+        stmt = (
+            select_cat_rows()
+            .order_by(Cat.id)
+            .execution_options(yield_per=batch_size)
+        )
+        as_ndjson = export_format == schemas.ExportFormat.ndjson
+        separator = b'\n' if as_ndjson else b','
+        if not as_ndjson:
+            yield b'{"cats":['
+
+        async with session_factory() as session:
+            result = await session.stream(stmt)
+            is_first = True
+            async for partition in result.partitions():
+                chunk = separator.join(
+                    dumps(cat_row_to_dict(row)) for row in partition
+                )
+                if as_ndjson:
+                    chunk += b'\n'
+                elif not is_first:
+                    chunk = b',' + chunk
+                is_first = False
+                yield chunk
+
+        if not as_ndjson:
+            yield b']}'
+
+    async def change_position(
+        self, session_factory: async_sessionmaker, after: Optional[int],
+    ):
+        """Позиция начала ленты изменений.
+
+        Args:
+            session_factory (async_sessionmaker): фабрика сессий
+            after (Optional[int]): id последнего полученного события
+
+        Raises:
+            HTTPException: Ошибка 410 если события after нет в журнале
+
+        Returns:
+            ChangePosition: позиция для stream_changes
+        """
+        async with session_factory() as session:
+            position = await start_position(session, after)
+        if position is None:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail='Событие не найдено, перечитайте каталог целиком.',
+            )
+        return position
+
+    async def stream_changes(
+        self,
+        session_factory: async_sessionmaker,
+        notifier: ChangeNotifier,
+        position,
+        batch_size: int,
+        heartbeat: float,
+    ) -> AsyncIterator[bytes]:
+        """Лента изменений кошек в формате Server-Sent Events.
+
+        Журнал cat_change читается партиями после position; между
+        партиями лента ждет NOTIFY, но не дольше heartbeat, после чего
+        отправляет комментарий keep-alive и перечитывает журнал. Сессия
+        берется только на время чтения партии.
+
+        Args:
+            session_factory (async_sessionmaker): фабрика сессий
+            notifier (ChangeNotifier): источник уведомлений LISTEN
+            position (ChangePosition): позиция, после которой читать
+            batch_size (int): наибольшее количество событий в партии
+            heartbeat (float): наибольшее ожидание между чтениями, секунды
+
+        Yields:
+            bytes: события (id - номер для возобновления) и keep-alive
+        """
+        while not notifier.closed:
+            notified = notifier.event()
+            async with session_factory() as session:
+                changes = await read_changes(session, position, batch_size)
+            for change in changes:
+                yield format_event(change)
+            if changes:
+                position = (changes[-1].txid, changes[-1].id)
+            if len(changes) == batch_size:
+                continue
+            if not await notifier.wait(notified, heartbeat):
+                yield b': keep-alive\n\n'
+
+
+def _old_stats_columns(old) -> tuple:
+    """Прежние значения колонок сводки для RETURNING (префикс old_)."""
+    return (
+        old.c.breed_id.label('old_breed_id'),
+        old.c.color.label('old_color'),
+        old.c.age_in_months.label('old_age_in_months'),
+    )
+
+
+def _soft_delete(condition):
+    """CTE мягкого удаления живых строк cat с колонками сводки в RETURNING."""
+    return (
+        update(Cat)
+        .where(condition, Cat.deleted_at.is_(None))
+        .values(deleted_at=func.now(), version=Cat.version + 1)
+        .returning(*STATS_RETURNING)
+        .cte('changed')
+    )
+
+
+def _locked_stats_rows(condition):
+    """Прежние значения обновляемых живых строк cat, заблокированные FOR UPDATE."""
+    return (
+        select(*STATS_RETURNING)
+        .where(condition, Cat.deleted_at.is_(None))
+        .with_for_update()
+        .subquery('old')
+    )
+
+
+def _with_replaced_stats(changed):
+    """SELECT id из CTE UPDATE с переносом строк сводки old_* -> новые.
+
+    Событие updated в ленту изменений пишется тем же запросом.
+    """
+    deltas = union_all(
+        row_deltas(changed, -1, prefix='old_'), row_deltas(changed, 1),
+    ).subquery('deltas')
+    return select(changed.c.id).add_cte(
+        *stats_upsert_ctes(deltas),
+        change_log_cte(changed, schemas.ChangeOperation.updated),
+    )
+
+
+cat_service = CatService(
+    breed_cache=BreedCache(ttl=settings.cache.breed_ttl),
+    response_cache=build_response_cache(settings.cache, settings.psql),
+    single_flight=SingleFlight(enabled=settings.cache.single_flight),
+)
+invalidate_on_breed_writes(cat_service.breed_cache)
+
+
+# Кэш для клиентов в окне read-your-writes: ничего не отдает и не хранит.
+uncached_responses = ResponseCache(backend=NullBackend(), ttl=0)
 
 
 def get_cat_service() -> CatService:
     """Возращает экз. CatService."""
     return cat_service
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    """Кэш ответов для запроса.
+
+    Клиент в окне read-your-writes читает с primary мимо кэша: запись в
+    кэше могла быть вычислена на отстающей реплике до его изменения.
+    """
+    if reads_own_writes(request):
+        return uncached_responses
+    return cat_service.response_cache
@@ -0,0 +1,238 @@
+import asyncio
+from contextlib import suppress
+from typing import Iterable, Optional
+
+import asyncpg
+from sqlalchemy import (
+    CTE,
+    BigInteger,
+    FromClause,
+    Integer,
+    Text,
+    cast,
+    column,
+    func,
+    literal,
+    select,
+    tuple_,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.serialization import dumps
+from src.app.core.settings import PostgresConfig, settings
+from src.app.models import CatChange
+from src.app.schemas import schemas
+
+CHANGES_CHANNEL = 'cat_changes'
+
+# Позиция в ленте: (txid, id) последнего отданного события.
+ChangePosition = tuple[int, int]
+
+
+def change_log_cte(source: FromClause, operation: schemas.ChangeOperation) -> CTE:
+    """Запись событий в cat_change и NOTIFY тем же запросом, что и изменение.
+
+    Как и stats_upsert_ctes, CTE присоединяется к основному запросу через
+    add_cte. pg_notify с одинаковым payload в одной транзакции Postgres
+    доставляет один раз и только после фиксации.
+
+    Args:
+        source (FromClause): строки с колонкой id измененных кошек
+        operation (schemas.ChangeOperation): операция
+
+    Returns:
+        CTE: INSERT INTO cat_change ... RETURNING pg_notify(...)
+    """
+    log = insert(CatChange).from_select(
+        ['cat_id', 'operation'],
+        select(source.c.id, literal(operation.value)).order_by(source.c.id),
+    )
+    return log.returning(func.pg_notify(CHANGES_CHANNEL, '')).cte('cat_change_log')
+
+
+async def record_changes(
+    session: AsyncSession,
+    cat_ids: Iterable[int],
+    operation: schemas.ChangeOperation,
+) -> None:
+    """Запись событий для путей, где id известны после отдельного запроса.
+
+    Args:
+        session (AsyncSession): асинхронная сессия с открытой транзакцией
+        cat_ids (Iterable[int]): id измененных кошек
+        operation (schemas.ChangeOperation): операция
+    """
+    rows = [(cat_id,) for cat_id in cat_ids]
+    if not rows:
+        return
+    data = values(column('id', Integer), name='changed_ids').data(rows)
+    await session.execute(
+        select(literal(1)).add_cte(change_log_cte(data, operation)),
+    )
+
+
+def visible_horizon():
+    """txid, ниже которого все транзакции уже завершены (xmin снимка).
+
+    События с txid не меньше горизонта еще могут пополниться событиями
+    незавершенных транзакций с меньшим id, поэтому они не отдаются.
+    """
+    snapshot_xmin = func.pg_snapshot_xmin(func.pg_current_snapshot())
+    return cast(cast(snapshot_xmin, Text), BigInteger)
+
+
+async def start_position(
+    session: AsyncSession, after: Optional[int],
+) -> Optional[ChangePosition]:
+    """Позиция начала чтения ленты.
+
+    Args:
+        session (AsyncSession): асинхронная сессия
+        after (Optional[int]): id последнего полученного события; None -
+            только новые события, 0 - вся лента
+
+    Returns:
+        Optional[ChangePosition]: позиция или None, если события after нет
+    """
+    if after is None:
+        horizon = await session.scalar(select(visible_horizon()))
+        return (horizon, 0)
+    if after == 0:
+        return (0, 0)
+    row = (
+        await session.execute(
+            select(CatChange.txid, CatChange.id).where(CatChange.id == after),
+        )
+    ).first()
+    return tuple(row) if row is not None else None
+
+
+async def read_changes(
+    session: AsyncSession, position: ChangePosition, limit: int,
+) -> list[Row]:
+    """Следующие события после position в порядке (txid, id).
+
+    Args:
+        session (AsyncSession): асинхронная сессия
+        position (ChangePosition): позиция последнего отданного события
+        limit (int): наибольшее количество событий
+
+    Returns:
+        list[Row]: события с колонками id, cat_id, operation, txid, created_at
+    """
+    stmt = (
+        select(
+            CatChange.id,
+            CatChange.cat_id,
+            CatChange.operation,
+            CatChange.txid,
+            CatChange.created_at,
+        )
+        .where(
+            CatChange.txid < visible_horizon(),
+            tuple_(CatChange.txid, CatChange.id) > tuple_(*position),
+        )
+        .order_by(CatChange.txid, CatChange.id)
+        .limit(limit)
+    )
+    return list((await session.execute(stmt)).all())
+
+
+def format_event(change: Row) -> bytes:
+    """Событие ленты в формате Server-Sent Events."""
+    payload = dumps({
+        'id': change.id,
+        'cat_id': change.cat_id,
+        'operation': change.operation,
+        'created_at': change.created_at.isoformat(),
+    })
+    return b''.join((
+        f'id: {change.id}\nevent: {change.operation}\n'.encode(),
+        b'data: ', payload, b'\n\n',
+    ))
+
+
+class ChangeNotifier:
+    """LISTEN на канал ленты через отдельное соединение asyncpg.
+
+    Подписчик берет event() до чтения ленты и ждет его в wait(): если
+    NOTIFY пришел между чтением и ожиданием, wait вернется сразу. Без
+    соединения (БД недоступна) wait просто ждет таймаут, и лента
+    опрашивается раз в heartbeat.
+    """
+
+    def __init__(self, psql: PostgresConfig, channel: str = CHANGES_CHANNEL):
+        self.psql = psql
+        self.channel = channel
+        self.closed = False
+        self.notifications = 0
+        self._connection: Optional[asyncpg.Connection] = None
+        self._event = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    def event(self) -> asyncio.Event:
+        """Событие, которое будет выставлено следующим NOTIFY."""
+        return self._event
+
+    async def wait(self, event: asyncio.Event, timeout: float) -> bool:
+        """Ожидание NOTIFY или закрытия не дольше timeout.
+
+        Args:
+            event (asyncio.Event): событие, взятое до чтения ленты
+            timeout (float): таймаут в секундах
+
+        Returns:
+            bool: True, если пришло уведомление, False по таймауту
+        """
+        with suppress(OSError, asyncpg.PostgresError):
+            await self._listen()
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        return False
+
+    async def close(self) -> None:
+        """Остановка: открытые ленты завершаются, соединение закрывается."""
+        self.closed = True
+        self._wake()
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.close()
+
+    async def _listen(self) -> None:
+        async with self._lock:
+            if self.closed or self._connection is not None:
+                return
+            connection = await asyncpg.connect(
+                user=self.psql.user,
+                password=self.psql.password,
+                host=self.psql.host,
+                port=int(self.psql.port),
+                database=self.psql.db,
+            )
+            await connection.add_listener(self.channel, self._on_notification)
+            connection.add_termination_listener(self._on_termination)
+            self._connection = connection
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        self.notifications += 1
+        self._wake()
+
+    def _on_termination(self, connection) -> None:
+        self._connection = None
+        self._wake()
+
+    def _wake(self) -> None:
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+
+change_notifier = ChangeNotifier(settings.psql)
+
+
+def get_change_notifier() -> ChangeNotifier:
+    """Возвращает ChangeNotifier процесса."""
+    return change_notifier
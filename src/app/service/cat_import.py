@@ -0,0 +1,167 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Union
+
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import Cat
+from src.app.schemas import schemas
+
+IMPORT_COLUMNS = ('id', 'color', 'age_in_months', 'description', 'breed_id')
+COLOR_LENGTH = Cat.__table__.c.color.type.length
+
+# Номер строки входного файла и либо поля строки, либо причина отказа.
+ParsedRow = tuple[int, Union[dict, str]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Строки потока байтов UTF-8 без символов перевода строки."""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    pending = ''
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            yield line.removesuffix('\r')
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.removesuffix('\r')
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """Разбор NDJSON: один JSON-объект на строку, пустые строки пропускаются.
+
+    Args:
+        chunks (AsyncIterator[bytes]): тело запроса или файла частями
+
+    Yields:
+        ParsedRow: номер строки и объект или причина отказа
+    """
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_number, 'Некорректный JSON.'
+            continue
+        if not isinstance(row, dict):
+            yield line_number, 'Ожидается JSON-объект.'
+            continue
+        yield line_number, row
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """Разбор CSV с заголовком; пустое поле description - NULL.
+
+    Запись может занимать несколько строк файла, если перевод строки стоит
+    внутри кавычек; номер строки - первая строка записи.
+
+    Args:
+        chunks (AsyncIterator[bytes]): тело запроса или файла частями
+
+    Yields:
+        ParsedRow: номер строки и поля или причина отказа
+    """
+    header = None
+    record_lines: list[str] = []
+    record_start = line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not record_lines:
+            record_start = line_number
+        record_lines.append(line)
+        record = '\n'.join(record_lines)
+        # Внутри кавычек (нечетное их число) запись продолжается.
+        if record.count('"') % 2:
+            continue
+        record_lines = []
+        if not record.strip():
+            continue
+        fields = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        if len(fields) != len(header):
+            yield record_start, 'Число полей не совпадает с заголовком.'
+            continue
+        row = dict(zip(header, fields))
+        if row.get('description') == '':
+            row['description'] = None
+        yield record_start, row
+    if record_lines:
+        yield record_start, 'Незакрытые кавычки в конце файла.'
+
+
+PARSERS = {  # noqa: WPS407
+    schemas.ImportFormat.csv: parse_csv,
+    schemas.ImportFormat.ndjson: parse_ndjson,
+}
+
+
+def validate_row(row: dict) -> Union[schemas.CreateCatDataModel, str]:
+    """Проверка строки по CreateCatDataModel и ограничениям таблицы cat.
+
+    Args:
+        row (dict): поля строки
+
+    Returns:
+        Union[schemas.CreateCatDataModel, str]: данные кошки или причина отказа
+    """
+    try:
+        cat_data = schemas.CreateCatDataModel.model_validate(row)
+    except ValidationError as exp:
+        return '; '.join(
+            f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+            for error in exp.errors()
+        )
+    if len(cat_data.color) > COLOR_LENGTH:
+        return f'color: не длиннее {COLOR_LENGTH} символов'
+    if '\x00' in cat_data.color or '\x00' in (cat_data.description or ''):
+        return 'Строка содержит символ NUL.'
+    return cat_data
+
+
+async def copy_cats(
+    session: AsyncSession, cats: list[schemas.CreateCatDataModel],
+) -> list[int]:
+    """Загрузка проверенных кошек через COPY в транзакции сессии.
+
+    id берутся из последовательности заранее одним запросом: COPY не
+    возвращает строк, а id нужны для ленты изменений.
+
+    Args:
+        session (AsyncSession): асинхронная сессия с открытой транзакцией
+        cats (list[schemas.CreateCatDataModel]): кошки с существующими породами
+
+    Returns:
+        list[int]: id загруженных кошек в порядке cats
+    """
+    id_sequence = func.pg_get_serial_sequence(Cat.__tablename__, 'id')
+    cat_ids = list((await session.execute(
+        select(func.nextval(id_sequence)).select_from(
+            func.generate_series(1, len(cats)),
+        ),
+    )).scalars())
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        Cat.__tablename__,
+        records=[
+            (
+                cat_id,
+                cat_data.color,
+                cat_data.age_in_months,
+                cat_data.description,
+                cat_data.breed_id,
+            )
+            for cat_id, cat_data in zip(cat_ids, cats)
+        ],
+        columns=IMPORT_COLUMNS,
+    )
+    return cat_ids
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Iterable, Optional
+
+from sqlalchemy import Integer, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models import Cat
+from src.app.schemas import schemas
+from src.app.service.cat_query import ALL_FIELDS, select_cat_rows
+
+
+class CatLoader:
+    """Загрузчик кошек по id с пакетированием в духе DataLoader.
+
+    Вызовы load, сделанные до следующей итерации цикла событий,
+    собираются в один запрос WHERE id = ANY(:ids). Загрузчик живет в
+    пределах одного запроса: результаты запоминаются по id, а пакеты
+    выполняются на переданной сессии по очереди.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        fields: tuple[schemas.CatField, ...] = ALL_FIELDS,
+    ):
+        self.session = session
+        self.fields = fields
+        self.batches = 0
+        self._futures: dict[int, asyncio.Future] = {}
+        self._queue: list[int] = []
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, cat_id: int) -> asyncio.Future:
+        """Отложенная загрузка кошки по id.
+
+        Args:
+            cat_id (int): id кошки
+
+        Returns:
+            asyncio.Future: строка кошки или None, если кошки нет
+        """
+        future = self._futures.get(cat_id)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[cat_id] = future
+        self._queue.append(cat_id)
+        if len(self._queue) == 1:
+            task = loop.create_task(self._dispatch())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return future
+
+    async def load_many(self, cat_ids: Iterable[int]) -> list[Optional[Row]]:
+        """Загрузка кошек одним пакетом в порядке cat_ids."""
+        return list(await asyncio.gather(*(self.load(cat_id) for cat_id in cat_ids)))
+
+    async def _dispatch(self) -> None:
+        async with self._lock:
+            cat_ids, self._queue = self._queue, []
+            futures = [self._futures[cat_id] for cat_id in cat_ids]
+            stmt = select_cat_rows(self.fields).where(
+                Cat.id == any_(bindparam('ids', cat_ids, type_=ARRAY(Integer))),
+            )
+            try:
+                result_db = await self.session.execute(stmt)
+                rows = {row.id: row for row in result_db.all()}
+            except Exception as exp:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exp)
+                return
+            finally:
+                self.batches += 1
+            for cat_id, future in zip(cat_ids, futures):
+                if not future.done():
+                    future.set_result(rows.get(cat_id))
@@ -0,0 +1,319 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, and_, cast, func, literal, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from src.app.models import Breed, Cat
+from src.app.schemas import schemas
+from src.app.service.pagination import decode_cursor, decode_id_cursor, is_int4
+
+ALL_FIELDS = tuple(schemas.CatField)
+
+CAT_FIELD_COLUMNS = {  # noqa: WPS407
+    schemas.CatField.id: (Cat.id,),
+    schemas.CatField.color: (Cat.color,),
+    schemas.CatField.age_in_months: (Cat.age_in_months,),
+    schemas.CatField.description: (Cat.description,),
+    schemas.CatField.breed: (
+        Breed.id.label('breed_id'), Breed.name.label('breed_name'),
+    ),
+}
+
+CAT_FIELD_VALUES = {  # noqa: WPS407
+    schemas.CatField.id: lambda row: row.id,
+    schemas.CatField.color: lambda row: row.color,
+    schemas.CatField.age_in_months: lambda row: row.age_in_months,
+    schemas.CatField.description: lambda row: row.description,
+    schemas.CatField.breed: lambda row: {'id': row.breed_id, 'name': row.breed_name},
+}
+
+SORT_COLUMNS = {  # noqa: WPS407
+    schemas.CatSortField.id: Cat.id,
+    schemas.CatSortField.color: Cat.color,
+    schemas.CatSortField.age_in_months: Cat.age_in_months,
+}
+
+SEARCH_CONFIG = 'russian'
+
+SORT_VALUE_TYPES = {  # noqa: WPS407
+    schemas.CatSortField.color: str,
+    schemas.CatSortField.age_in_months: int,
+}
+
+
+def cat_row_to_dict(row, fields: tuple[schemas.CatField, ...] = ALL_FIELDS) -> dict:
+    """Преобразование строки (колонки Cat + Breed) в структуру CatBase.
+
+    Args:
+        row (Row): строка выборки select_cat_rows
+        fields (tuple[schemas.CatField, ...]): поля, попадающие в ответ
+
+    Returns:
+        dict: кошка (или ее проекция) из примитивов
+    """
+    return {field.value: CAT_FIELD_VALUES[field](row) for field in fields}
+
+
+def select_cat_rows(
+    fields: tuple[schemas.CatField, ...] = ALL_FIELDS,
+    include_deleted: bool = False,
+) -> Select:
+    """Запрос колонок Cat с породой одним JOIN, без построения ORM-объектов.
+
+    Args:
+        fields (tuple[schemas.CatField, ...]): выбираемые поля; JOIN с Breed
+            добавляется только если запрошена порода
+        include_deleted (bool): выбирать ли мягко удаленные строки
+
+    Returns:
+        Select: запрос кортежей колонок
+    """
+    columns = [
+        column_ for field in fields for column_ in CAT_FIELD_COLUMNS[field]
+    ]
+    stmt = select(*columns)
+    if schemas.CatField.breed in fields:
+        stmt = stmt.join(Breed)
+    if not include_deleted:
+        stmt = stmt.where(Cat.deleted_at.is_(None))
+    return stmt
+
+
+def parse_fields(raw_fields: Optional[str]) -> tuple[schemas.CatField, ...]:
+    """Разбор параметра fields= (имена полей через запятую).
+
+    Поле id попадает в ответ всегда: оно нужно для курсора и кэша.
+
+    Args:
+        raw_fields (Optional[str]): значение параметра запроса
+
+    Raises:
+        HTTPException: Ошибка 400 если поле неизвестно
+
+    Returns:
+        tuple[schemas.CatField, ...]: поля в порядке схемы CatBase
+    """
+    if not raw_fields:
+        return ALL_FIELDS
+    try:
+        requested = {
+            schemas.CatField(name.strip()) for name in raw_fields.split(',')
+        }
+    except ValueError as exp:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Неизвестное поле в параметре fields.',
+        ) from exp
+    requested.add(schemas.CatField.id)
+    return tuple(field for field in ALL_FIELDS if field in requested)
+
+
+def parse_ids(raw_ids: str, max_ids: int) -> list[int]:
+    """Разбор параметра ids= (id через запятую) без повторов.
+
+    Args:
+        raw_ids (str): значение параметра запроса
+        max_ids (int): наибольшее допустимое количество id
+
+    Raises:
+        HTTPException: Ошибка 400 если id некорректны, 413 если их слишком много
+
+    Returns:
+        list[int]: id в порядке первого упоминания
+    """
+    try:
+        cat_ids = [int(raw_id) for raw_id in raw_ids.split(',') if raw_id.strip()]
+    except ValueError as exp:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный список id.',
+        ) from exp
+    cat_ids = list(dict.fromkeys(cat_ids))
+    if not cat_ids or not all(is_int4(cat_id) for cat_id in cat_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный список id.',
+        )
+    if len(cat_ids) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f'Не больше {max_ids} id в запросе.',
+        )
+    return cat_ids
+
+
+def build_cat_list_statement(
+    query: schemas.CatListQuery, limit: int, cursor: Optional[str] = None,
+) -> Select:
+    """Один SELECT страницы кошек с фильтрами, сортировкой и проекцией.
+
+    Keyset-пагинация идет по паре (значение поля сортировки, id), поэтому
+    страницы стабильны и при неуникальном поле сортировки. Колонка
+    сортировки выбирается всегда, даже если ее нет в проекции.
+
+    Args:
+        query (schemas.CatListQuery): фильтры, сортировка и поля ответа
+        limit (int): размер страницы
+        cursor (Optional[str]): курсор предыдущей страницы
+
+    Returns:
+        Select: запрос страницы размером limit + 1
+    """
+    sort_column = SORT_COLUMNS[query.sort]
+    stmt = select_cat_rows(query.fields)
+    if query.sort.value not in {field.value for field in query.fields}:
+        stmt = stmt.add_columns(sort_column)
+    stmt = stmt.where(*_cat_filters(query))
+
+    descending = query.order == schemas.SortOrder.desc
+    if cursor is not None:
+        stmt = stmt.where(_after_cursor(query.sort, cursor, descending))
+    if descending:
+        order_by = (sort_column.desc(), Cat.id.desc())
+    else:
+        order_by = (sort_column.asc(), Cat.id.asc())
+    if query.sort == schemas.CatSortField.id:
+        order_by = order_by[:1]
+    return stmt.order_by(*order_by).limit(limit + 1)
+
+
+def cursor_key(query: schemas.CatListQuery):
+    """Значения ключа keyset-пагинации строки для курсора."""
+    if query.sort == schemas.CatSortField.id:
+        return lambda row: (row.id,)
+    return lambda row: (getattr(row, query.sort.value), row.id)
+
+
+def build_cat_search_statement(
+    search_query: str, limit: int, cursor: Optional[str] = None,
+) -> Select:
+    """SELECT страницы результатов полнотекстового поиска по описанию.
+
+    Запрос разбирается websearch_to_tsquery (кавычки, OR, минус), отбор
+    идет по GIN-индексу ix_cat_search_vector. Результаты упорядочены по
+    убыванию ts_rank_cd, при равном ранге - по id; курсор хранит пару
+    (ранг, id) последней записи.
+
+    Args:
+        search_query (str): поисковая строка
+        limit (int): размер страницы
+        cursor (Optional[str]): курсор предыдущей страницы
+
+    Raises:
+        HTTPException: Ошибка 400 если курсор поврежден
+
+    Returns:
+        Select: запрос страницы размером limit + 1 с колонкой rank
+    """
+    ts_query = func.websearch_to_tsquery(
+        cast(literal(SEARCH_CONFIG), REGCONFIG), search_query,
+    )
+    rank = func.ts_rank_cd(Cat.search_vector, ts_query)
+    stmt = (
+        select_cat_rows()
+        .add_columns(rank.label('rank'))
+        .where(Cat.search_vector.bool_op('@@')(ts_query))
+    )
+    if cursor is not None:
+        last_rank, last_id = decode_cursor(cursor, size=2)
+        if not _is_valid_cursor_value(last_rank, (int, float)) or not _is_valid_cursor_value(last_id, int):  # noqa: E501
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Некорректный курсор.',
+            )
+        stmt = stmt.where(or_(
+            rank < last_rank,
+            and_(rank == last_rank, Cat.id > last_id),
+        ))
+    return stmt.order_by(rank.desc(), Cat.id).limit(limit + 1)
+
+
+def build_cat_sync_statement(
+    updated_since: datetime,
+    updated_until: datetime,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: tuple[schemas.CatField, ...] = ALL_FIELDS,
+) -> Select:
+    """SELECT страницы кошек, измененных или удаленных в [since, until).
+
+    Удаленные строки (tombstones) выбираются вместе с живыми; порядок и
+    курсор - пара (updated_at, id) по индексу ix_cat_updated_at_id, так
+    что стоимость зависит от числа изменений, а не от размера таблицы.
+
+    Args:
+        updated_since (datetime): нижняя граница updated_at (включительно)
+        updated_until (datetime): верхняя граница updated_at (не включая)
+        limit (int): размер страницы
+        cursor (Optional[str]): курсор предыдущей страницы
+        fields (tuple[schemas.CatField, ...]): поля ответа
+
+    Raises:
+        HTTPException: Ошибка 400 если курсор поврежден
+
+    Returns:
+        Select: запрос страницы размером limit + 1 с updated_at и deleted_at
+    """
+    stmt = (
+        select_cat_rows(fields, include_deleted=True)
+        .add_columns(Cat.updated_at, Cat.deleted_at)
+        .where(Cat.updated_at >= updated_since, Cat.updated_at < updated_until)
+    )
+    if cursor is not None:
+        last_updated_at, last_id = decode_cursor(cursor, size=2)
+        try:
+            last_updated_at = datetime.fromisoformat(last_updated_at)
+        except (TypeError, ValueError) as exp:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Некорректный курсор.',
+            ) from exp
+        if not _is_valid_cursor_value(last_id, int):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Некорректный курсор.',
+            )
+        stmt = stmt.where(
+            tuple_(Cat.updated_at, Cat.id) > tuple_(last_updated_at, last_id),
+        )
+    return stmt.order_by(Cat.updated_at, Cat.id).limit(limit + 1)
+
+
+def _cat_filters(query: schemas.CatListQuery) -> list:
+    filters = []
+    if query.color is not None:
+        filters.append(Cat.color == query.color)
+    if query.min_age is not None:
+        filters.append(Cat.age_in_months >= query.min_age)
+    if query.max_age is not None:
+        filters.append(Cat.age_in_months <= query.max_age)
+    if query.breed_ids:
+        filters.append(Cat.breed_id.in_(query.breed_ids))
+    return filters
+
+
+def _after_cursor(sort: schemas.CatSortField, cursor: str, descending: bool):
+    if sort == schemas.CatSortField.id:
+        last_id = decode_id_cursor(cursor)
+        return Cat.id < last_id if descending else Cat.id > last_id
+
+    last_value, last_id = decode_cursor(cursor, size=2)
+    if not _is_valid_cursor_value(last_value, SORT_VALUE_TYPES[sort]) or not _is_valid_cursor_value(last_id, int):  # noqa: E501
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный курсор.',
+        )
+    key = tuple_(SORT_COLUMNS[sort], Cat.id)
+    if descending:
+        return key < tuple_(last_value, last_id)
+    return key > tuple_(last_value, last_id)
+
+
+def _is_valid_cursor_value(cursor_value: Any, expected_type) -> bool:
+    if isinstance(cursor_value, bool):
+        return False
+    if expected_type is int:
+        return is_int4(cursor_value)
+    return isinstance(cursor_value, expected_type)
@@ -0,0 +1,194 @@
+from typing import Iterable, Union
+
+from sqlalchemy import (
+    CTE,
+    FromClause,
+    Integer,
+    Select,
+    String,
+    column,
+    delete,
+    func,
+    literal,
+    select,
+    text,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.app.models import Breed, BreedColorStats, BreedStats, Cat
+
+StatsDelta = tuple[int, str, int, int]
+
+
+def row_deltas(source: FromClause, delta: int, prefix: str = '') -> Select:
+    """Изменения сводки по строкам source (например, RETURNING из CTE).
+
+    Args:
+        source (FromClause): строки с колонками breed_id, color, age_in_months
+        delta (int): +1 для добавленных строк, -1 для удаленных
+        prefix (str): префикс имен колонок (old_ для прежних значений)
+
+    Returns:
+        Select: строки breed_id, color, age_in_months, delta
+    """
+    return select(
+        source.c[f'{prefix}breed_id'].label('breed_id'),
+        source.c[f'{prefix}color'].label('color'),
+        source.c[f'{prefix}age_in_months'].label('age_in_months'),
+        literal(delta).label('delta'),
+    )
+
+
+def stats_upsert_ctes(deltas: FromClause) -> tuple[CTE, CTE]:
+    """Upsert-ы сводных таблиц по изменениям строк cat.
+
+    Изменения группируются по ключу сводки, поэтому каждая строка сводки
+    затрагивается один раз, и упорядочиваются по нему, чтобы конкурентные
+    записи блокировали строки сводки в одном порядке. CTE нужно
+    присоединить к основному запросу через add_cte: тогда сводка меняется
+    тем же SQL-запросом и в той же транзакции, что и таблица cat.
+
+    Args:
+        deltas (FromClause): строки breed_id, color, age_in_months и delta
+            (+1 для добавленной кошки, -1 для удаленной)
+
+    Returns:
+        tuple[CTE, CTE]: upsert-ы breed_stats и breed_color_stats
+    """
+    breed_insert = insert(BreedStats).from_select(
+        ['breed_id', 'cat_count', 'age_total'],
+        select(
+            deltas.c.breed_id,
+            func.sum(deltas.c.delta),
+            func.sum(deltas.c.delta * deltas.c.age_in_months),
+        ).group_by(deltas.c.breed_id).order_by(deltas.c.breed_id),
+    )
+    breed_upsert = breed_insert.on_conflict_do_update(
+        index_elements=[BreedStats.breed_id],
+        set_={
+            'cat_count': BreedStats.cat_count + breed_insert.excluded.cat_count,
+            'age_total': BreedStats.age_total + breed_insert.excluded.age_total,
+        },
+    )
+    color_insert = insert(BreedColorStats).from_select(
+        ['breed_id', 'color', 'cat_count'],
+        select(
+            deltas.c.breed_id, deltas.c.color, func.sum(deltas.c.delta),
+        )
+        .group_by(deltas.c.breed_id, deltas.c.color)
+        .order_by(deltas.c.breed_id, deltas.c.color),
+    )
+    color_upsert = color_insert.on_conflict_do_update(
+        index_elements=[BreedColorStats.breed_id, BreedColorStats.color],
+        set_={
+            'cat_count': (
+                BreedColorStats.cat_count + color_insert.excluded.cat_count
+            ),
+        },
+    )
+    return (
+        breed_upsert.cte('breed_stats_delta'),
+        color_upsert.cte('breed_color_stats_delta'),
+    )
+
+
+async def record_stats_deltas(
+    session: AsyncSession, deltas: Iterable[StatsDelta],
+) -> None:
+    """Применение известных заранее изменений к сводке одним запросом.
+
+    Для путей, где строки cat пишутся отдельным запросом (ORM-вставка,
+    пакетная вставка executemany); вызывается до фиксации транзакции.
+
+    Args:
+        session (AsyncSession): асинхронная сессия с открытой транзакцией
+        deltas (Iterable[StatsDelta]): (breed_id, color, age_in_months, delta)
+    """
+    rows = sorted(deltas)
+    if not rows:
+        return
+    data = values(
+        column('breed_id', Integer),
+        column('color', String),
+        column('age_in_months', Integer),
+        column('delta', Integer),
+        name='deltas',
+    ).data(rows)
+    await session.execute(select(literal(1)).add_cte(*stats_upsert_ctes(data)))
+
+
+async def get_breed_stats(session: AsyncSession) -> list[dict]:
+    """Сводка по породам из сводных таблиц, O(пород + окрасов).
+
+    Args:
+        session (AsyncSession): асинхронная сессия
+
+    Returns:
+        list[dict]: порода, количество кошек, средний возраст и окрасы
+    """
+    breed_rows = await session.execute(
+        select(Breed.id, Breed.name, BreedStats.cat_count, BreedStats.age_total)
+        .join(Breed)
+        .where(BreedStats.cat_count > 0)
+        .order_by(Breed.id),
+    )
+    color_rows = await session.execute(
+        select(
+            BreedColorStats.breed_id,
+            BreedColorStats.color,
+            BreedColorStats.cat_count,
+        )
+        .where(BreedColorStats.cat_count > 0)
+        .order_by(
+            BreedColorStats.breed_id,
+            BreedColorStats.cat_count.desc(),
+            BreedColorStats.color,
+        ),
+    )
+    colors: dict[int, list[dict]] = {}
+    for breed_id, color, color_count in color_rows:
+        colors.setdefault(breed_id, []).append(
+            {'color': color, 'cat_count': color_count},
+        )
+    return [
+        {
+            'breed': {'id': breed_id, 'name': name},
+            'cat_count': cat_count,
+            'average_age_in_months': age_total / cat_count,
+            'colors': colors.get(breed_id, []),
+        }
+        for breed_id, name, cat_count, age_total in breed_rows
+    ]
+
+
+async def rebuild_stats(session: Union[AsyncSession, AsyncConnection]) -> None:
+    """Полный пересчет сводных таблиц по живым (не удаленным) строкам cat.
+
+    Нужен после записи в cat в обход CatService (ручные правки, загрузка
+    данных). Запись в cat на время пересчета блокируется. Фиксация
+    транзакции остается за вызывающим.
+
+    Args:
+        session (Union[AsyncSession, AsyncConnection]): сессия или соединение
+    """
+    await session.execute(text('LOCK TABLE cat IN SHARE MODE'))
+    await session.execute(delete(BreedColorStats))
+    await session.execute(delete(BreedStats))
+    await session.execute(
+        insert(BreedStats).from_select(
+            ['breed_id', 'cat_count', 'age_total'],
+            select(Cat.breed_id, func.count(), func.sum(Cat.age_in_months))
+            .where(Cat.deleted_at.is_(None))
+            .group_by(Cat.breed_id),
+        ),
+    )
+    await session.execute(
+        insert(BreedColorStats).from_select(
+            ['breed_id', 'color', 'cat_count'],
+            select(Cat.breed_id, Cat.color, func.count())
+            .where(Cat.deleted_at.is_(None))
+            .group_by(Cat.breed_id, Cat.color),
+        ),
+    )
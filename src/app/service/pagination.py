@@ -0,0 +1,104 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+
+RowT = TypeVar('RowT')
+
+# Диапазон integer (int4) Postgres: значения вне него asyncpg не передаст.
+INT4_MIN = -2 ** 31
+INT4_MAX = 2 ** 31 - 1
+
+
+def is_int4(value: Any) -> bool:
+    """Целое (не bool) в диапазоне колонки integer."""
+    if not isinstance(value, int) or isinstance(value, bool):
+        return False
+    return INT4_MIN <= value <= INT4_MAX
+
+
+def encode_cursor(*values: Any) -> str:
+    """Упаковка значений ключа последней записи в непрозрачный курсор.
+
+    Args:
+        values (Any): значения ключа сортировки последней записи страницы
+
+    Returns:
+        str: курсор в виде base64url строки
+    """
+    raw = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int = 1) -> list[Any]:
+    """Распаковка курсора в значения ключа сортировки.
+
+    Args:
+        cursor (str): курсор, полученный в поле next_cursor
+        size (int): ожидаемое количество значений в курсоре
+
+    Raises:
+        HTTPException: Ошибка 400 если курсор поврежден
+
+    Returns:
+        list[Any]: значения ключа последней записи предыдущей страницы
+    """
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError) as exp:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный курсор.',
+        ) from exp
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный курсор.',
+        )
+    return values
+
+
+def decode_id_cursor(cursor: str) -> int:
+    """Распаковка курсора keyset-пагинации по id.
+
+    Args:
+        cursor (str): курсор, полученный в поле next_cursor
+
+    Raises:
+        HTTPException: Ошибка 400 если курсор поврежден
+
+    Returns:
+        int: id последней записи предыдущей страницы
+    """
+    last_id = decode_cursor(cursor)[0]
+    if not is_int4(last_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный курсор.',
+        )
+    return last_id
+
+
+def paginate(
+    rows: Sequence[RowT],
+    limit: int,
+    key: Callable[[RowT], tuple[Any, ...]],
+) -> tuple[list[RowT], Optional[str]]:
+    """Отрезание страницы из выборки размером limit + 1.
+
+    Args:
+        rows (Sequence): выборка, запрошенная с LIMIT limit + 1
+        limit (int): размер страницы
+        key (Callable): значения ключа сортировки записи для курсора
+
+    Returns:
+        tuple: записи страницы и курсор следующей страницы (или None)
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit:
+        return page, None
+    return page, encode_cursor(*key(page[-1]))
@@ -0,0 +1,89 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+ResultT = TypeVar('ResultT')
+
+
+class _LeaderCancelled(Exception):
+    """Ведущий вызов отменен; ожидающие должны повторить вызов сами."""
+
+
+class SingleFlight:
+    """Объединение одновременных одинаковых вызовов (single-flight).
+
+    Первый вызов с ключом выполняется, остальные вызовы с тем же ключом,
+    пришедшие до его завершения, ждут и получают его результат или
+    исключение. Завершенные вызовы не кэшируются: следующий вызов после
+    завершения снова идет в БД.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.shared = 0
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Выполнение fn или ожидание уже идущего вызова с тем же ключом.
+
+        Args:
+            key (Hashable): ключ вызова
+            fn (Callable): фабрика корутины вызова
+
+        Returns:
+            ResultT: результат fn (общий для объединенных вызовов)
+        """
+        if not self.enabled:
+            return await fn()
+
+        call = self._calls.get(key)
+        if call is not None:
+            self.shared += 1
+            try:
+                return await asyncio.shield(call)
+            except _LeaderCancelled:
+                return await self.do(key, fn)
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        try:
+            outcome = await fn()
+        except asyncio.CancelledError:
+            self._fail(call, _LeaderCancelled())
+            raise
+        except Exception as exp:
+            self._fail(call, exp)
+            raise
+        finally:
+            del self._calls[key]  # noqa: WPS420
+        call.set_result(outcome)
+        return outcome
+
+    def _fail(self, call: asyncio.Future, exp: BaseException) -> None:
+        call.set_exception(exp)
+        # Без ожидающих исключение никто не заберет: не логируем его.
+        call.exception()
+
+
+def coalesced(method: Callable[..., Awaitable[ResultT]]):
+    """Декоратор read-метода сервиса с атрибутом single_flight.
+
+    Ключ вызова - имя метода, движок сессии и аргументы кроме сессии:
+    запросы к основной БД и к реплике не объединяются.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, session, *args: Any, **kwargs: Any) -> ResultT:  # noqa: WPS430
+        key = (
+            method.__name__,
+            id(session.bind),
+            repr(args),
+            repr(sorted(kwargs.items())),
+        )
+        return await self.single_flight.do(
+            key, lambda: method(self, session, *args, **kwargs),
+        )
+
+    return wrapper
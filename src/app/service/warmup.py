@@ -0,0 +1,72 @@
+import asyncio
+from contextlib import suppress
+from typing import Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.app.core.settings import settings
+from src.app.service.cat import cat_service
+
+# Горячие read-запросы CatService. Параметры передаются bind-значениями,
+# поэтому SQL совпадает с боевым и попадает в кэш prepared statements.
+HOT_READS: tuple[Callable[[AsyncSession], Awaitable], ...] = (
+    lambda session: cat_service.get_all_cats(
+        session, limit=settings.pagination.default_limit,
+    ),
+    lambda session: cat_service.get_cats_with_id(session, 0),
+    lambda session: cat_service.get_cat_version(session, 0),
+    lambda session: cat_service.get_cats_by_ids(session, [0]),
+    lambda session: cat_service.get_cat_stats(session),
+)
+
+
+async def warm_up(
+    engine: AsyncEngine,
+    session_factory: async_sessionmaker,
+    connections: Optional[int] = None,
+    queries: bool = True,
+) -> int:
+    """Прогрев пула: открытие соединений и подготовка горячих запросов.
+
+    Соединения открываются одновременно и удерживаются до конца прогрева,
+    поэтому пул получает столько разных соединений, сколько запрошено. На
+    каждом выполняются HOT_READS: asyncpg кэширует prepared statements и
+    сведения о типах на соединение, а SQLAlchemy - скомпилированный SQL.
+
+    Args:
+        engine (AsyncEngine): прогреваемый движок
+        session_factory (async_sessionmaker): фабрика сессий движка
+        connections (Optional[int]): количество соединений (по умолчанию
+            pool.size, не больше pool.size + pool.max_overflow)
+        queries (bool): выполнять ли HOT_READS на каждом соединении
+
+    Returns:
+        int: количество прогретых соединений
+    """
+    pool = settings.psql.pool
+    if connections is None:
+        connections = pool.size
+    count = min(connections, pool.size + pool.max_overflow)
+    opened = [engine.connect() for _ in range(count)]
+    try:
+        await asyncio.gather(*(connection.start() for connection in opened))
+        if queries:
+            await asyncio.gather(*(
+                _run_hot_reads(session_factory, connection) for connection in opened
+            ))
+    finally:
+        await asyncio.gather(*(
+            connection.close()
+            for connection in opened
+            if connection.sync_connection is not None
+        ))
+    return count
+
+
+async def _run_hot_reads(session_factory: async_sessionmaker, connection) -> None:
+    async with session_factory(bind=connection) as session:
+        for hot_read in HOT_READS:
+            # Пустая БД (404) прогреву не мешает: запрос уже подготовлен.
+            with suppress(HTTPException):
+                await hot_read(session)
@@ -0,0 +1,118 @@
+"""Бенчмарк кодеков сжатия на теле списка кошек: байты и CPU.
+
+Пример:
+
+    python -m src.benchmarks.compression --list-size 1000 --rounds 50
+
+Доступны gzip и, если установлены пакеты brotli и zstandard, br и zstd.
+"""
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from src.app.core.compression import available_codecs
+from src.app.core.serialization import dumps
+from src.app.core.settings import CompressionConfig
+from src.benchmarks.micro import Benchmark
+
+DESCRIPTION = (
+    'Британская короткошерстная кошка с плотной шерстью и круглой мордой. '
+    'Спокойная, ласковая, хорошо ладит с детьми и другими животными.'
+)
+LEVELS = {  # noqa: WPS407
+    'gzip': (1, 6, 9),
+    'br': (1, 4, 11),
+    'zstd': (1, 3, 19),
+}
+
+
+def make_list_body(size: int) -> bytes:
+    """Тело страницы GET /cats с русскими описаниями."""
+    return dumps({
+        'cats': [
+            {
+                'id': index,
+                'color': ('серый', 'рыжий', 'черный')[index % 3],
+                'age_in_months': index % 240,
+                'description': f'{DESCRIPTION} Кличка: Кот {index}.',
+                'breed': {'id': index % 50, 'name': f'Порода {index % 50}'},
+            }
+            for index in range(size)
+        ],
+        'next_cursor': None,
+    })
+
+
+async def run_codec_benchmarks(
+    benchmark: Benchmark, body: bytes, levels: Optional[dict] = None,
+) -> dict[str, dict]:
+    """Замер сжатия body каждым доступным кодеком на нескольких уровнях.
+
+    Args:
+        benchmark (Benchmark): замеряющий объект
+        body (bytes): несжатое тело ответа
+        levels (Optional[dict]): уровни по имени кодека (по умолчанию LEVELS)
+
+    Returns:
+        dict[str, dict]: байты, степень сжатия и MB/s по имени замера
+    """
+    sizes = {}
+    for encoding, encoding_levels in (levels or LEVELS).items():
+        for level in encoding_levels:
+            config = CompressionConfig(
+                encodings=(encoding,),
+                gzip_level=level,
+                brotli_level=level,
+                zstd_level=level,
+            )
+            codec = available_codecs(config).get(encoding)
+            if codec is None:
+                continue
+            name = f'{encoding}_{level}'
+            compressed = await benchmark(name, codec.compress, body)
+            seconds = benchmark.results[name]['p50_ms'] / 1000
+            sizes[name] = {
+                'bytes': len(compressed),
+                'ratio': len(body) / len(compressed),
+                'mb_per_s': len(body) / seconds / 1e6 if seconds else 0.0,
+            }
+    return sizes
+
+
+def format_codec_table(results: dict[str, dict], sizes: dict[str, dict]) -> str:
+    """Таблица: байты на проводе и стоимость сжатия по кодекам."""
+    header = (
+        f"{'codec':<12}{'bytes':>12}{'ratio':>8}{'p50 ms':>10}"
+        f"{'p99 ms':>10}{'MB/s':>10}"
+    )
+    lines = [header, '-' * len(header)]
+    for name, size in sizes.items():
+        lines.append(
+            f"{name:<12}{size['bytes']:>12}{size['ratio']:>8.2f}"
+            f"{results[name]['p50_ms']:>10.2f}{results[name]['p99_ms']:>10.2f}"
+            f"{size['mb_per_s']:>10.1f}",
+        )
+    return '\n'.join(lines)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--list-size', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=50)
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Прогон бенчмарка кодеков."""
+    body = make_list_body(args.list_size)
+    benchmark = Benchmark(rounds=args.rounds)
+    sizes = await run_codec_benchmarks(benchmark, body)
+    print(f'identity: {len(body)} bytes')  # noqa: WPS421
+    print(format_codec_table(benchmark.results, sizes))  # noqa: WPS421
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,52 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.models import Base
+from src.app.service.cat_stats import rebuild_stats
+
+DESCRIPTIONS = (
+    'Молодая черная кошка',
+    'Персидская кошка с длинной шерстью',
+    'Британская короткошерстная кошка',
+    'Котенок Мейн-кун',
+)
+COLORS = ('черный', 'белый', 'серый', 'рыжий', 'голубой', 'коричневый')
+
+
+async def seed(engine: AsyncEngine, cats: int, breeds: int = 100) -> None:
+    """Пересоздание данных каталога заданного размера.
+
+    Таблицы cat и breed очищаются (сводка по породам пересчитывается),
+    поэтому функция предназначена только для отдельной БД нагрузочного
+    тестирования.
+
+    Args:
+        engine (AsyncEngine): движок БД
+        cats (int): количество кошек (10^3 - 10^6)
+        breeds (int): количество пород
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text('TRUNCATE cat, breed RESTART IDENTITY CASCADE'))
+        await conn.execute(text(
+            "INSERT INTO breed (name) "
+            "SELECT 'Порода ' || n FROM generate_series(1, :breeds) AS n",
+        ), {'breeds': breeds})
+        await conn.execute(text(
+            'INSERT INTO cat (breed_id, color, age_in_months, description) '
+            'SELECT 1 + n % :breeds, '
+            '(CAST(:colors AS text[]))[1 + n % :color_count], '
+            'n % 240, '
+            '(CAST(:descriptions AS text[]))[1 + n % :description_count] '
+            'FROM generate_series(1, :cats) AS n',
+        ), {
+            'breeds': breeds,
+            'cats': cats,
+            'colors': list(COLORS),
+            'color_count': len(COLORS),
+            'descriptions': list(DESCRIPTIONS),
+            'description_count': len(DESCRIPTIONS),
+        })
+        await rebuild_stats(conn)
+        await conn.execute(text('ANALYZE cat'))
+        await conn.execute(text('ANALYZE breed'))
@@ -0,0 +1,183 @@
+"""Нагрузочный генератор для эндпоинтов cat_handlers.
+
+Пример (отдельная БД, данные пересоздаются флагом --seed):
+
+    python -m src.benchmarks.loadgen --seed --cats 100000 --concurrency 50 \
+        --requests 2000 --save-baseline baseline.json
+
+    python -m src.benchmarks.loadgen --cats 100000 --baseline baseline.json
+
+Без --url запросы идут в ASGI-приложение в том же процессе, с --url - в
+запущенный сервер по HTTP.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+
+from src.app.core.settings import settings
+from src.benchmarks import stats
+
+Request = tuple[str, str, dict]
+Scenario = Callable[[random.Random, argparse.Namespace], Request]
+
+
+def _cat_payload(rng: random.Random, args: argparse.Namespace) -> dict:
+    return {
+        'color': rng.choice(('черный', 'белый', 'серый')),
+        'age_in_months': rng.randint(1, 240),
+        'description': 'Кошка из нагрузочного теста',
+        'breed_id': rng.randint(1, args.breeds),
+    }
+
+
+def _random_cat_id(rng: random.Random, args: argparse.Namespace) -> int:
+    return rng.randint(1, args.cats)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    'list_cats': lambda rng, args: ('GET', '/cats', {}),
+    'list_breeds': lambda rng, args: ('GET', '/cats/breeds', {}),
+    'cats_with_breed': lambda rng, args: (
+        'GET', f'/cats/breeds/Порода {rng.randint(1, args.breeds)}', {},
+    ),
+    'cat_info': lambda rng, args: (
+        'GET', f'/cats/{_random_cat_id(rng, args)}', {},
+    ),
+    'cats_by_ids': lambda rng, args: ('GET', '/cats', {'params': {
+        'ids': ','.join(str(_random_cat_id(rng, args)) for _ in range(20)),
+    }}),
+    'export': lambda rng, args: ('GET', '/cats/export', {}),
+    'stats': lambda rng, args: ('GET', '/cats/stats', {}),
+    'create_cat': lambda rng, args: (
+        'POST', '/cats', {'json': _cat_payload(rng, args)},
+    ),
+    'update_cat': lambda rng, args: (
+        'PATCH', f'/cats/{_random_cat_id(rng, args)}',
+        {'json': _cat_payload(rng, args)},
+    ),
+    'delete_cat': lambda rng, args: (
+        'DELETE', f'/cats/{_random_cat_id(rng, args)}', {},
+    ),
+    'bulk_create': lambda rng, args: (
+        'POST', '/cats/bulk',
+        {'json': {'cats': [_cat_payload(rng, args) for _ in range(100)]}},
+    ),
+}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    args: argparse.Namespace,
+    rng: random.Random,
+) -> dict:
+    """Прогон сценария замкнутым циклом из args.concurrency воркеров.
+
+    Args:
+        client (httpx.AsyncClient): HTTP-клиент
+        scenario (Scenario): генератор запросов сценария
+        args (argparse.Namespace): параметры прогона
+        rng (random.Random): генератор случайных чисел
+
+    Returns:
+        dict: сводка stats.summarize
+    """
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(args.requests))
+
+    async def worker():  # noqa: WPS430
+        nonlocal errors
+        for _ in remaining:
+            method, path, kwargs = scenario(rng, args)
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    method, f'{settings.url.prefix}{path}', **kwargs,
+                )
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 500:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return stats.summarize(latencies, time.perf_counter() - started, errors)
+
+
+def make_client(
+    url: Optional[str], disable_response_cache: bool,
+) -> httpx.AsyncClient:
+    """HTTP-клиент к серверу по url или к ASGI-приложению в процессе."""
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=60)
+
+    from src.app.cache.backends import NullBackend  # noqa: WPS433
+    from src.app.cache.response_cache import ResponseCache  # noqa: WPS433
+    from src.app.main import app  # noqa: WPS433
+    from src.app.service.cat import cat_service  # noqa: WPS433
+
+    if disable_response_cache:
+        cat_service.response_cache = ResponseCache(backend=NullBackend(), ttl=0)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url='http://bench', timeout=60,
+    )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cats', type=int, default=1000)
+    parser.add_argument('--breeds', type=int, default=100)
+    parser.add_argument('--seed', action='store_true', help='пересоздать данные')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument(
+        '--scenarios', default=','.join(SCENARIOS), help='через запятую',
+    )
+    parser.add_argument('--url', default=None)
+    parser.add_argument('--disable-response-cache', action='store_true')
+    parser.add_argument('--random-seed', type=int, default=0)
+    parser.add_argument('--save-baseline', type=Path, default=None)
+    parser.add_argument('--baseline', type=Path, default=None)
+    parser.add_argument('--tolerance', type=float, default=0.15)
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Прогон выбранных сценариев и сравнение с базовой линией."""
+    if args.seed:
+        from src.app.models.db_helper import engine  # noqa: WPS433
+        from src.benchmarks.dataset import seed  # noqa: WPS433
+
+        await seed(engine, cats=args.cats, breeds=args.breeds)
+
+    rng = random.Random(args.random_seed)
+    results = {}
+    async with make_client(args.url, args.disable_response_cache) as client:
+        for name in args.scenarios.split(','):
+            results[name] = await run_scenario(client, SCENARIOS[name], args, rng)
+
+    print(stats.format_table(results))  # noqa: WPS421
+    if args.save_baseline:
+        stats.save_baseline(args.save_baseline, results)
+    if args.baseline:
+        regressions = stats.compare(
+            results, stats.load_baseline(args.baseline), args.tolerance,
+        )
+        for regression in regressions:
+            print(f'REGRESSION {regression}')  # noqa: WPS421
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(parse_args())))
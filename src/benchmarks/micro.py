@@ -0,0 +1,198 @@
+"""Микробенчмарки методов CatService и сериализации CatListResponseModel.
+
+Пример:
+
+    python -m src.benchmarks.micro --seed --cats 100000 --rounds 200 \
+        --save-baseline micro.json
+"""
+import argparse
+import asyncio
+import inspect
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from src.app.core.serialization import dumps
+from src.app.models import Cat
+from src.app.schemas import schemas
+from src.app.service.cat_query import cat_row_to_dict
+from src.benchmarks import stats
+
+
+class Benchmark:
+    """Замер функции в духе фикстуры pytest-benchmark.
+
+    Вызов benchmark(name, fn, *args) выполняет прогрев, затем rounds
+    замеров и сохраняет сводку в results[name]; возвращает результат fn.
+    """
+
+    def __init__(self, rounds: int, warmup: int = 1):
+        self.rounds = rounds
+        self.warmup = warmup
+        self.results: dict[str, dict] = {}
+
+    async def __call__(self, name: str, fn: Callable, *args: Any, **kwargs: Any):
+        """Замер fn (синхронной или асинхронной)."""
+        outcome = None
+        for _ in range(self.warmup):
+            outcome = await self._call(fn, args, kwargs)
+
+        timings = []
+        for _ in range(self.rounds):  # noqa: WPS440
+            started = time.perf_counter()
+            outcome = await self._call(fn, args, kwargs)
+            timings.append(time.perf_counter() - started)
+        self.results[name] = stats.summarize(timings, sum(timings))
+        return outcome
+
+    async def _call(self, fn: Callable, args: tuple, kwargs: dict):
+        outcome = fn(*args, **kwargs)
+        if inspect.isawaitable(outcome):
+            outcome = await outcome
+        return outcome
+
+
+def make_cat_list(size: int) -> schemas.CatListResponseModel:
+    """Синтетический список кошек для замера сериализации."""
+    breed = schemas.BreedBase(id=1, name='Британская')
+    return schemas.CatListResponseModel(cats=[
+        schemas.CatBase(
+            id=index,
+            color='серый',
+            age_in_months=index % 240,
+            description='Британская короткошерстная кошка',
+            breed=breed,
+        )
+        for index in range(size)
+    ])
+
+
+async def run_serialization_benchmarks(benchmark: Benchmark, list_size: int) -> None:
+    """Замер сериализации CatListResponseModel в JSON."""
+    cat_list = make_cat_list(list_size)
+    await benchmark(f'serialize_{list_size}', cat_list.model_dump_json)
+
+
+async def orm_list_body(session: AsyncSession, limit: int) -> bytes:
+    """Тело списка кошек через ORM-объекты и CatListResponseModel.
+
+    Прежний путь списочных эндпоинтов: Cat + selectinload(Cat.breed)
+    (два запроса), валидация from_attributes и сериализация pydantic.
+    """
+    stmt = (
+        select(Cat)
+        .options(selectinload(Cat.breed))
+        .where(Cat.deleted_at.is_(None))
+        .order_by(Cat.id)
+        .limit(limit)
+    )
+    cats = (await session.execute(stmt)).scalars().all()
+    cat_list = schemas.CatListResponseModel.model_validate(
+        {'cats': cats}, from_attributes=True,
+    )
+    return cat_list.model_dump_json().encode()
+
+
+async def tuple_list_body(session: AsyncSession, limit: int) -> bytes:
+    """Тело списка кошек через кортежи колонок и dumps."""
+    from src.app.service.cat import cat_service  # noqa: WPS433
+
+    cats, next_cursor = await cat_service.get_all_cats(session=session, limit=limit)
+    return dumps({
+        'cats': [cat_row_to_dict(cat) for cat in cats],
+        'next_cursor': next_cursor,
+    })
+
+
+async def run_list_path_benchmarks(
+    benchmark: Benchmark, session_factory: async_sessionmaker, limit: int,
+) -> None:
+    """Сравнение ORM-пути и пути кортежей колонок для списка кошек."""
+    async with session_factory() as session:
+        await benchmark('list_orm_path', orm_list_body, session, limit)
+        session.expunge_all()
+        await benchmark('list_tuple_path', tuple_list_body, session, limit)
+
+
+async def run_service_benchmarks(
+    benchmark: Benchmark,
+    session_factory: async_sessionmaker,
+    limit: int,
+    breed: str,
+    cat_id: int,
+) -> None:
+    """Замер read-методов CatService на отдельной сессии."""
+    from src.app.service.cat import cat_service  # noqa: WPS433
+
+    async with session_factory() as session:
+        await benchmark(
+            'get_all_cats', cat_service.get_all_cats, session=session, limit=limit,
+        )
+        await benchmark(
+            'get_cats_with_breed',
+            cat_service.get_cats_with_breed,
+            session=session,
+            breed=breed,
+            limit=limit,
+        )
+        await benchmark(
+            'get_cats_with_id',
+            cat_service.get_cats_with_id,
+            session=session,
+            cat_id=cat_id,
+        )
+        await benchmark('get_all_breeds', cat_service.get_all_breeds, session=session)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cats', type=int, default=1000)
+    parser.add_argument('--breeds', type=int, default=100)
+    parser.add_argument('--seed', action='store_true', help='пересоздать данные')
+    parser.add_argument('--rounds', type=int, default=100)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--list-size', type=int, default=1000)
+    parser.add_argument('--save-baseline', type=Path, default=None)
+    parser.add_argument('--baseline', type=Path, default=None)
+    parser.add_argument('--tolerance', type=float, default=0.15)
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Прогон микробенчмарков и сравнение с базовой линией."""
+    from src.app.models.db_helper import engine, session_factory  # noqa: WPS433
+
+    if args.seed:
+        from src.benchmarks.dataset import seed  # noqa: WPS433
+
+        await seed(engine, cats=args.cats, breeds=args.breeds)
+
+    benchmark = Benchmark(rounds=args.rounds)
+    await run_serialization_benchmarks(benchmark, args.list_size)
+    await run_service_benchmarks(
+        benchmark, session_factory, limit=args.limit, breed='Порода 1', cat_id=1,
+    )
+    await run_list_path_benchmarks(benchmark, session_factory, limit=args.limit)
+    await engine.dispose()
+
+    print(stats.format_table(benchmark.results))  # noqa: WPS421
+    if args.save_baseline:
+        stats.save_baseline(args.save_baseline, benchmark.results)
+    if args.baseline:
+        regressions = stats.compare(
+            benchmark.results, stats.load_baseline(args.baseline), args.tolerance,
+        )
+        for regression in regressions:
+            print(f'REGRESSION {regression}')  # noqa: WPS421
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(parse_args())))
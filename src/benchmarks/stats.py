@@ -0,0 +1,106 @@
+import json
+import math
+from pathlib import Path
+from typing import Iterable
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list[float], quantile: float) -> float:
+    """Перцентиль по методу ближайшего ранга.
+
+    Args:
+        sorted_values (list[float]): отсортированные значения
+        quantile (float): перцентиль от 0 до 100
+
+    Returns:
+        float: значение перцентиля (0.0 для пустого списка)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(quantile / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def summarize(latencies: Iterable[float], elapsed: float, errors: int = 0) -> dict:
+    """Сводка замеров: перцентили задержки в мс и запросы в секунду.
+
+    Args:
+        latencies (Iterable[float]): задержки запросов в секундах
+        elapsed (float): общее время прогона в секундах
+        errors (int): число неуспешных запросов
+
+    Returns:
+        dict: count, errors, rps, mean_ms, p50_ms, p95_ms, p99_ms
+    """
+    sorted_values = sorted(latencies)
+    summary = {
+        'count': len(sorted_values),
+        'errors': errors,
+        'rps': len(sorted_values) / elapsed if elapsed > 0 else 0.0,
+        'mean_ms': (
+            sum(sorted_values) / len(sorted_values) * 1000 if sorted_values else 0.0
+        ),
+    }
+    for quantile in PERCENTILES:
+        summary[f'p{quantile}_ms'] = percentile(sorted_values, quantile) * 1000
+    return summary
+
+
+def save_baseline(path: Path, results: dict[str, dict]) -> None:
+    """Сохранение результатов прогона как базовой линии."""
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    """Загрузка базовой линии."""
+    return json.loads(path.read_text())
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float,
+) -> list[str]:
+    """Поиск регрессий относительно базовой линии.
+
+    Регрессия - рост p95 или p99 либо падение rps больше чем на tolerance.
+
+    Args:
+        results (dict): результаты текущего прогона по сценариям
+        baseline (dict): базовая линия по сценариям
+        tolerance (float): допустимое относительное отклонение (0.1 = 10%)
+
+    Returns:
+        list[str]: описания найденных регрессий
+    """
+    regressions = []
+    for scenario, summary in results.items():
+        reference = baseline.get(scenario)
+        if reference is None:
+            continue
+        for metric in ('p95_ms', 'p99_ms'):
+            if summary[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(
+                    f'{scenario}: {metric} {summary[metric]:.2f} > '
+                    f'{reference[metric]:.2f}',
+                )
+        if summary['rps'] < reference['rps'] * (1 - tolerance):
+            regressions.append(
+                f"{scenario}: rps {summary['rps']:.1f} < {reference['rps']:.1f}",
+            )
+    return regressions
+
+
+def format_table(results: dict[str, dict]) -> str:
+    """Таблица результатов для вывода в консоль."""
+    header = (
+        f"{'scenario':<24}{'count':>8}{'errors':>8}{'rps':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    lines = [header, '-' * len(header)]
+    for scenario, summary in results.items():
+        lines.append(
+            f"{scenario:<24}{summary['count']:>8}{summary['errors']:>8}"
+            f"{summary['rps']:>10.1f}{summary['p50_ms']:>10.2f}"
+            f"{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}",
+        )
+    return '\n'.join(lines)
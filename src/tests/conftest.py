@@ -1,30 +1,28 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from src.app.cache.backends import InMemoryLRUBackend
+from src.app.cache.response_cache import ResponseCache
 from src.app.core.settings import settings
 from src.app.main import app
 from src.app.models import Base, Breed, Cat
-from src.app.models.db_helper import get_db
+from src.app.models.db_helper import get_db, get_session_factory
+from src.app.service.cat import cat_service
 
 
 @pytest.fixture(scope="function")
-async def db_session():
-    """Создание новой сессии базы данных с откатом в конце теста."""
+async def db_engine():
+    """Движок тестовой базы данных со схемой на время теста."""
     # Создаем асинхронный движок для базы данных
     engine = create_async_engine(settings.psql.url)
 
-    # Создаем асинхронный sessionmaker для управления сессиями
-    async_session_factory = async_sessionmaker(
-        bind=engine, autocommit=False, autoflush=False, expire_on_commit=False,
-    )
-
     # Создаем таблицы в базе данных
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with async_session_factory() as session:
-        yield session  # Возвращаем сессию для использования в тестах
+    yield engine
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -32,6 +30,34 @@ async def db_session():
     await engine.dispose()
 
 
+@pytest.fixture(scope="function")
+def db_session_factory(db_engine):
+    """Асинхронный sessionmaker для управления сессиями."""
+    return async_sessionmaker(
+        bind=db_engine, autocommit=False, autoflush=False, expire_on_commit=False,
+    )
+
+
+@pytest.fixture(scope="function")
+async def db_session(db_session_factory):
+    """Создание новой сессии базы данных на время теста."""
+    async with db_session_factory() as session:
+        yield session  # Возвращаем сессию для использования в тестах
+
+
+@pytest.fixture(scope="function")
+def statement_log(db_engine):
+    """Журнал SQL-выражений, отправленных в БД во время теста."""
+    statements = []
+
+    def log_statement(conn, cursor, statement, *args):  # noqa: WPS430
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", log_statement)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", log_statement)
+
+
 @pytest.fixture(scope='function')
 def breed_name():
     """Название породы."""
@@ -84,6 +110,17 @@ def update_cat_payload():
     }
 
 
+@pytest.fixture(scope="function", autouse=True)
+def reset_caches(monkeypatch):
+    """Сброс in-process кэшей сервиса между тестами."""
+    cat_service.breed_cache.invalidate()
+    monkeypatch.setattr(
+        cat_service,
+        "response_cache",
+        ResponseCache(backend=InMemoryLRUBackend(), ttl=60),
+    )
+
+
 @pytest.fixture(scope="function", autouse=True)
 async def setup_database(db_session, cat_payload, breed_payload):
     """Инициализация базы данных перед тестами."""
@@ -105,16 +142,34 @@ async def setup_database(db_session, cat_payload, breed_payload):
 
 
 @pytest.fixture(scope="function")
-async def test_client(db_session):
+async def extra_cats(db_session, setup_database, cat_payload):
+    """Дополнительные кошки той же породы (всего 5 записей)."""
+    cats = [
+        Cat(
+            breed_id=1,
+            color=f"{cat_payload['color']} {index}",
+            age_in_months=index,
+            description=None,
+        )
+        for index in range(4)
+    ]
+    db_session.add_all(cats)
+    await db_session.commit()
+    return cats
+
+
+@pytest.fixture(scope="function")
+async def test_client(db_session, db_session_factory):
     """ТЕстовый клиент с переаписью зависимости бд."""
 
     async def override_get_db():  # noqa: WPS430
         try:  # noqa: WPS501
             yield db_session
         finally:
-            db_session.close()
+            await db_session.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: db_session_factory
     async with AsyncClient(
         app=app, base_url="http://test", timeout=10,
     ) as async_client:
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+
+from src.app.core.admission import AdmissionController, AdmissionMiddleware
+from src.app.core.settings import AdmissionConfig
+
+
+async def test_admission_controller_queue_and_timeout():
+    """Тест очереди: ожидание слота, отказ при полной очереди и по таймауту."""
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=1)
+    assert await controller.acquire()
+    assert controller.active == 1
+
+    queued = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.waiting == 1
+    assert not await controller.acquire()
+
+    controller.release()
+    assert await queued
+    assert controller.waiting == 0
+
+    controller.queue_timeout = 0.05
+    assert not await controller.acquire()
+    controller.release()
+    assert controller.active == 0
+
+
+@pytest.mark.api
+async def test_admission_middleware_sheds_overload():
+    """Тест 503 с Retry-After сверх лимита; исключенные пути не учитываются."""
+    released = asyncio.Event()
+    admitted_app = FastAPI()
+
+    @admitted_app.get("/api/slow")
+    async def slow():  # noqa: WPS430
+        await released.wait()
+        return {"done": True}
+
+    @admitted_app.get("/api/cats/changes")
+    async def changes():  # noqa: WPS430
+        return {"stream": True}
+
+    admitted_app.add_middleware(
+        AdmissionMiddleware,
+        controller=AdmissionController(
+            max_concurrent=1, max_queue=0, queue_timeout=1,
+        ),
+        config=AdmissionConfig(retry_after=2),
+        path_prefix="/api",
+    )
+    async with AsyncClient(app=admitted_app, base_url="http://test") as client:
+        slow_request = asyncio.create_task(client.get("/api/slow"))
+        await asyncio.sleep(0.05)
+
+        response = await client.get("/api/slow")
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "2"
+        response = await client.get("/api/cats/changes")
+        assert response.status_code == status.HTTP_200_OK
+
+        released.set()
+        assert (await slow_request).status_code == status.HTTP_200_OK
+        response = await client.get("/api/slow")
+        assert response.status_code == status.HTTP_200_OK
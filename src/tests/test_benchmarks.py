@@ -0,0 +1,97 @@
+import json
+import random
+
+import pytest
+
+from src.benchmarks import compression, loadgen, micro, stats
+
+
+def test_summarize_percentiles():
+    """Тест перцентилей и rps сводки."""
+    summary = stats.summarize([index / 1000 for index in range(1, 101)], elapsed=2)
+
+    assert summary["count"] == 100
+    assert summary["rps"] == 50
+    assert summary["p50_ms"] == pytest.approx(50)
+    assert summary["p95_ms"] == pytest.approx(95)
+    assert summary["p99_ms"] == pytest.approx(99)
+
+
+def test_compare_with_baseline(tmp_path):
+    """Тест поиска регрессий относительно сохраненной базовой линии."""
+    baseline = {"cat_info": stats.summarize([0.01] * 10, elapsed=1)}
+    stats.save_baseline(tmp_path / "baseline.json", baseline)
+    loaded = stats.load_baseline(tmp_path / "baseline.json")
+
+    assert not stats.compare(baseline, loaded, tolerance=0.1)
+    slower = {"cat_info": stats.summarize([0.02] * 10, elapsed=2)}
+    assert len(stats.compare(slower, loaded, tolerance=0.1)) == 3
+
+
+@pytest.mark.benchmark
+async def test_serialization_benchmark():
+    """Тест замера сериализации списка кошек."""
+    benchmark = micro.Benchmark(rounds=3)
+    await micro.run_serialization_benchmarks(benchmark, list_size=100)
+
+    assert benchmark.results["serialize_100"]["count"] == 3
+
+
+@pytest.mark.benchmark
+async def test_codec_benchmarks():
+    """Тест замера байтов и времени сжатия тела списка."""
+    body = compression.make_list_body(50)
+    benchmark = micro.Benchmark(rounds=2)
+    sizes = await compression.run_codec_benchmarks(
+        benchmark, body, levels={"gzip": (1, 9)},
+    )
+
+    assert set(sizes) == {"gzip_1", "gzip_9"}
+    assert sizes["gzip_9"]["bytes"] <= sizes["gzip_1"]["bytes"] < len(body)
+
+
+@pytest.mark.benchmark
+@pytest.mark.integration
+async def test_service_benchmarks(db_session_factory, extra_cats, breed_name, cat_id):
+    """Тест замеров read-методов CatService."""
+    benchmark = micro.Benchmark(rounds=3)
+    await micro.run_service_benchmarks(
+        benchmark, db_session_factory, limit=2, breed=breed_name, cat_id=cat_id,
+    )
+
+    assert set(benchmark.results) == {
+        "get_all_cats",
+        "get_cats_with_breed",
+        "get_cats_with_id",
+        "get_all_breeds",
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.integration
+async def test_list_path_benchmarks(db_session_factory, extra_cats):
+    """Тест совпадения тел ответа ORM-пути и пути кортежей колонок."""
+    async with db_session_factory() as session:
+        orm_body = await micro.orm_list_body(session, limit=10)
+        tuple_body = await micro.tuple_list_body(session, limit=10)
+    assert json.loads(orm_body) == json.loads(tuple_body)
+
+    benchmark = micro.Benchmark(rounds=3)
+    await micro.run_list_path_benchmarks(benchmark, db_session_factory, limit=10)
+    assert set(benchmark.results) == {"list_orm_path", "list_tuple_path"}
+
+
+@pytest.mark.benchmark
+@pytest.mark.integration
+async def test_load_generator(test_client, extra_cats):
+    """Тест прогона сценариев нагрузочного генератора через ASGI."""
+    # Тестовый клиент делит одну сессию между запросами: без конкуренции.
+    args = loadgen.parse_args(
+        ["--cats", "5", "--breeds", "1", "--requests", "12", "--concurrency", "1"],
+    )
+    for name in ("list_cats", "cat_info", "cats_with_breed", "update_cat"):
+        summary = await loadgen.run_scenario(
+            test_client, loadgen.SCENARIOS[name], args, random.Random(0),
+        )
+        assert summary["count"] == 12
+        assert summary["errors"] == 0
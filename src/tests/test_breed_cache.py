@@ -0,0 +1,60 @@
+import pytest
+from fastapi import status
+from sqlalchemy import text
+
+from src.app.models import Breed
+from src.app.service.breed_cache import BreedCache
+
+
+@pytest.mark.integration
+async def test_breed_cache_serves_from_memory(db_session, breed_name):
+    """Тест чтения справочника пород из памяти до истечения TTL."""
+    breed_cache = BreedCache(ttl=60)
+    breeds = await breed_cache.get_breeds(db_session)
+    assert [breed.name for breed in breeds] == [breed_name]
+
+    # Запись в обход ORM не видна, пока кэш не сброшен.
+    await db_session.execute(text("INSERT INTO breed (name) VALUES ('Сфинкс')"))
+    await db_session.commit()
+    assert await breed_cache.get_id(db_session, "Сфинкс") is None
+
+    breed_cache.invalidate()
+    assert await breed_cache.get_id(db_session, "Сфинкс") == 2
+    assert await breed_cache.get_name(db_session, 2) == "Сфинкс"
+
+
+@pytest.mark.integration
+async def test_breed_cache_expires(db_session):
+    """Тест перезагрузки справочника по истечении TTL."""
+    breed_cache = BreedCache(ttl=0)
+    await breed_cache.get_breeds(db_session)
+    assert not breed_cache.is_fresh
+
+    await db_session.execute(text("INSERT INTO breed (name) VALUES ('Сфинкс')"))
+    await db_session.commit()
+    assert await breed_cache.get_id(db_session, "Сфинкс") == 2
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_breeds_invalidated_on_orm_write(test_client, db_session):
+    """Тест сброса кэша сервиса после коммита новой породы."""
+    response = await test_client.get("/api/cats/breeds")
+    assert len(response.json()["breeds"]) == 1
+
+    db_session.add(Breed(name="Сфинкс"))
+    await db_session.commit()
+
+    response = await test_client.get("/api/cats/breeds")
+    assert response.status_code == status.HTTP_200_OK
+    assert [breed["name"] for breed in response.json()["breeds"]] == [
+        "Британский вислоухий", "Сфинкс",
+    ]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_cats_with_unknown_breed(test_client):
+    """Тест 404 для породы, которой нет в справочнике."""
+    response = await test_client.get("/api/cats/breeds/Неизвестная")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
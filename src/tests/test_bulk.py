@@ -0,0 +1,87 @@
+import pytest
+from fastapi import status
+
+from src.app.core.settings import settings
+from src.app.schemas import schemas
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_bulk_create(test_client, create_cat_payload):
+    """Тест пакетного создания с ошибкой по одному элементу."""
+    payload = {
+        "cats": [
+            create_cat_payload,
+            {**create_cat_payload, "breed_id": 100},
+            {**create_cat_payload, "color": "Белый"},
+        ],
+    }
+    response = await test_client.post("/api/cats/bulk", json=payload)
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response_json["status"] == schemas.Status.error.value
+    assert response_json["ids"] == [2, 3]
+    assert response_json["errors"] == [
+        {"index": 1, "id": None, "detail": "Порода не найдена."},
+    ]
+
+    response = await test_client.get("/api/cats/3")
+    assert response.json()["color"] == "Белый"
+    assert response.json()["breed"]["id"] == 1
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_bulk_update(test_client, extra_cats, update_cat_payload):
+    """Тест пакетного обновления с отсутствующей кошкой."""
+    payload = {
+        "cats": [
+            {**update_cat_payload, "id": 2},
+            {**update_cat_payload, "id": 100},
+            {**update_cat_payload, "id": 3, "color": "Белый"},
+        ],
+    }
+    etag = (await test_client.get("/api/cats/2")).headers["ETag"]
+    response = await test_client.request("PATCH", "/api/cats/bulk", json=payload)
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response_json["ids"] == [2, 3]
+    assert response_json["errors"] == [
+        {"index": 1, "id": 100, "detail": "Кошка не найдена."},
+    ]
+
+    response = await test_client.get("/api/cats/2")
+    assert response.json()["color"] == update_cat_payload["color"]
+    assert response.headers["ETag"] != etag
+    response = await test_client.get("/api/cats/3")
+    assert response.json()["color"] == "Белый"
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_bulk_delete(test_client, extra_cats):
+    """Тест пакетного удаления."""
+    response = await test_client.request(
+        "DELETE", "/api/cats/bulk", json={"ids": [1, 2, 100]},
+    )
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response_json["ids"] == [1, 2]
+    assert response_json["errors"][0]["id"] == 100
+
+    response = await test_client.get("/api/cats")
+    assert [cat["id"] for cat in response.json()["cats"]] == [3, 4, 5]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_bulk_batch_limit(test_client, monkeypatch):
+    """Тест ограничения размера пакета."""
+    monkeypatch.setattr(settings.bulk, "max_batch_size", 2)
+    response = await test_client.request(
+        "DELETE", "/api/cats/bulk", json={"ids": [1, 2, 3]},
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from src.app.service.cat_loader import CatLoader
+
+
+@pytest.mark.integration
+async def test_loads_are_batched(db_session, extra_cats, statement_log):
+    """Тест сбора одновременных загрузок в один запрос ANY(:ids)."""
+    loader = CatLoader(db_session)
+    statement_log.clear()
+
+    first, missing, last = await asyncio.gather(
+        loader.load(1), loader.load(999), loader.load(extra_cats[-1].id),
+    )
+    again = await loader.load(1)
+
+    assert first.id == 1
+    assert missing is None
+    assert last.id == extra_cats[-1].id
+    assert again is first
+    assert loader.batches == 1
+    assert len(statement_log) == 1
+    assert "ANY" in statement_log[0]
+
+
+@pytest.mark.integration
+async def test_load_many_keeps_order(db_session, extra_cats):
+    """Тест порядка результатов load_many и последовательных пакетов."""
+    loader = CatLoader(db_session)
+    cat_ids = [cat.id for cat in reversed(extra_cats)]
+
+    rows = await loader.load_many(cat_ids)
+    assert [row.id for row in rows] == cat_ids
+
+    await loader.load_many([1, 2])
+    assert loader.batches == 2
@@ -1,7 +1,12 @@
+import json
+
 import pytest
 from fastapi import status
 
+from src.app.core.settings import settings
+from src.app.main import app
 from src.app.schemas import schemas
+from src.app.service.pagination import encode_cursor
 
 
 @pytest.mark.api
@@ -94,3 +99,233 @@ async def test_update_cat(test_client, cat_id, update_cat_payload):
     assert response.status_code == status.HTTP_200_OK
     assert response_json["status"] == schemas.Status.success.value
     assert response_json["message"] == "Запись обновлена"
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_get_all_cats_pagination(test_client, extra_cats):
+    """Тест обхода списка кошачих по курсору."""
+    seen_ids = []
+    params = {"limit": 2}
+    while True:
+        response = await test_client.get("/api/cats", params=params)
+        response_json = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response_json["cats"]) <= 2
+        seen_ids.extend(cat["id"] for cat in response_json["cats"])
+        if response_json["next_cursor"] is None:
+            break
+        params["cursor"] = response_json["next_cursor"]
+
+    assert seen_ids == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_get_cats_with_breed_pagination(test_client, extra_cats, breed_name):
+    """Тест постраничной выдачи кошачих опред. породы."""
+    response = await test_client.get(
+        f"/api/cats/breeds/{breed_name}", params={"limit": 3},
+    )
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [cat["id"] for cat in response_json["cats"]] == [1, 2, 3]
+
+    response = await test_client.get(
+        f"/api/cats/breeds/{breed_name}",
+        params={"limit": 3, "cursor": response_json["next_cursor"]},
+    )
+    response_json = response.json()
+    assert [cat["id"] for cat in response_json["cats"]] == [4, 5]
+    assert response_json["next_cursor"] is None
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_get_all_cats_bad_cursor(test_client):
+    """Тест ответа на поврежденный курсор."""
+    response = await test_client.get("/api/cats", params={"cursor": "мусор"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await test_client.get("/api/cats", params={"limit": 0})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.api
+@pytest.mark.integration
+@pytest.mark.parametrize("params", [
+    {"cursor": encode_cursor(99999999999)},
+    {"cursor": encode_cursor(-2 ** 31 - 1)},
+    {"cursor": encode_cursor(10, 99999999999), "sort": "age_in_months"},
+    {"cursor": encode_cursor(99999999999, 1), "sort": "age_in_months"},
+])
+async def test_get_all_cats_cursor_out_of_int4(test_client, params):
+    """Тест: id в курсоре вне диапазона integer - 400, а не 500."""
+    response = await test_client.get("/api/cats", params=params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Некорректный курсор."
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_export_cats_ndjson(test_client, extra_cats, breed_payload):
+    """Тест потоковой выгрузки каталога в ndjson."""
+    response = await test_client.get("/api/cats/export")
+    lines = response.text.splitlines()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3, 4, 5]
+    assert json.loads(lines[0])["breed"]["name"] == breed_payload["name"]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_export_cats_json(test_client, extra_cats, monkeypatch):
+    """Тест потоковой выгрузки каталога json-массивом по партиям."""
+    monkeypatch.setattr(settings.export, "batch_size", 2)
+    response = await test_client.get("/api/cats/export", params={"format": "json"})
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [cat["id"] for cat in response_json["cats"]] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_get_all_cats_filters(test_client, extra_cats):
+    """Тест фильтров по цвету, возрасту и породе."""
+    response = await test_client.get(
+        "/api/cats", params={"min_age": 1, "max_age": 2, "breed_id": [1, 2]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [cat["age_in_months"] for cat in response.json()["cats"]] == [1, 2]
+
+    color = extra_cats[3].color
+    response = await test_client.get("/api/cats", params={"color": color})
+    assert [cat["color"] for cat in response.json()["cats"]] == [color]
+
+    response = await test_client.get("/api/cats", params={"breed_id": 2})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_get_all_cats_sort_pagination(test_client, extra_cats):
+    """Тест keyset-обхода по (возраст, id) в обратном порядке."""
+    seen = []
+    params = {
+        "limit": 2,
+        "sort": "age_in_months",
+        "order": "desc",
+        "fields": "age_in_months",
+    }
+    while True:
+        response = await test_client.get("/api/cats", params=params)
+        response_json = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(response_json["cats"])
+        if response_json["next_cursor"] is None:
+            break
+        params["cursor"] = response_json["next_cursor"]
+
+    ages = [cat["age_in_months"] for cat in seen]
+    assert ages == sorted(ages, reverse=True)
+    assert len({cat["id"] for cat in seen}) == 5
+    assert all(set(cat) == {"id", "age_in_months"} for cat in seen)
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_get_all_cats_projection(test_client):
+    """Тест проекции полей и отказа на неизвестное поле."""
+    response = await test_client.get("/api/cats", params={"fields": "color,breed"})
+    cat = response.json()["cats"][0]
+    assert list(cat) == ["id", "color", "breed"]
+    assert cat["breed"]["id"] == 1
+
+    response = await test_client.get("/api/cats", params={"fields": "owner"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_update_invalidates_filtered_list(
+    test_client, extra_cats, cat_id, update_cat_payload,
+):
+    """Тест сброса отфильтрованного списка, в который входит обновленная кошка."""
+    params = {"max_age": 3}
+    response = await test_client.get("/api/cats", params=params)
+    assert cat_id not in [cat["id"] for cat in response.json()["cats"]]
+
+    await test_client.patch(
+        f"/api/cats/{cat_id}", json={**update_cat_payload, "age_in_months": 2},
+    )
+    response = await test_client.get("/api/cats", params=params)
+    assert response.headers["X-Cache"] == "MISS"
+    assert cat_id in [cat["id"] for cat in response.json()["cats"]]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_search_cats(test_client, db_session, extra_cats):
+    """Тест полнотекстового поиска по описанию с ранжированием и курсором."""
+    extra_cats[0].description = "Персидская кошка, персидская шерсть"
+    extra_cats[1].description = "Персидский котенок"
+    extra_cats[2].description = "Британская кошка"
+    await db_session.commit()
+
+    response = await test_client.get(
+        "/api/cats/search", params={"q": "персидские", "limit": 1},
+    )
+    response_json = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert [cat["id"] for cat in response_json["cats"]] == [extra_cats[0].id]
+
+    params = {"q": "персидские", "limit": 1, "cursor": response_json["next_cursor"]}
+    response = await test_client.get("/api/cats/search", params=params)
+    response_json = response.json()
+    assert [cat["id"] for cat in response_json["cats"]] == [extra_cats[1].id]
+    assert response_json["next_cursor"] is None
+
+    response = await test_client.get("/api/cats/search", params={"q": "сиамская"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_get_cats_by_ids(test_client, extra_cats):
+    """Тест выборки по списку id с порядком запроса и отсутствующими id."""
+    response = await test_client.get(
+        "/api/cats", params={"ids": "4,999,1,4", "fields": "color"},
+    )
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [cat["id"] for cat in response_json["cats"]] == [4, 1]
+    assert list(response_json["cats"][0]) == ["id", "color"]
+    assert response_json["missing"] == [999]
+
+    response = await test_client.get("/api/cats", params={"ids": "1,abc"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.api
+@pytest.mark.parametrize("ids", ["99999999999", "1,-2147483649"])
+async def test_get_cats_by_ids_out_of_int4(test_client, ids):
+    """Тест: id вне диапазона integer - 400, а не ошибка базы."""
+    response = await test_client.get("/api/cats", params={"ids": ids})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Некорректный список id."
+
+
+def test_list_route_documents_batch_response():
+    """Тест: схема GET /cats описывает и ответ выборки по ids."""
+    operation = app.openapi()["paths"]["/api/cats"]["get"]
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    refs = {variant["$ref"].rsplit("/", 1)[-1] for variant in schema["anyOf"]}
+
+    assert {"CatListResponseModel", "CatBatchResponseModel"} <= refs
@@ -0,0 +1,141 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import status
+
+from src.app.core.settings import settings
+from src.app.main import app
+from src.app.schemas import schemas
+from src.app.service.cat import cat_service
+from src.app.service.cat_changes import (
+    ChangeNotifier,
+    get_change_notifier,
+    read_changes,
+    record_changes,
+)
+
+
+def parse_events(body: str) -> list[dict]:
+    """События SSE (поля id, event, data) без комментариев keep-alive."""
+    events = []
+    for block in body.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines()
+            if not line.startswith(":")
+        )
+        if fields:
+            events.append(fields)
+    return events
+
+
+@pytest.fixture(scope="function")
+async def changes(
+    db_session_factory, create_cat_payload, update_cat_payload, cat_id,
+):
+    """Журнал: создание, обновление и удаление кошки."""
+    async with db_session_factory() as session:
+        await cat_service.create_cat(
+            session, schemas.CreateCatDataModel(**create_cat_payload),
+        )
+    async with db_session_factory() as session:
+        await cat_service.update_cat(
+            session, cat_id, schemas.UpdateCatData(**update_cat_payload),
+        )
+    async with db_session_factory() as session:
+        await cat_service.delete_cat(session, cat_id)
+    async with db_session_factory() as session:
+        return await read_changes(session, (0, 0), limit=10)
+
+
+@pytest.fixture(scope="function")
+async def notifier():
+    """Отдельный ChangeNotifier на время теста."""
+    change_notifier = ChangeNotifier(settings.psql)
+    app.dependency_overrides[get_change_notifier] = lambda: change_notifier
+    yield change_notifier
+    await change_notifier.close()
+    app.dependency_overrides.pop(get_change_notifier)
+
+
+@pytest.fixture(scope="function")
+async def closing_notifier(notifier, monkeypatch):
+    """Notifier, закрываемый через 0.3 с: ASGI-клиент ждет конца ленты."""
+    monkeypatch.setattr(settings.changes, "heartbeat_seconds", 0.05)
+    closing = asyncio.get_running_loop().call_later(
+        0.3, lambda: asyncio.ensure_future(notifier.close()),
+    )
+    yield notifier
+    closing.cancel()
+
+
+@pytest.mark.integration
+async def test_writes_are_logged(changes, cat_id):
+    """Тест записи событий в журнал теми же транзакциями."""
+    assert [(change.cat_id, change.operation) for change in changes] == [
+        (2, "created"), (cat_id, "updated"), (cat_id, "deleted"),
+    ]
+
+
+@pytest.mark.integration
+async def test_uncommitted_change_holds_back_later_ones(db_session_factory, cat_id):
+    """Тест: событие поздно зафиксированной транзакции не теряется."""
+    async with db_session_factory() as early:
+        await record_changes(early, [100], schemas.ChangeOperation.updated)
+        async with db_session_factory() as session:
+            await cat_service.delete_cat(session, cat_id)
+        async with db_session_factory() as session:
+            assert not await read_changes(session, (0, 0), limit=10)
+        await early.commit()
+
+    async with db_session_factory() as session:
+        visible = await read_changes(session, (0, 0), limit=10)
+    assert [change.cat_id for change in visible] == [100, cat_id]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_changes_stream(test_client, changes, closing_notifier):
+    """Тест SSE-ленты со всего журнала и продолжения после события."""
+    response = await test_client.get("/api/cats/changes", params={"after": 0})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert ": keep-alive" in response.text
+    events = parse_events(response.text)
+    assert [event["event"] for event in events] == ["created", "updated", "deleted"]
+    assert [int(event["id"]) for event in events] == [
+        change.id for change in changes
+    ]
+    assert json.loads(events[0]["data"])["cat_id"] == 2
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_changes_resume(test_client, changes, closing_notifier):
+    """Тест продолжения по Last-Event-ID и 410 для неизвестного события."""
+    response = await test_client.get(
+        "/api/cats/changes", headers={"Last-Event-ID": str(changes[0].id)},
+    )
+    assert [int(event["id"]) for event in parse_events(response.text)] == [
+        change.id for change in changes[1:]
+    ]
+
+    response = await test_client.get("/api/cats/changes", params={"after": 10 ** 9})
+    assert response.status_code == status.HTTP_410_GONE
+
+
+@pytest.mark.integration
+async def test_notifier_wakes_on_commit(
+    db_session_factory, create_cat_payload, notifier,
+):
+    """Тест LISTEN/NOTIFY: ожидание завершается после фиксации записи."""
+    notified = notifier.event()
+    assert not await notifier.wait(notified, timeout=0.01)
+
+    async with db_session_factory() as session:
+        await cat_service.create_cat(
+            session, schemas.CreateCatDataModel(**create_cat_payload),
+        )
+    assert await notifier.wait(notified, timeout=5)
+    assert notifier.notifications == 1
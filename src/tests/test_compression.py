@@ -0,0 +1,224 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import StreamingResponse
+
+from src.app.core.compression import CompressionMiddleware, ZstdCodec, negotiate
+from src.app.core.settings import CompressionConfig, settings
+from src.app.main import app
+
+ENCODINGS = ("zstd", "br", "gzip")
+
+
+@pytest.mark.parametrize(("accept_encoding", "expected"), [
+    ("gzip, deflate", "gzip"),
+    ("br;q=0.5, gzip;q=0.8", "gzip"),
+    ("gzip, br", "br"),
+    ("*", "zstd"),
+    ("*, zstd;q=0", "br"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiate(accept_encoding, expected):
+    """Тест выбора кодировки по q и порядку предпочтения сервера."""
+    assert negotiate(accept_encoding, ENCODINGS) == expected
+
+
+@pytest.mark.api
+@pytest.mark.integration
+@pytest.mark.parametrize("offload_size", [0, 1 << 20])
+async def test_list_response_is_gzipped(
+    test_client, extra_cats, monkeypatch, offload_size,
+):
+    """Тест сжатия списка (в цикле событий и в пуле потоков)."""
+    monkeypatch.setattr(settings.compression, "minimum_size", 100)
+    monkeypatch.setattr(settings.compression, "offload_size", offload_size)
+    plain = await test_client.get(
+        "/api/cats", headers={"Accept-Encoding": "identity"},
+    )
+    response = await test_client.get(
+        "/api/cats", headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "content-encoding" not in plain.headers
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(plain.content)
+    assert response.json() == plain.json()
+
+
+@pytest.mark.api
+async def test_small_response_is_not_compressed(test_client, cat_id):
+    """Тест порога minimum_size."""
+    response = await test_client.get(
+        f"/api/cats/{cat_id}", headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.api
+async def test_compressed_response_has_weak_etag(test_client, cat_id, monkeypatch):
+    """Тест: у сжатого тела слабый ETag, Vary есть и у 304."""
+    monkeypatch.setattr(settings.compression, "minimum_size", 1)
+    plain = await test_client.get(
+        f"/api/cats/{cat_id}", headers={"Accept-Encoding": "identity"},
+    )
+    response = await test_client.get(
+        f"/api/cats/{cat_id}", headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert not plain.headers["etag"].startswith("W/")
+    assert response.headers["etag"] == f"W/{plain.headers['etag']}"
+
+    response = await test_client.get(
+        f"/api/cats/{cat_id}",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": response.headers["etag"],
+        },
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_zstd_streams_do_not_share_state():
+    """Тест: два чередующихся потока zstd разжимаются каждый в свое тело."""
+    zstandard = pytest.importorskip("zstandard")
+    codec = ZstdCodec(level=3)
+    parts = {"first": [b"a" * 100, b"b" * 100], "second": [b"x" * 100, b"y" * 100]}
+    streams = {name: codec.stream() for name in parts}
+    compressed = {name: b"" for name in parts}
+    for index in range(2):
+        for name, stream in streams.items():
+            compressed[name] += stream.compress(parts[name][index])
+            compressed[name] += stream.flush()
+    for name, stream in streams.items():
+        compressed[name] += stream.finish()
+
+    for name, body in compressed.items():
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        assert decompressor.decompress(body) == b"".join(parts[name])
+    assert zstandard.ZstdDecompressor().decompress(
+        codec.compress(b"z" * 100),
+    ) == b"z" * 100
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_streaming_export_is_compressed(test_client, extra_cats, monkeypatch):
+    """Тест сжатия потоковой выгрузки по частям."""
+    monkeypatch.setattr(settings.export, "batch_size", 2)
+    async with test_client.stream(
+        "GET", "/api/cats/export", headers={"Accept-Encoding": "gzip"},
+    ) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_streaming_export_flushes_each_chunk(
+    test_client, extra_cats, monkeypatch,
+):
+    """Тест: первая часть сжатой выгрузки разжимается в первые строки."""
+    monkeypatch.setattr(settings.export, "batch_size", 2)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/cats/export",
+        "raw_path": b"/api/cats/export",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+        "client": ("127.0.0.1", 1),
+        "server": ("test", 80),
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():  # noqa: WPS430
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()  # клиент не отключается
+
+    async def send(message):  # noqa: WPS430
+        messages.append(message)
+
+    await app(scope, receive, send)
+
+    bodies = [
+        message["body"] for message in messages
+        if message["type"] == "http.response.body" and message.get("body")
+    ]
+    assert len(bodies) > 1
+    first_part = zlib.decompressobj(zlib.MAX_WBITS | 16).decompress(bodies[0])
+    lines = first_part.decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2]
+
+
+@pytest.mark.api
+async def test_event_stream_headers_are_not_delayed():
+    """Тест: заголовки SSE отправляются до первого события."""
+    released = asyncio.Event()
+    stream_app = FastAPI()
+
+    @stream_app.get("/events")
+    async def events():  # noqa: WPS430
+        async def stream():  # noqa: WPS430
+            await released.wait()
+            yield b"data: 1\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    stream_app.add_middleware(
+        CompressionMiddleware, config=CompressionConfig(minimum_size=1),
+    )
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/events",
+        "raw_path": b"/events",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+        "client": ("127.0.0.1", 1),
+        "server": ("test", 80),
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():  # noqa: WPS430
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()  # клиент не отключается
+
+    async def send(message):  # noqa: WPS430
+        messages.append(message)
+
+    serving = asyncio.create_task(stream_app(scope, receive, send))
+    await asyncio.sleep(0.05)
+    assert [message["type"] for message in messages] == ["http.response.start"]
+
+    released.set()
+    await serving
+    assert messages[1]["body"] == b"data: 1\n\n"
@@ -0,0 +1,69 @@
+import pytest
+from fastapi import status
+
+from src.app.api.etag import etag_matches
+from src.app.models import Breed
+
+
+def test_etag_matches():
+    """Тест разбора заголовка If-None-Match."""
+    assert etag_matches('"1-1"', '"1-1"')
+    assert etag_matches('"0-0", W/"1-1"', '"1-1"')
+    assert etag_matches("*", '"1-1"')
+    assert not etag_matches(None, '"1-1"')
+    assert not etag_matches('"1-2"', '"1-1"')
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_cat_not_modified(test_client, cat_id, update_cat_payload):
+    """Тест 304 для неизмененной кошки и нового ETag после PATCH."""
+    response = await test_client.get(f"/api/cats/{cat_id}")
+    etag = response.headers["ETag"]
+
+    response = await test_client.get(
+        f"/api/cats/{cat_id}", headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    await test_client.patch(f"/api/cats/{cat_id}", json=update_cat_payload)
+
+    response = await test_client.get(
+        f"/api/cats/{cat_id}", headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["color"] == update_cat_payload["color"]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_missing_cat_has_no_etag(test_client):
+    """Тест 404 без ETag для отсутствующей кошки."""
+    response = await test_client.get("/api/cats/100", headers={"If-None-Match": "*"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_breeds_not_modified(test_client, db_session):
+    """Тест 304 для неизмененного справочника пород."""
+    response = await test_client.get("/api/cats/breeds")
+    etag = response.headers["ETag"]
+
+    response = await test_client.get(
+        "/api/cats/breeds", headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    db_session.add(Breed(name="Сфинкс"))
+    await db_session.commit()
+
+    response = await test_client.get(
+        "/api/cats/breeds", headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["breeds"]) == 2
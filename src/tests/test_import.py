@@ -0,0 +1,124 @@
+import json
+
+import pytest
+from fastapi import status
+
+from src.app import importer
+from src.app.schemas import schemas
+from src.app.service.cat_changes import read_changes
+from src.app.service.cat_import import parse_csv
+from src.app.service.cat_stats import get_breed_stats, rebuild_stats
+
+CSV_BODY = (
+    'color,age_in_months,description,breed_id\r\n'
+    'Белый,12,"Пушистый, ""снежок""\nс переносом",1\r\n'
+    'Серый,7,,1\r\n'
+    'Черный,много,,1\r\n'
+    'Рыжий,3,,100\r\n'
+    'Синий,5\r\n'
+).encode()
+
+
+async def chunked(body: bytes, size: int = 7):
+    """Тело частями, разрезающими строки и многобайтные символы."""
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+async def test_parse_csv_chunks():
+    """Тест разбора CSV, разрезанного посреди строк и символов UTF-8."""
+    rows = [row async for row in parse_csv(chunked(CSV_BODY))]
+
+    assert rows[0] == (2, {
+        "color": "Белый",
+        "age_in_months": "12",
+        "description": 'Пушистый, "снежок"\nс переносом',
+        "breed_id": "1",
+    })
+    assert rows[1][1]["description"] is None
+    assert rows[4] == (7, "Число полей не совпадает с заголовком.")
+
+
+@pytest.fixture(scope="function")
+async def stats_baseline(db_session, setup_database):
+    """Сводка по кошкам, созданным в обход CatService."""
+    await rebuild_stats(db_session)
+    await db_session.commit()
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_import_csv(test_client, db_session_factory, stats_baseline):
+    """Тест импорта CSV: кавычки, перенос в поле и отклоненные строки."""
+    response = await test_client.post(
+        "/api/cats/import", params={"format": "csv"}, content=CSV_BODY,
+    )
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response_json["status"] == schemas.Status.error.value
+    assert response_json["imported"] == 2
+    assert response_json["rejected_count"] == 3
+    assert [row["line"] for row in response_json["rejected"]] == [5, 7, 6]
+    assert response_json["rejected"][2]["detail"] == "Порода не найдена."
+
+    response = await test_client.get("/api/cats/2")
+    assert response.json()["description"] == 'Пушистый, "снежок"\nс переносом'
+    response = await test_client.get("/api/cats/3")
+    assert response.json()["description"] is None
+
+    async with db_session_factory() as session:
+        stats = await get_breed_stats(session)
+        await rebuild_stats(session)
+        assert await get_breed_stats(session) == stats
+        await session.rollback()
+        changes = await read_changes(session, (0, 0), limit=10)
+    assert [(change.cat_id, change.operation) for change in changes] == [
+        (2, "created"), (3, "created"),
+    ]
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_import_ndjson_batches(test_client, create_cat_payload, monkeypatch):
+    """Тест импорта NDJSON несколькими пакетами и сброса кэша списка."""
+    monkeypatch.setattr(importer.settings.bulk, "import_batch_size", 2)
+    assert len((await test_client.get("/api/cats")).json()["cats"]) == 1
+    lines = [
+        json.dumps({**create_cat_payload, "age_in_months": age})
+        for age in range(5)
+    ]
+    lines[1] = "[1, 2]"
+    lines[3] = "{"
+    body = "\n".join(["", *lines, ""]).encode()
+
+    response = await test_client.post("/api/cats/import", content=body)
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response_json["imported"] == 3
+    assert response_json["rejected"] == [
+        {"line": 3, "detail": "Ожидается JSON-объект."},
+        {"line": 5, "detail": "Некорректный JSON."},
+    ]
+    response = await test_client.get("/api/cats")
+    assert [cat["age_in_months"] for cat in response.json()["cats"][1:]] == [
+        0, 2, 4,
+    ]
+
+
+@pytest.mark.integration
+async def test_importer_cli(tmp_path, db_session_factory, create_cat_payload):
+    """Тест CLI-импорта файла с определением формата по расширению."""
+    path = tmp_path / "cats.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(create_cat_payload) for _ in range(3)),
+    )
+    args = importer.parse_args([str(path), "--batch-size", "2"])
+
+    report = await importer.run_import(args, db_session_factory)
+
+    assert report.status == schemas.Status.success
+    assert report.imported == 3
+    with pytest.raises(ValueError):
+        importer.import_format(tmp_path / "cats.txt")
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from src.app.models import Breed, Cat
+from src.app.service.cat_query import (
+    build_cat_search_statement,
+    build_cat_sync_statement,
+)
+
+BREEDS = 5000
+CATS = 100000
+
+
+@pytest.fixture(scope="function")
+async def large_dataset(db_session, setup_database):
+    """Большой набор пород и кошек с собранной статистикой планировщика."""
+    await db_session.execute(text(
+        "INSERT INTO breed (name) "
+        "SELECT 'Порода ' || n FROM generate_series(1, :breeds) AS n",
+    ), {"breeds": BREEDS})
+    await db_session.execute(text(
+        "INSERT INTO cat (breed_id, color, age_in_months, description) "
+        "SELECT 2 + n % :breeds, 'серый', n % 200, "
+        "(ARRAY['Молодая черная кошка', 'Британская короткошерстная кошка'])"
+        "[1 + n % 2] "
+        "FROM generate_series(1, :cats) AS n",
+    ), {"breeds": BREEDS, "cats": CATS})
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE breed"))
+    await db_session.execute(text("ANALYZE cat"))
+
+
+async def explain(session, stmt):
+    """Текстовый план запроса с подставленными параметрами."""
+    compiled = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True},
+    )
+    result_db = await session.execute(text(f"EXPLAIN {compiled}"))
+    return "\n".join(result_db.scalars().all())
+
+
+@pytest.mark.integration
+async def test_breed_filter_page_uses_index(db_session, large_dataset):
+    """Тест страницы кошек породы по индексу (breed_id, id)."""
+    stmt = select(Cat).where(Cat.breed_id == 42).order_by(Cat.id).limit(101)
+    plan = await explain(db_session, stmt)
+
+    assert "ix_cat_breed_id_id" in plan
+    assert "Seq Scan on cat" not in plan
+
+
+@pytest.mark.integration
+async def test_breed_name_join_uses_indexes(db_session, large_dataset):
+    """Тест фильтра по названию породы через уникальный индекс."""
+    stmt = select(Cat).join(Breed).where(Breed.name == "Порода 42")
+    plan = await explain(db_session, stmt)
+
+    assert "ix_breed_name" in plan
+    assert "ix_cat_breed_id_id" in plan
+    assert "Seq Scan" not in plan
+
+
+@pytest.mark.integration
+async def test_description_search_uses_gin_index(db_session, large_dataset):
+    """Тест полнотекстового поиска по GIN-индексу ix_cat_search_vector."""
+    stmt = build_cat_search_statement("персидская", limit=100)
+    plan = await explain(db_session, stmt)
+
+    assert "ix_cat_search_vector" in plan
+    assert "Seq Scan on cat" not in plan
+
+
+@pytest.mark.integration
+async def test_sync_page_uses_updated_at_index(db_session, large_dataset):
+    """Тест выборки изменений по индексу (updated_at, id), а не всей таблицы."""
+    updated_since = datetime.now(timezone.utc)
+    stmt = build_cat_sync_statement(
+        updated_since, updated_since + timedelta(minutes=1), limit=100,
+    )
+    plan = await explain(db_session, stmt)
+
+    assert "ix_cat_updated_at_id" in plan
+    assert "Seq Scan on cat" not in plan
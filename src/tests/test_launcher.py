@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from src.app import launcher
+from src.app.core.settings import CacheConfig, PoolConfig, ServerConfig, settings
+
+
+def test_worker_count_defaults_to_cpus():
+    """Тест числа воркеров по CPU и из настроек."""
+    assert launcher.worker_count(ServerConfig(), cpus=8) == 8
+    assert launcher.worker_count(ServerConfig(workers=3), cpus=8) == 3
+
+
+def test_worker_pool_fits_max_connections():
+    """Тест урезания пула воркера под max_connections."""
+    server = ServerConfig(db_max_connections=100, db_reserved_connections=10)
+    pool = PoolConfig(size=20, max_overflow=20)
+
+    worker_pool = launcher.worker_pool(pool, server, workers=8)
+    assert (worker_pool.size, worker_pool.max_overflow) == (10, 0)
+
+    worker_pool = launcher.worker_pool(pool, server, workers=2)
+    assert (worker_pool.size, worker_pool.max_overflow) == (20, 20)
+
+    worker_pool = launcher.worker_pool(pool, server, workers=45)
+    assert (worker_pool.size, worker_pool.max_overflow) == (1, 0)
+    with pytest.raises(ValueError):
+        launcher.worker_pool(pool, server, workers=46)
+
+
+def test_worker_pool_reserves_listen_connection():
+    """Тест: пулы и соединения LISTEN всех воркеров не превышают лимит."""
+    server = ServerConfig(db_max_connections=100, db_reserved_connections=10)
+    pool = PoolConfig(size=20, max_overflow=20)
+
+    for workers in (1, 3, 7, 8, 30, 45):
+        worker_pool = launcher.worker_pool(pool, server, workers)
+        per_worker = (
+            worker_pool.size
+            + worker_pool.max_overflow
+            + launcher.WORKER_EXTRA_CONNECTIONS
+        )
+        assert workers * per_worker <= 90
+
+
+def test_uvicorn_options():
+    """Тест production-параметров uvicorn из настроек."""
+    options = launcher.uvicorn_options(
+        ServerConfig(keep_alive=15, limit_concurrency=500), workers=4,
+    )
+
+    assert options["workers"] == 4
+    assert options["timeout_keep_alive"] == 15
+    assert options["limit_concurrency"] == 500
+    assert options["loop"] in {"uvloop", "asyncio"}
+    assert options["http"] in {"httptools", "h11"}
+
+
+def test_dry_run(monkeypatch, capsys):
+    """Тест расчета конфигурации без запуска сервера."""
+    monkeypatch.setenv(launcher.CACHE_BROADCAST_ENV, "false")
+    monkeypatch.setattr(settings.cache, "response_broadcast", False)
+    assert launcher.main(["--workers", "4", "--dry-run"]) == 0
+    assert "workers=4" in capsys.readouterr().out
+
+
+def test_cache_broadcast_for_many_workers(monkeypatch, capsys):
+    """Тест: при нескольких воркерах in-memory кэш рассылает инвалидации."""
+    assert launcher.needs_cache_broadcast(CacheConfig(), workers=2)
+    assert not launcher.needs_cache_broadcast(CacheConfig(), workers=1)
+    assert not launcher.needs_cache_broadcast(
+        CacheConfig(response_backend="redis"), workers=2,
+    )
+
+    monkeypatch.setenv(launcher.CACHE_BROADCAST_ENV, "false")
+    monkeypatch.setattr(settings.cache, "response_broadcast", False)
+    monkeypatch.setattr(settings.cache, "response_backend", "memory")
+    assert launcher.main(["--workers", "4", "--dry-run"]) == 0
+    assert "cache_broadcast=True" in capsys.readouterr().out
+    assert os.environ[launcher.CACHE_BROADCAST_ENV] == "true"
@@ -0,0 +1,103 @@
+import asyncio
+import os
+import signal
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import status
+
+from src.app.core.lifecycle import AppLifecycle, lifecycle
+from src.app.main import app
+from src.app.models.db_helper import engine
+from src.app.service.cat_changes import change_notifier
+from src.app.service.warmup import warm_up
+
+
+@pytest.mark.integration
+async def test_warm_up_prepares_pool_connections(db_engine, db_session_factory):
+    """Тест прогрева: соединения открыты, горячие запросы подготовлены."""
+    warmed = await warm_up(db_engine, db_session_factory, connections=3)
+
+    assert warmed == 3
+    assert db_engine.pool.checkedin() == 3
+    connections = [db_engine.connect() for _ in range(warmed)]
+    await asyncio.gather(*(connection.start() for connection in connections))
+    for connection in connections:
+        raw_connection = await connection.get_raw_connection()
+        prepared = raw_connection.dbapi_connection._prepared_statement_cache
+        assert any("FROM breed_stats" in sql for sql in prepared)
+        await connection.close()
+
+
+@pytest.mark.integration
+async def test_lifespan_ready_only_between_warmup_and_shutdown():
+    """Тест флага готовности и закрытия пула при остановке."""
+    assert not lifecycle.ready
+    async with app.router.lifespan_context(app):
+        assert lifecycle.ready
+        assert engine.pool.checkedin() > 0
+    assert not lifecycle.ready
+    assert engine.pool.checkedin() == 0
+
+
+@pytest.mark.integration
+async def test_sigterm_closes_open_feed(monkeypatch):
+    """Тест: uvicorn с открытой лентой останавливается по SIGTERM сразу."""
+    monkeypatch.setattr(change_notifier, "closed", False)
+    monkeypatch.setattr(lifecycle, "ready", False)
+    server = uvicorn.Server(uvicorn.Config(
+        app, host="127.0.0.1", port=0, log_level="warning",
+        timeout_graceful_shutdown=None,
+    ))
+    # uvicorn повторяет пойманный сигнал после остановки: не для pytest.
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    serving = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            await asyncio.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=None,
+        ) as client:
+            feed = asyncio.create_task(client.get("/api/cats/changes"))
+            while not lifecycle.in_flight:
+                await asyncio.sleep(0.01)
+            assert lifecycle.ready
+            os.kill(os.getpid(), signal.SIGTERM)
+            response = await asyncio.wait_for(feed, timeout=5)
+        assert response.status_code == status.HTTP_200_OK
+        await asyncio.wait_for(serving, timeout=5)
+        assert not lifecycle.ready
+    finally:
+        server.force_exit = True
+        serving.cancel()
+        signal.signal(signal.SIGTERM, previous)
+
+
+async def test_drain_waits_for_in_flight_requests():
+    """Тест ожидания in-flight запросов и выхода по таймауту."""
+    app_lifecycle = AppLifecycle()
+    app_lifecycle.in_flight = 1
+    assert not await app_lifecycle.drain(timeout=0.05, interval=0.01)
+
+    async def finish_request():  # noqa: WPS430
+        await asyncio.sleep(0.02)
+        app_lifecycle.in_flight -= 1
+
+    finishing = asyncio.create_task(finish_request())
+    assert await app_lifecycle.drain(timeout=1, interval=0.01)
+    await finishing
+
+
+@pytest.mark.api
+async def test_ready_endpoint(test_client, monkeypatch):
+    """Тест /ready: 503 до прогрева, 200 после."""
+    response = await test_client.get("/ready")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {"ready": False}
+
+    monkeypatch.setattr(lifecycle, "ready", True)
+    response = await test_client.get("/ready")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"ready": True}
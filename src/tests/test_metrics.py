@@ -0,0 +1,68 @@
+import pytest
+from fastapi import status
+
+from src.app.core.metrics import Counter, Gauge, Histogram, instrument_engine
+from src.app.core.settings import settings
+
+
+def test_histogram_render_is_cumulative():
+    """Тест кумулятивных корзин, суммы и количества гистограммы."""
+    histogram = Histogram('latency', 'Задержка.', labels=('route',), buckets=(1, 2))
+    histogram.observe('/cats', value=0.5)
+    histogram.observe('/cats', value=1.5)
+    histogram.observe('/cats', value=3)
+
+    assert histogram.render() == [
+        '# HELP latency Задержка.',
+        '# TYPE latency histogram',
+        'latency_bucket{route="/cats",le="1"} 1',
+        'latency_bucket{route="/cats",le="2"} 2',
+        'latency_bucket{route="/cats",le="+Inf"} 3',
+        'latency_sum{route="/cats"} 5.0',
+        'latency_count{route="/cats"} 3',
+    ]
+
+
+def test_gauge_is_not_a_counter():
+    """Тест: gauge рендерится своим типом и убывает, но не счетчик."""
+    gauge = Gauge('in_flight', 'В обработке.')
+    gauge.set(value=5)
+    gauge.inc(amount=2)
+    gauge.dec(amount=4)
+
+    assert not isinstance(gauge, Counter)
+    assert gauge.render() == [
+        '# HELP in_flight В обработке.',
+        '# TYPE in_flight gauge',
+        'in_flight 3',
+    ]
+
+
+def _sample(body: str, sample: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(f"{sample} "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+@pytest.mark.api
+async def test_metrics_endpoint(test_client, db_engine):
+    """Тест метрик по шаблону маршрута и числа SQL-запросов."""
+    instrument_engine(db_engine)
+    route = f"{settings.url.prefix}/cats/{{cat_id}}"
+    labels = f'method="GET",route="{route}"'
+    zero_queries = f'http_request_db_queries_bucket{{{labels},le="0"}}'
+    count = f"http_request_duration_seconds_count{{{labels}}}"
+    before = (await test_client.get("/metrics")).text
+
+    response = await test_client.get(f"{settings.url.prefix}/cats/1")
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await test_client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert f'http_requests_total{{{labels},status="200"}}' in body
+    assert _sample(body, count) == _sample(before, count) + 1
+    assert _sample(body, zero_queries) == _sample(before, zero_queries)
+    assert 'db_pool_checked_out{pool="primary"}' in body
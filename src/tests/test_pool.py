@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.app.core.settings import settings
+from src.app.models.db_helper import engine_options, pool_stats
+
+
+@pytest.fixture(scope="function")
+async def tuned_engine():
+    """Движок с урезанным пулом и statement_timeout."""
+    psql = settings.psql.model_copy(
+        update={
+            "pool": settings.psql.pool.model_copy(
+                update={"size": 2, "max_overflow": 1, "statement_timeout_ms": 1500},
+            ),
+        },
+    )
+    engine = create_async_engine(psql.url, **engine_options(psql))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.integration
+async def test_engine_applies_pool_settings(tuned_engine):
+    """Тест применения настроек пула и statement_timeout."""
+    async with tuned_engine.connect() as conn:
+        timeout = await conn.scalar(text("SHOW statement_timeout"))
+    assert timeout == "1500ms"
+    assert tuned_engine.pool.size() == 2
+
+
+@pytest.mark.integration
+async def test_pool_stats_under_load(tuned_engine):
+    """Тест учета выдач, overflow и ожидания соединений."""
+
+    async def query():  # noqa: WPS430
+        async with tuned_engine.connect() as conn:
+            await conn.execute(text("SELECT pg_sleep(0.05)"))
+
+    await asyncio.gather(*(query() for _ in range(6)))
+    stats = pool_stats(tuned_engine)
+
+    assert stats["checkouts"] == 6
+    assert stats["checked_out"] == 0
+    assert stats["checked_in"] == 2
+    assert stats["wait_max_seconds"] >= 0.04
+    assert stats["wait_avg_seconds"] <= stats["wait_max_seconds"]
+
+
+@pytest.mark.api
+async def test_pool_stats_endpoint(test_client):
+    """Тест эндпоинта состояния пула."""
+    response = await test_client.get("/api/pool/stats")
+    response_json = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response_json["primary"]["size"] == settings.psql.pool.size
+    assert "wait_avg_seconds" in response_json["primary"]
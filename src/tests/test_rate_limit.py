@@ -0,0 +1,99 @@
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+
+from src.app.core.client import API_KEY_HEADER
+from src.app.core.rate_limit import InMemoryTokenBuckets, RateLimitMiddleware
+from src.app.core.settings import RateLimitConfig
+
+
+class FakeClock:
+    """Управляемые часы для ведер токенов."""
+
+    def __init__(self):
+        self.now = 0.0  # noqa: WPS358
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(scope="function")
+def limited_client():
+    """Клиент приложения с лимитом 2 запроса и 1 запрос в секунду."""
+    limited_app = FastAPI()
+
+    @limited_app.get("/api/ping")
+    async def ping():  # noqa: WPS430
+        return {"pong": True}
+
+    @limited_app.get("/ready")
+    async def ready():  # noqa: WPS430
+        return {"ready": True}
+
+    limited_app.add_middleware(
+        RateLimitMiddleware,
+        config=RateLimitConfig(
+            enabled=True, rate=1, burst=2, api_keys=frozenset({"known"}),
+        ),
+        backend=InMemoryTokenBuckets(),
+        path_prefix="/api",
+    )
+    return AsyncClient(app=limited_app, base_url="http://test")
+
+
+async def test_token_bucket_refills_over_time():
+    """Тест списания, ожидания до пополнения и вытеснения ведер."""
+    clock = FakeClock()
+    buckets = InMemoryTokenBuckets(max_keys=2, clock=clock)
+
+    assert await buckets.take("a", rate=2, burst=2) == 0
+    assert await buckets.take("a", rate=2, burst=2) == 0
+    assert await buckets.take("a", rate=2, burst=2) == 0.5
+    clock.now = 0.25
+    assert await buckets.take("a", rate=2, burst=2) == 0.25
+    clock.now = 10
+    assert await buckets.take("a", rate=2, burst=2) == 0
+    assert await buckets.take("a", rate=2, burst=2) == 0
+    assert await buckets.take("a", rate=2, burst=2) > 0
+
+    await buckets.take("b", rate=2, burst=2)
+    await buckets.take("c", rate=2, burst=2)
+    assert await buckets.take("a", rate=2, burst=2) == 0
+
+
+@pytest.mark.api
+async def test_rate_limit_middleware(limited_client):
+    """Тест 429 с Retry-After по клиенту; пробы не ограничиваются."""
+    async with limited_client:
+        for _ in range(2):
+            response = await limited_client.get("/api/ping")
+            assert response.status_code == status.HTTP_200_OK
+        response = await limited_client.get("/api/ping")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["detail"]
+
+        response = await limited_client.get(
+            "/api/ping", headers={API_KEY_HEADER: "known"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        for _ in range(3):
+            response = await limited_client.get("/ready")
+            assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.api
+async def test_rate_limit_ignores_unknown_api_keys(limited_client):
+    """Тест: смена неизвестного API-ключа не обходит лимит по IP."""
+    async with limited_client:
+        statuses = [
+            (await limited_client.get(
+                "/api/ping", headers={API_KEY_HEADER: f"made-up-{index}"},
+            )).status_code
+            for index in range(3)
+        ]
+    assert statuses == [
+        status.HTTP_200_OK,
+        status.HTTP_200_OK,
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    ]
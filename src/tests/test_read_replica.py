@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from fastapi import Request, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.app.core.settings import settings
+from src.app.models import db_helper
+
+
+def make_request(method, client="10.0.0.1", headers=()):
+    """Запрос с заданным методом и адресом клиента."""
+    return Request({
+        "type": "http",
+        "method": method,
+        "path": "/api/cats",
+        "headers": [
+            (name.lower().encode(), header.encode()) for name, header in headers
+        ],
+        "client": (client, 5000),
+    })
+
+
+@pytest.fixture(scope="function")
+async def session_router(monkeypatch):
+    """Маршрутизатор с primary и репликой на одной локальной БД."""
+    primary_engine = create_async_engine(settings.psql.url)
+    replica_engine = create_async_engine(settings.psql.url)
+    router = db_helper.SessionRouter(
+        primary=db_helper.make_session_factory(primary_engine),
+        replica=db_helper.make_session_factory(replica_engine),
+        read_your_writes_seconds=60,
+    )
+    monkeypatch.setattr(db_helper, "session_router", router)
+    yield router
+    await primary_engine.dispose()
+    await replica_engine.dispose()
+
+
+def test_reads_go_to_replica(session_router):
+    """Тест маршрутизации чтений на реплику, а записей на primary."""
+    assert session_router.route(make_request("GET")) is session_router.replica
+    assert session_router.route(make_request("PATCH")) is session_router.primary
+
+
+def test_read_your_writes(session_router):
+    """Тест чтения с primary в окне после записи этого же клиента."""
+    session_router.route(make_request("POST"))
+
+    assert session_router.route(make_request("GET")) is session_router.primary
+    other_client = make_request("GET", client="10.0.0.2")
+    assert session_router.route(other_client) is session_router.replica
+
+    session_router.read_your_writes_seconds = 0
+    assert session_router.route(make_request("GET")) is session_router.replica
+
+
+def test_api_key_identifies_client(session_router):
+    """Тест идентификации клиента по API-ключу, а не по адресу."""
+    headers = [("X-API-Key", "sync-job")]
+    session_router.route(make_request("DELETE", client="10.0.0.1", headers=headers))
+
+    moved_client = make_request("GET", client="10.0.0.9", headers=headers)
+    assert session_router.route(moved_client) is session_router.primary
+
+
+def test_without_replica_reads_use_primary():
+    """Тест работы без реплики."""
+    router = db_helper.SessionRouter(
+        primary=db_helper.session_factory,
+        replica=None,
+        read_your_writes_seconds=5,
+    )
+    assert router.route(make_request("GET")) is router.primary
+
+
+@pytest.mark.integration
+async def test_get_db_uses_routed_pool(session_router):
+    """Тест выдачи сессии из пула, выбранного маршрутизатором."""
+    dependency = db_helper.get_db(make_request("GET"))
+    session = await anext(dependency)
+    assert session.bind is session_router.replica.kw["bind"]
+    assert await session.scalar(text("SELECT 1")) == 1
+    await dependency.aclose()
+
+
+@pytest.mark.integration
+async def test_session_factory_remembers_finished_write(session_router):
+    """Тест: долгий импорт открывает окно read-your-writes по завершении."""
+    session_router.read_your_writes_seconds = 0.05
+    dependency = db_helper.get_session_factory(make_request("POST"))
+    assert await anext(dependency) is session_router.primary
+    await asyncio.sleep(0.1)
+    assert session_router.route(make_request("GET")) is session_router.replica
+
+    await dependency.aclose()
+    assert session_router.route(make_request("GET")) is session_router.primary
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_writer_bypasses_response_cache(session_router, test_client):
+    """Тест: в окне read-your-writes клиент читает мимо кэша ответов."""
+    url = "/api/cats"
+    other_client = {"X-API-Key": "other-client"}
+    for expected in ("MISS", "HIT"):
+        response = await test_client.get(url, headers=other_client)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Cache"] == expected
+
+    session_router.route(make_request("PATCH", client="127.0.0.1"))
+    for _ in range(2):
+        response = await test_client.get(url)
+        assert response.headers["X-Cache"] == "MISS"
+    response = await test_client.get(url, headers=other_client)
+    assert response.headers["X-Cache"] == "HIT"
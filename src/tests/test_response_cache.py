@@ -0,0 +1,232 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import status
+
+from src.app.cache.backends import InMemoryLRUBackend, NullBackend
+from src.app.cache.broadcast import (
+    MAX_PAYLOAD_BYTES,
+    PgInvalidationBroadcast,
+    tag_payloads,
+)
+from src.app.cache.response_cache import ResponseCache
+from src.app.core.settings import settings
+from src.app.schemas import schemas
+
+
+class FakeRedis:
+    """Локальная замена redis.asyncio.Redis: отдает bytes, как настоящий."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    async def get(self, name):
+        entry = self.values.get(name)
+        if entry is None or entry[1] is not None and entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    async def set(self, name, value, ex=None):  # noqa: WPS125
+        self.values[name] = (value, None if ex is None else time.monotonic() + ex)
+        return True
+
+    async def delete(self, *names):
+        deleted = 0
+        for name in names:
+            deleted += int(self.values.pop(name, None) is not None)
+            deleted += int(self.sets.pop(name, None) is not None)
+        return deleted
+
+    async def sadd(self, name, *values):
+        members = self.sets.setdefault(name, set())
+        added = {value.encode() for value in values} - members
+        members.update(added)
+        return len(added)
+
+    async def smembers(self, name):
+        return set(self.sets.get(name, ()))
+
+    async def expire(self, name, seconds):
+        return name in self.sets or name in self.values
+
+
+def breed_model(breed_id):
+    """Схема ответа для записи в кэш."""
+    return schemas.BreedBase(id=breed_id, name=f"Порода {breed_id}")
+
+
+async def test_lru_backend_evicts_and_prunes_tags():
+    """Тест вытеснения давно неиспользуемых записей и их удаления из тегов."""
+    backend = InMemoryLRUBackend(max_entries=2)
+    await backend.set("a", b"1")
+    await backend.set("b", b"2")
+    await backend.sadd("tag", "b")
+    await backend.get("a")
+    await backend.set("c", b"3")
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == b"1"
+    assert await backend.get("c") == b"3"
+    assert await backend.smembers("tag") == set()
+
+
+async def test_lru_backend_ttl():
+    """Тест истечения записи по TTL."""
+    backend = InMemoryLRUBackend()
+    await backend.set("a", b"1", ex=0)
+    assert await backend.get("a") is None
+
+
+async def test_null_backend_keeps_nothing():
+    """Тест: выключенный кэш отдает ответ, но ничего не хранит."""
+    response_cache = ResponseCache(backend=NullBackend(), ttl=0)
+    key = response_cache.make_key("breed", breed_id=1)
+
+    response = await response_cache.store(key, breed_model(1), tags=["breed:1"])
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert await response_cache.get(key) is None
+    await response_cache.invalidate("breed:1")
+
+
+@pytest.mark.parametrize("backend_factory", [InMemoryLRUBackend, FakeRedis])
+async def test_invalidate_evicts_only_tagged(backend_factory):
+    """Тест инвалидации только записей с затронутыми тегами."""
+    response_cache = ResponseCache(backend=backend_factory(), ttl=60)
+    first_key = response_cache.make_key("breed", breed_id=1)
+    second_key = response_cache.make_key("breed", breed_id=2)
+    await response_cache.store(first_key, breed_model(1), tags=["cat:1", "shared"])
+    await response_cache.store(second_key, breed_model(2), tags=["cat:2", "shared"])
+
+    await response_cache.invalidate("cat:1")
+    assert await response_cache.get(first_key) is None
+    cached = await response_cache.get(second_key)
+    assert cached.body == breed_model(2).model_dump_json().encode()
+
+    await response_cache.invalidate("shared")
+    assert await response_cache.get(second_key) is None
+
+
+def test_make_key_is_stable():
+    """Тест независимости ключа от порядка параметров и None."""
+    response_cache = ResponseCache(backend=InMemoryLRUBackend(), ttl=60)
+    assert response_cache.make_key("cats", limit=10, cursor=None) == (
+        response_cache.make_key("cats", limit=10)
+    )
+    assert response_cache.make_key("cats", a=1, b=2) == (
+        response_cache.make_key("cats", b=2, a=1)
+    )
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_patch_evicts_only_patched_cat(
+    test_client, extra_cats, cat_id, update_cat_payload,
+):
+    """Тест точечной инвалидации кэша ответов при PATCH."""
+    for url in (f"/api/cats/{cat_id}", "/api/cats/2"):
+        response = await test_client.get(url)
+        assert response.headers["X-Cache"] == "MISS"
+        response = await test_client.get(url)
+        assert response.headers["X-Cache"] == "HIT"
+
+    response = await test_client.patch(
+        f"/api/cats/{cat_id}", json=update_cat_payload,
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await test_client.get(f"/api/cats/{cat_id}")
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.json()["color"] == update_cat_payload["color"]
+    response = await test_client.get("/api/cats/2")
+    assert response.headers["X-Cache"] == "HIT"
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_create_evicts_lists(test_client, create_cat_payload, breed_name):
+    """Тест инвалидации списков при создании кошки."""
+    for url in ("/api/cats", f"/api/cats/breeds/{breed_name}"):
+        await test_client.get(url)
+        response = await test_client.get(url)
+        assert response.headers["X-Cache"] == "HIT"
+
+    await test_client.post("/api/cats", json=create_cat_payload)
+
+    for url in ("/api/cats", f"/api/cats/breeds/{breed_name}"):  # noqa: WPS440
+        response = await test_client.get(url)
+        assert response.headers["X-Cache"] == "MISS"
+        assert len(response.json()["cats"]) == 2
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_delete_evicts_cat(test_client, cat_id):
+    """Тест инвалидации кэша ответа удаленной кошки."""
+    await test_client.get(f"/api/cats/{cat_id}")
+    await test_client.delete(f"/api/cats/{cat_id}")
+
+    response = await test_client.get(f"/api/cats/{cat_id}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_tag_payloads_fit_notify_limit():
+    """Тест разбиения тегов на payload-ы NOTIFY."""
+    tags = [f"cat:{cat_id}" for cat_id in range(5000)]
+    payloads = list(tag_payloads(tags))
+
+    assert len(payloads) > 1
+    assert all(len(payload.encode()) <= MAX_PAYLOAD_BYTES for payload in payloads)
+    assert [tag for payload in payloads for tag in payload.split("\n")] == tags
+
+
+@pytest.mark.integration
+async def test_invalidation_reaches_other_worker_cache():
+    """Тест: invalidate в одном воркере удаляет запись и в кэше другого."""
+    caches = [
+        ResponseCache(
+            backend=InMemoryLRUBackend(),
+            ttl=60,
+            broadcast=PgInvalidationBroadcast(settings.psql),
+        )
+        for _ in range(2)
+    ]
+    writer, reader = caches
+    for response_cache in caches:
+        await response_cache.start()
+    key = reader.make_key("cat", cat_id=1)
+    other_key = reader.make_key("cat", cat_id=2)
+    try:
+        for response_cache in caches:
+            await response_cache.store(key, breed_model(1), tags=["cat:1"])
+        await reader.store(other_key, breed_model(2), tags=["cat:2"])
+
+        await writer.invalidate("cat:1")
+        assert await writer.get(key) is None
+        for _ in range(100):
+            if await reader.get(key) is None:
+                break
+            await asyncio.sleep(0.01)
+        assert await reader.get(key) is None
+        assert await reader.get(other_key) is not None
+    finally:
+        for response_cache in caches:
+            await response_cache.close()
+
+
+async def test_cache_without_broadcast_connection_stores_nothing():
+    """Тест: без соединения рассылки запись не кэшируется."""
+    unreachable = settings.psql.model_copy(update={"port": "1"})
+    response_cache = ResponseCache(
+        backend=InMemoryLRUBackend(),
+        ttl=60,
+        broadcast=PgInvalidationBroadcast(unreachable),
+    )
+    key = response_cache.make_key("breed", breed_id=1)
+
+    response = await response_cache.store(key, breed_model(1), tags=["breed:1"])
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert await response_cache.get(key) is None
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from src.app.service.cat import cat_service
+from src.app.service.single_flight import SingleFlight
+
+CALLERS = 10
+
+
+async def test_concurrent_calls_share_one_execution():
+    """Тест выполнения одного вызова на группу одновременных."""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def query():  # noqa: WPS430
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", query) for _ in range(CALLERS)),
+    )
+    assert results == [1] * CALLERS
+    assert single_flight.shared == CALLERS - 1
+
+    assert await single_flight.do("key", query) == 2
+
+
+async def test_error_is_shared():
+    """Тест передачи исключения ведущего вызова ожидающим."""
+    single_flight = SingleFlight()
+
+    async def failing():  # noqa: WPS430
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", failing) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(outcome, ValueError) for outcome in results)
+
+
+async def test_cancelled_leader_hands_over():
+    """Тест повтора вызова ожидающим, если ведущий отменен."""
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def query():  # noqa: WPS430
+        started.set()
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    leader = asyncio.create_task(single_flight.do("key", query))
+    await started.wait()
+    follower = asyncio.create_task(single_flight.do("key", query))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.integration
+async def test_service_reads_are_coalesced(
+    db_session_factory, statement_log, breed_name,
+):
+    """Тест одного SQL-запроса на одновременные одинаковые чтения."""
+
+    async def read():  # noqa: WPS430
+        async with db_session_factory() as session:
+            return await cat_service.get_cats_with_breed(
+                session=session, breed=breed_name, limit=10,
+            )
+
+    async with db_session_factory() as session:
+        await cat_service.breed_cache.get_breeds(session)
+    statement_log.clear()
+    results = await asyncio.gather(*(read() for _ in range(CALLERS)))
+
+    assert all(cats == results[0] for cats in results)
+    assert len([sql for sql in statement_log if "FROM cat" in sql]) == 1
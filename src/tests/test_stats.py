@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from fastapi import status
+
+from src.app.service.cat import cat_service
+from src.app.service.cat_stats import get_breed_stats, rebuild_stats
+from src.app.schemas import schemas
+
+
+@pytest.fixture(scope="function")
+async def stats_baseline(db_session, setup_database):
+    """Сводка, пересчитанная по кошкам, созданным в обход CatService."""
+    await rebuild_stats(db_session)
+    await db_session.commit()
+
+
+async def recomputed_stats(session):
+    """Сводка, пересчитанная с нуля (в откатываемой транзакции)."""
+    await rebuild_stats(session)
+    stats = await get_breed_stats(session)
+    await session.rollback()
+    return stats
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_stats_follow_writes(
+    test_client, stats_baseline, cat_payload, update_cat_payload, cat_id,
+):
+    """Тест инкрементального обновления сводки при записи кошек."""
+    await test_client.post("/api/cats", json={**cat_payload, "breed_id": 1})
+    response = await test_client.get("/api/cats/stats")
+    assert response.status_code == status.HTTP_200_OK
+    breed_stats = response.json()["breeds"][0]
+    assert breed_stats["cat_count"] == 2
+    assert breed_stats["average_age_in_months"] == 10
+    assert breed_stats["colors"] == [
+        {"color": cat_payload["color"], "cat_count": 2},
+    ]
+
+    await test_client.patch(
+        f"/api/cats/{cat_id}", json={**update_cat_payload, "age_in_months": 20},
+    )
+    breed_stats = (await test_client.get("/api/cats/stats")).json()["breeds"][0]
+    assert breed_stats["average_age_in_months"] == 15
+    assert breed_stats["colors"] == [
+        {"color": cat_payload["color"], "cat_count": 1},
+        {"color": update_cat_payload["color"], "cat_count": 1},
+    ]
+
+    await test_client.delete(f"/api/cats/{cat_id}")
+    breed_stats = (await test_client.get("/api/cats/stats")).json()["breeds"][0]
+    assert breed_stats["cat_count"] == 1
+    assert [color["color"] for color in breed_stats["colors"]] == [
+        cat_payload["color"],
+    ]
+
+
+@pytest.mark.integration
+async def test_stats_match_recount_after_concurrent_writes(
+    db_session_factory, extra_cats,
+):
+    """Тест совпадения сводки с пересчетом после конкурентных записей."""
+    cat_ids = [1, *(cat.id for cat in extra_cats)]
+    async with db_session_factory() as session:
+        await rebuild_stats(session)
+        await session.commit()
+
+    async def update(index):  # noqa: WPS430
+        async with db_session_factory() as session:
+            await cat_service.update_cat(
+                session=session,
+                cat_id=cat_ids[index % len(cat_ids)],
+                cat_data=schemas.UpdateCatData(
+                    color=f"окрас {index % 3}", age_in_months=index, breed_id=1,
+                ),
+            )
+
+    await asyncio.gather(*(update(index) for index in range(30)))
+    async with db_session_factory() as session:
+        await cat_service.bulk_create_cats(session=session, cats=[
+            schemas.CreateCatDataModel(color="белый", age_in_months=5, breed_id=1),
+        ] * 3)
+    async with db_session_factory() as session:
+        await cat_service.bulk_update_cats(session=session, cats=[
+            schemas.BulkUpdateCatItem(
+                id=cat_ids[0], color="белый", age_in_months=7, breed_id=1,
+            ),
+        ])
+    async with db_session_factory() as session:
+        await cat_service.bulk_delete_cats(session=session, cat_ids=cat_ids[1:3])
+
+    async with db_session_factory() as session:
+        stats = await get_breed_stats(session)
+        assert stats == await recomputed_stats(session)
+    assert stats[0]["cat_count"] == len(cat_ids) + 3 - 2
@@ -0,0 +1,98 @@
+import pytest
+from fastapi import status
+from sqlalchemy import select
+
+from src.app.core.settings import settings
+from src.app.main import app
+from src.app.models import Cat
+from src.app.service.cat_stats import get_breed_stats, rebuild_stats
+
+EPOCH = "2000-01-01T00:00:00+00:00"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def no_settle(monkeypatch):
+    """Синхронизация без задержки settle_seconds."""
+    monkeypatch.setattr(settings.sync, "settle_seconds", 0)
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_delete_is_soft(test_client, db_session, cat_id, update_cat_payload):
+    """Тест: удаленная кошка остается tombstone-ом и не видна чтениям."""
+    response = await test_client.delete(f"/api/cats/{cat_id}")
+    assert response.status_code == status.HTTP_200_OK
+
+    deleted_at = await db_session.scalar(
+        select(Cat.deleted_at).where(Cat.id == cat_id),
+    )
+    assert deleted_at is not None
+    response = await test_client.get(f"/api/cats/{cat_id}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await test_client.patch(
+        f"/api/cats/{cat_id}", json=update_cat_payload,
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await test_client.delete(f"/api/cats/{cat_id}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    await rebuild_stats(db_session)
+    assert not await get_breed_stats(db_session)
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_updated_since_returns_changes_and_tombstones(
+    test_client, cat_id, create_cat_payload,
+):
+    """Тест синхронизации: только изменения после updated_until."""
+    response = await test_client.get("/api/cats", params={"updated_since": EPOCH})
+    full_sync = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert [cat["id"] for cat in full_sync["cats"]] == [cat_id]
+    assert full_sync["deleted"] == []
+
+    await test_client.post("/api/cats", json=create_cat_payload)
+    await test_client.delete(f"/api/cats/{cat_id}")
+    response = await test_client.get(
+        "/api/cats", params={"updated_since": full_sync["updated_until"]},
+    )
+    delta = response.json()
+
+    assert [cat["id"] for cat in delta["cats"]] == [2]
+    assert [tombstone["id"] for tombstone in delta["deleted"]] == [cat_id]
+    assert delta["next_cursor"] is None
+
+
+@pytest.mark.api
+@pytest.mark.integration
+async def test_updated_since_pagination(test_client, extra_cats):
+    """Тест keyset-страниц синхронизации по (updated_at, id)."""
+    synced_ids = []
+    cursor = None
+    while True:
+        params = {"updated_since": EPOCH, "limit": 2, "fields": "color"}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = (await test_client.get("/api/cats", params=params)).json()
+        assert all(set(cat) == {"id", "color"} for cat in page["cats"])
+        synced_ids.extend(cat["id"] for cat in page["cats"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(synced_ids) == [1, 2, 3, 4, 5]
+    response = await test_client.get(
+        "/api/cats", params={"updated_since": EPOCH, "cursor": "bad"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_list_route_documents_sync_response():
+    """Тест: схема GET /cats описывает и ответ синхронизации."""
+    operation = app.openapi()["paths"]["/api/cats"]["get"]
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    refs = {variant["$ref"].rsplit("/", 1)[-1] for variant in schema["anyOf"]}
+
+    assert "CatSyncResponseModel" in refs
+    assert "CatTombstone" in app.openapi()["components"]["schemas"]
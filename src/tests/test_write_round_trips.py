@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy import select
+
+from src.app.models import Cat
+from src.app.schemas import schemas
+from src.app.service.cat import cat_service
+
+WRITERS = 20
+
+
+async def select_then_update(session, cat_id, cat_data):
+    """Прежняя реализация update_cat: SELECT, setattr и flush."""
+    async with session.begin():
+        result_db = await session.execute(select(Cat).where(Cat.id == cat_id))
+        cat = result_db.scalar_one()
+        for key, value in cat_data.model_dump().items():  # noqa: WPS110
+            setattr(cat, key, value)
+
+
+@pytest.mark.benchmark
+@pytest.mark.integration
+async def test_update_round_trips_under_concurrent_writers(
+    db_session_factory, extra_cats, statement_log, update_cat_payload,
+):
+    """Сравнение числа обращений к БД на запись: 2 против 1 на UPDATE."""
+    cat_data = schemas.UpdateCatData(**update_cat_payload)
+
+    async def legacy_writer(cat_id, color):  # noqa: WPS430
+        async with db_session_factory() as session:
+            await select_then_update(
+                session, cat_id, cat_data.model_copy(update={"color": color}),
+            )
+
+    async def writer(cat_id):  # noqa: WPS430
+        async with db_session_factory() as session:
+            await cat_service.update_cat(
+                session=session, cat_id=cat_id, cat_data=cat_data,
+            )
+
+    # Прежний путь на конкурентной записи в одну строку падает на проверке
+    # версии, поэтому писатели каждого раунда пишут в разные строки.
+    for round_number in range(WRITERS // 5):
+        await asyncio.gather(*(
+            legacy_writer(row_id, f"Цвет {round_number}") for row_id in range(1, 6)
+        ))
+    legacy_statements = len(statement_log)
+
+    statement_log.clear()
+    await asyncio.gather(*(writer(1) for _ in range(WRITERS)))
+
+    assert legacy_statements == 2 * WRITERS
+    assert len(statement_log) == WRITERS
+    async with db_session_factory() as session:
+        cat = await session.get(Cat, 1)
+    assert cat.version == 1 + WRITERS + WRITERS // 5
+
+
+@pytest.mark.integration
+async def test_delete_is_single_statement(db_session_factory, statement_log, cat_id):
+    """Тест мягкого удаления (вместе со сводкой и лентой) одним запросом."""
+    async with db_session_factory() as session:
+        await cat_service.delete_cat(session=session, cat_id=cat_id)
+
+    assert len(statement_log) == 1
+    assert "UPDATE cat SET" in statement_log[0]
+
+
+@pytest.mark.integration
+async def test_update_missing_cat(db_session_factory, update_cat_payload):
+    """Тест 404 по нулевому числу обновленных строк."""
+    cat_data = schemas.UpdateCatData(**update_cat_payload)
+    async with db_session_factory() as session:
+        with pytest.raises(HTTPException) as exc_info:
+            await cat_service.update_cat(session=session, cat_id=100, cat_data=cat_data)
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+        with pytest.raises(HTTPException) as exc_info:
+            await cat_service.delete_cat(session=session, cat_id=100)
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND